@@ -0,0 +1,66 @@
+from array import array
+
+NIL = -1  # индекс "пустой ссылки"
+
+
+class ArrayLinkedList:
+    """Односвязный список в виде структуры массивов (struct-of-arrays).
+
+    Узел - это индекс i: значение в data[i], следующий узел в next[i].
+    Вместо объекта на каждый узел - два плоских массива array по 8 байт
+    на элемент. Освобожденные индексы связываются через next в список
+    свободных ячеек и переиспользуются при вставке.
+    """
+    def __init__(self, typecode='q'):
+        self.data = array(typecode)  # O(1) - значения узлов (typecode 'q' - 64-битные целые)
+        self.next = array('q')  # O(1) - индекс следующего узла или NIL
+        self.head = NIL  # O(1) - индекс первого узла
+        self.free = NIL  # O(1) - голова списка свободных ячеек
+        self.size = 0  # O(1)
+
+    def insert_at_start(self, data):
+        """Вставка в начало списка. Сложность: O(1) амортизированно."""
+        index = self.free
+        if index == NIL:
+            index = len(self.next)  # O(1) - новая ячейка в конце массивов
+            self.data.append(data)  # O(1) амортизированно - рост массива без объектов-узлов
+            self.next.append(self.head)
+        else:
+            self.free = self.next[index]  # O(1) - переиспользуем освобожденную ячейку
+            self.data[index] = data
+            self.next[index] = self.head
+        self.head = index  # O(1) - обновление головы
+        self.size += 1
+
+    def delete_from_start(self):
+        """Удаление из начала списка. Сложность: O(1)."""
+        index = self.head
+        if index == NIL:  # O(1) - проверка на пустоту
+            return None
+        self.head = self.next[index]  # O(1) - перемещение головы
+        self.next[index] = self.free  # O(1) - ячейка уходит в список свободных
+        self.free = index
+        self.size -= 1
+        return self.data[index]
+
+    def traversal(self):
+        """Обход списка. Сложность: O(n)."""
+        data, next_index = self.data, self.next  # O(1) - локальные ссылки в цикле
+        elements = []
+        index = self.head
+        while index != NIL:  # O(n)
+            elements.append(data[index])
+            index = next_index[index]
+        return elements
+
+    def memory_usage(self):
+        """Байт в буферах массивов (без свободного запаса). Сложность: O(1)."""
+        return len(self.data) * self.data.itemsize + len(self.next) * self.next.itemsize
+
+    def __len__(self):
+        """Число узлов. Сложность: O(1)."""
+        return self.size
+
+    def __str__(self):
+        """Строковое представление списка. Сложность: O(n)."""
+        return " -> ".join(map(str, self.traversal()))  # O(n)
\ No newline at end of file
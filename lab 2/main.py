@@ -1,5 +1,5 @@
-from linked_list import LinkedList
-from task_solutions import is_balanced_brackets
+from linked_list import LinkedList, DoublyLinkedList
+from task_solutions import is_balanced_brackets, find_bracket_error, LRUCache
 
 def test_linked_list():
     """Тестирование основных операций связного списка."""
@@ -42,8 +42,39 @@ def test_brackets():
         result = is_balanced_brackets(expr)
         status = "✓" if result == expected else "✗"
         print(f"{status} '{expr}' -> {result} (ожидалось: {expected})")
+    
+    print("\nПозиция первой ошибки (байтовый поток):")
+    for expr in [b"({[}])", b"(()", b"[1, 2]]"]:
+        chunks = [expr[i:i + 2] for i in range(0, len(expr), 2)]
+        print(f"   {expr.decode()!r} -> {find_bracket_error(chunks)}")
+
+def test_doubly_linked_list():
+    """Тестирование двусвязного списка и LRU-кэша."""
+    print("Тестирование двусвязного списка:")
+    print("-" * 30)
+    
+    dll = DoublyLinkedList()
+    nodes = [dll.append(i) for i in range(5)]
+    print(f"   Список: {dll}")
+    dll.move_to_front(nodes[3])
+    print(f"   move_to_front(3): {dll}")
+    dll.remove(nodes[1])
+    print(f"   remove(1): {dll}")
+    dll.insert_after(nodes[0], 10)
+    print(f"   insert_after(0, 10): {dll}")
+    
+    print("\nLRU-кэш емкостью 2:")
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    print(f"   get('a') = {cache.get('a')}")
+    cache.put("c", 3)  # вытесняет "b" - к нему обращались давнее всего
+    print(f"   После put('c'): get('b') = {cache.get('b')}, get('c') = {cache.get('c')}")
+    print()
 
 if __name__ == "__main__":
     test_linked_list()
     print("\n" + "="*50 + "\n")
+    test_doubly_linked_list()
+    print("\n" + "="*50 + "\n")
     test_brackets()
\ No newline at end of file
@@ -1,6 +1,17 @@
+import os
+import json
+import tempfile
+import time
 import timeit
+import tracemalloc
+from collections import deque
+import linked_list
+from array_linked_list import ArrayLinkedList
+from unrolled_linked_list import UnrolledLinkedList
+from task_solutions import find_bracket_error, find_bracket_error_in_file
 
 # Определяем класс LinkedList прямо здесь, чтобы избежать проблем с импортом
+# (узлы без __slots__ - базовая линия для сравнения памяти)
 class Node:
     def __init__(self, data):
         self.data = data
@@ -103,5 +114,136 @@ def main():
     print("Замеры производительности завершены успешно!")
     print("=" * 60)
 
+def measure_node_storage(n=1000000):
+    """Память и время построения списка из n узлов: объекты-узлы против массивов.
+
+    Рассчитано и на n = 10 000 000 (около 1.2 ГБ для узлов с __dict__).
+    """
+    print(f"\nХранение узлов связного списка ({n} элементов):")
+    print(f"   {'Реализация':<34} {'Построение (с)':<16} {'Байт/узел':<10}")
+    variants = [
+        ("Node с __dict__", LinkedList),
+        ("Node с __slots__ (linked_list)", linked_list.LinkedList),
+        ("ArrayLinkedList (array + индексы)", ArrayLinkedList),
+    ]
+    
+    def build(cls):
+        ll = cls()
+        insert = ll.insert_at_start
+        for i in range(n):  # O(n)
+            insert(i)
+        return ll
+    
+    for name, cls in variants:
+        start = time.perf_counter()
+        ll = build(cls)  # время - без tracemalloc, он замедляет выделения
+        build_time = time.perf_counter() - start
+        del ll
+        tracemalloc.start()
+        ll = build(cls)
+        memory = tracemalloc.get_traced_memory()[0]  # узлы и объекты-числа внутри них
+        tracemalloc.stop()
+        del ll
+        print(f"   {name:<34} {build_time:<16.2f} {memory / n:<10.1f}")
+
+def measure_sequences(n=1000000):
+    """Последовательности с операциями на концах: LinkedList, list, deque и UnrolledLinkedList.
+
+    Рассчитано и на n = 10 000 000. list.pop(0) стоит O(n), поэтому
+    удаление из начала list замеряется только для 1000 элементов.
+    """
+    print(f"\nПоследовательности ({n} элементов):")
+    print(f"   {'Структура':<20} {'Добавление (с)':<16} {'Обход (с)':<11} "
+          f"{'[n/2] (мс)':<12} {'Из начала (с)':<15} {'Байт/эл.':<9}")
+    variants = [
+        ("LinkedList", linked_list.LinkedList, "insert_at_start", "delete_from_start"),
+        ("list", list, "append", "pop"),
+        ("deque", deque, "append", "popleft"),
+        ("UnrolledLinkedList", UnrolledLinkedList, "append", "popleft"),
+    ]
+    for name, cls, add_name, remove_name in variants:
+        seq = cls()
+        add = getattr(seq, add_name)
+        start = time.perf_counter()
+        for i in range(n):  # O(n)
+            add(i)
+        add_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        items = seq.traversal() if cls is linked_list.LinkedList else seq  # у LinkedList обход только через копию
+        for _ in items:  # O(n)
+            pass
+        iter_time = time.perf_counter() - start
+        del items
+        
+        if cls is linked_list.LinkedList:
+            index_time = "-"  # доступа по индексу нет: O(n) проход по узлам
+        else:
+            start = time.perf_counter()
+            for _ in range(100):
+                seq[n // 2]  # O(1) у list, O(n / B) у deque и UnrolledLinkedList
+            index_time = f"{(time.perf_counter() - start) * 10:.4f}"
+        
+        remove = getattr(seq, remove_name)
+        if cls is list:
+            count = min(n, 1000)
+            start = time.perf_counter()
+            for _ in range(count):
+                remove(0)  # O(n) - сдвиг всех элементов
+            remove_time = f"{time.perf_counter() - start:.2f}" + (f" ({count})" if count < n else "")
+        else:
+            start = time.perf_counter()
+            for _ in range(n):  # O(n)
+                remove()
+            remove_time = f"{time.perf_counter() - start:.2f}"
+        del seq, add, remove
+        
+        tracemalloc.start()
+        seq = cls()
+        add = getattr(seq, add_name)
+        for i in range(n):
+            add(i)
+        memory = tracemalloc.get_traced_memory()[0]  # вместе с объектами-числами
+        tracemalloc.stop()
+        del seq, add
+        print(f"   {name:<20} {add_time:<16.2f} {iter_time:<11.2f} {index_time:<12} {remove_time:<15} {memory / n:<9.1f}")
+
+def measure_bracket_validation(records=500000):
+    """Проверка скобок в файле JSON-записей: строка целиком против потока блоков."""
+    record = json.dumps({"id": 1, "user": {"name": "alice", "tags": ["a", {"x": [1, 2, 3]}]},
+                         "message": "hello world " * 3})
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    try:
+        with os.fdopen(fd, "w") as file:
+            for _ in range(records):  # O(n)
+                file.write(record + "\n")
+        size = os.path.getsize(path)
+        print(f"\nПроверка скобок в файле ({size / 2 ** 20:.0f} МБ):")
+        print(f"   {'Способ':<34} {'МБ/с':<10} {'Пик памяти (МБ)':<16}")
+        
+        def read_whole():
+            with open(path) as file:
+                return find_bracket_error((file.read(),))  # весь файл в памяти
+        
+        variants = [
+            ("Файл целиком (str)", read_whole),
+            ("Поток блоков по 1 МБ (bytes)", lambda: find_bracket_error_in_file(path)),
+        ]
+        for name, check in variants:
+            start = time.perf_counter()
+            result = check()  # время - без tracemalloc
+            elapsed = time.perf_counter() - start
+            assert result == -1
+            tracemalloc.start()
+            check()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"   {name:<34} {size / 2 ** 20 / elapsed:<10.0f} {peak / 2 ** 20:<16.1f}")
+    finally:
+        os.remove(path)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    measure_node_storage()
+    measure_sequences()
+    measure_bracket_validation()
\ No newline at end of file
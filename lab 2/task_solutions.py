@@ -1,30 +1,123 @@
+import re
+from itertools import islice
+from linked_list import DoublyLinkedList
+
 # Задача: Проверка сбалансированности скобок
 def is_balanced_brackets(expression):
     """
     Проверка сбалансированности скобок с использованием стека.
     Сложность: O(n), где n - длина строки.
     """
-    stack = []  # O(1) - создание стека (списка)
-    
-    # Проходим по каждому символу в выражении
-    for char in expression:  # O(n) - цикл по всем символам
-        if char in "([{":  # O(1) - проверка открывающей скобки
-            stack.append(char)  # O(1) - добавление в стек
-        elif char in ")]}":  # O(1) - проверка закрывающей скобки
-            if not stack:  # O(1) - проверка пустоты стека
-                return False  # O(1) - несбалансированные скобки
-            
-            # Получаем последнюю открывающую скобку
-            last_open = stack.pop()  # O(1) - удаление из стека
-            
-            # Проверяем соответствие скобок
-            if (last_open == '(' and char != ')') or \
-               (last_open == '[' and char != ']') or \
-               (last_open == '{' and char != '}'):  # O(1) - проверка
-                return False  # O(1) - несбалансированные скобки
-    
-    # Если стек пуст, все скобки сбалансированы
-    return len(stack) == 0  # O(1) - проверка пустоты стека
+    return find_bracket_error((expression,)) == -1  # O(n) - потоковая проверка из одного блока
+
+
+# Задача: Потоковая проверка скобок для больших входных данных
+_BRACKETS = re.compile(r"[()\[\]{}]")  # одна скобка (для поиска позиции ошибки)
+_BRACKETS_BYTES = re.compile(rb"[()\[\]{}]")
+_NOT_BRACKETS = re.compile(r"[^()\[\]{}]+")  # отрезки без скобок удаляются целиком
+_NOT_BRACKETS_BYTES = bytes(code for code in range(256) if code not in b"()[]{}")  # таблица для bytes.translate
+_CLOSING = {ord("("): ord(")"), ord("["): ord("]"), ord("{"): ord("}")}  # код открывающей -> код парной закрывающей
+
+
+def _bracket_position(chunk, pattern, ordinal, count):
+    """
+    Позиция скобки с номером ordinal (из count скобок блока).
+    Сложность: O(расстояние до ближайшего края блока).
+    """
+    if ordinal < count // 2:
+        return next(islice(pattern.finditer(chunk), ordinal, None)).start()  # O(позиция) - с начала
+    need = count - ordinal  # скобка need-я с конца: окно у конца блока растет, пока ее не накроет
+    window = 64
+    while True:
+        start = max(0, len(chunk) - window)
+        positions = [match.start() for match in pattern.finditer(chunk, start)]
+        if len(positions) >= need:
+            return positions[-need]
+        window *= 4  # O(1) раз: суммарная работа - O(расстояние от конца)
+
+
+def find_bracket_error(chunks):
+    """
+    Потоковая проверка сбалансированности скобок.
+    chunks - итерируемый набор строк или байтовых блоков (bytes, bytearray).
+    Возвращает позицию первой ошибки от начала потока (лишняя или
+    непарная закрывающая скобка; для незакрытых скобок - самая внешняя
+    из них) или -1, если скобки сбалансированы.
+    Сложность: O(n) по времени, O(глубина вложенности) по памяти.
+    """
+    stack = []  # O(d) - коды ожидаемых закрывающих скобок
+    offset = 0  # позиция начала текущего блока в потоке
+    unclosed = -1  # позиция самой внешней незакрытой скобки
+    for chunk in chunks:  # O(n) по всем блокам
+        if isinstance(chunk, str):
+            pattern = _BRACKETS
+            brackets = _NOT_BRACKETS.sub("", chunk).encode("ascii")  # O(k) - остаются только скобки
+        else:
+            pattern = _BRACKETS_BYTES
+            brackets = chunk.translate(None, _NOT_BRACKETS_BYTES)  # O(k) - удаление остального в C
+        
+        # Позиции не отслеживаются в цикле: их ищем заново только для ошибки
+        # и для скобки, открывшей внешний уровень вложенности
+        bottom = -1
+        for i, code in enumerate(brackets):  # O(число скобок в блоке)
+            closing = _CLOSING.get(code)
+            if closing is not None:
+                if not stack:
+                    bottom = i
+                stack.append(closing)  # O(1)
+            elif not stack or stack.pop() != code:
+                return offset + _bracket_position(chunk, pattern, i, len(brackets))
+        if stack and bottom >= 0:
+            unclosed = offset + _bracket_position(chunk, pattern, bottom, len(brackets))
+        offset += len(chunk)
+    return unclosed if stack else -1
+
+
+def find_bracket_error_in_file(path, chunk_size=1 << 20):
+    """
+    Проверка скобок в файле блоками по chunk_size байт (позиция ошибки - в байтах).
+    Сложность: O(n) по времени, O(chunk_size + глубина) по памяти.
+    """
+    with open(path, "rb") as file:
+        return find_bracket_error(iter(lambda: file.read(chunk_size), b""))
+
+
+# Задача: LRU-кэш (словарь + двусвязный список)
+class LRUCache:
+    """
+    Кэш фиксированной емкости, вытесняющий давнее всего использованный ключ.
+    Сложность get и put: O(1).
+    """
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("Емкость кэша должна быть положительной")
+        self.capacity = capacity  # O(1)
+        self.nodes = {}  # O(1) - ключ -> узел списка с парой (ключ, значение)
+        self.order = DoublyLinkedList()  # O(1) - от недавно использованных к давним
+
+    def get(self, key, default=None):
+        """Значение по ключу; ключ становится самым свежим. Сложность: O(1)."""
+        node = self.nodes.get(key)  # O(1)
+        if node is None:
+            return default
+        self.order.move_to_front(node)  # O(1) - узел из словаря, поиск в списке не нужен
+        return node.data[1]
+
+    def put(self, key, value):
+        """Запись значения с вытеснением самого давнего ключа. Сложность: O(1)."""
+        node = self.nodes.get(key)  # O(1)
+        if node is not None:
+            node.data = (key, value)
+            self.order.move_to_front(node)  # O(1)
+            return
+        if len(self.nodes) >= self.capacity:
+            old_key, _ = self.order.delete_from_end()  # O(1) - хвост списка
+            del self.nodes[old_key]
+        self.nodes[key] = self.order.insert_at_start((key, value))  # O(1)
+
+    def __len__(self):
+        """Число ключей в кэше. Сложность: O(1)."""
+        return len(self.nodes)
 
 
 # Тестирование функции
@@ -48,4 +141,10 @@ if __name__ == "__main__":
         status = "✓" if result == expected else "✗"
         print(f"{status} Выражение: '{expression}'")
         print(f"  Ожидалось: {expected}, Получено: {result}")
-        print()
\ No newline at end of file
+        print()
+    
+    print("Позиция первой ошибки (поток из блоков по 3 символа):")
+    print("-" * 50)
+    for expression in ["{[()]}", "([)]", "(()", "a) b", "[1, {2: (3)}"]:
+        chunks = [expression[i:i + 3] for i in range(0, len(expression), 3)]
+        print(f"  '{expression}' -> {find_bracket_error(chunks)}")
\ No newline at end of file
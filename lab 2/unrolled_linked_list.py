@@ -0,0 +1,151 @@
+class Chunk:
+    """Узел развернутого списка: массив фиксированной емкости и ссылки на соседей."""
+    __slots__ = ("items", "start", "end", "prev", "next")
+
+    def __init__(self, capacity, start):
+        self.items = [None] * capacity  # O(B) - одно выделение на B элементов
+        self.start = start  # O(1) - занятые ячейки: items[start:end]
+        self.end = start
+        self.prev = None
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """Развернутый двусвязный список (deque из узлов-массивов).
+
+    Каждый узел хранит до B элементов подряд, поэтому на элемент приходится
+    одна ссылка в массиве вместо объекта-узла. Крайний узел заполняется от
+    своего края к середине: добавление и удаление с обоих концов - O(1),
+    доступ по индексу - O(n / B) переходов по узлам.
+    """
+    def __init__(self, iterable=(), chunk_size=64):
+        if chunk_size < 1:
+            raise ValueError("Емкость узла должна быть положительной")
+        self.chunk_size = chunk_size  # O(1) - B элементов в узле
+        self.head = self.tail = None  # O(1) - крайние узлы
+        self.size = 0  # O(1)
+        for item in iterable:  # O(n)
+            self.append(item)
+
+    def append(self, item):
+        """Добавление в конец. Сложность: O(1)."""
+        tail = self.tail
+        if tail is None or tail.end == self.chunk_size:
+            chunk = Chunk(self.chunk_size, 0)  # O(B) раз в B вставок - O(1) амортизированно
+            chunk.prev = tail
+            if tail is None:
+                self.head = chunk
+            else:
+                tail.next = chunk
+            self.tail = tail = chunk
+        tail.items[tail.end] = item  # O(1)
+        tail.end += 1
+        self.size += 1
+
+    def appendleft(self, item):
+        """Добавление в начало. Сложность: O(1)."""
+        head = self.head
+        if head is None or head.start == 0:
+            chunk = Chunk(self.chunk_size, self.chunk_size)  # новый узел заполняется справа налево
+            chunk.next = head
+            if head is None:
+                self.tail = chunk
+            else:
+                head.prev = chunk
+            self.head = head = chunk
+        head.start -= 1  # O(1)
+        head.items[head.start] = item
+        self.size += 1
+
+    def pop(self):
+        """Удаление с конца. Сложность: O(1)."""
+        tail = self.tail
+        if tail is None:
+            raise IndexError("pop из пустого списка")
+        tail.end -= 1  # O(1)
+        item = tail.items[tail.end]
+        tail.items[tail.end] = None  # O(1) - не удерживаем ссылку на удаленный элемент
+        self.size -= 1
+        if tail.start == tail.end:
+            self._unlink(tail)  # O(1) - опустевший узел
+        return item
+
+    def popleft(self):
+        """Удаление из начала. Сложность: O(1)."""
+        head = self.head
+        if head is None:
+            raise IndexError("pop из пустого списка")
+        item = head.items[head.start]  # O(1)
+        head.items[head.start] = None
+        head.start += 1
+        self.size -= 1
+        if head.start == head.end:
+            self._unlink(head)  # O(1)
+        return item
+
+    def _unlink(self, chunk):
+        """Исключение пустого узла из цепочки. Сложность: O(1)."""
+        if chunk.prev is None:
+            self.head = chunk.next
+        else:
+            chunk.prev.next = chunk.next
+        if chunk.next is None:
+            self.tail = chunk.prev
+        else:
+            chunk.next.prev = chunk.prev
+
+    def insert_at_start(self, data):
+        """Вставка в начало (как у LinkedList). Сложность: O(1)."""
+        self.appendleft(data)
+
+    def delete_from_start(self):
+        """Удаление из начала (как у LinkedList), None для пустого списка. Сложность: O(1)."""
+        return self.popleft() if self.size else None
+
+    def _locate(self, index):
+        """Узел и позиция в нем для индекса (обход с ближайшего конца). Сложность: O(n / B)."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Индекс вне диапазона")
+        if index < self.size // 2:
+            chunk = self.head
+            while index >= chunk.end - chunk.start:  # O(n / B) - узел пропускается целиком
+                index -= chunk.end - chunk.start
+                chunk = chunk.next
+            return chunk, chunk.start + index
+        index = self.size - 1 - index  # считаем с конца
+        chunk = self.tail
+        while index >= chunk.end - chunk.start:
+            index -= chunk.end - chunk.start
+            chunk = chunk.prev
+        return chunk, chunk.end - 1 - index
+
+    def __getitem__(self, index):
+        """Элемент по индексу. Сложность: O(n / B)."""
+        chunk, position = self._locate(index)
+        return chunk.items[position]
+
+    def __setitem__(self, index, item):
+        """Замена элемента по индексу. Сложность: O(n / B)."""
+        chunk, position = self._locate(index)
+        chunk.items[position] = item
+
+    def __iter__(self):
+        """Ленивый обход без копирования в список. Сложность: O(n)."""
+        chunk = self.head
+        while chunk is not None:  # O(n / B) узлов
+            yield from chunk.items[chunk.start:chunk.end]  # O(B) - срез узла за один вызов
+            chunk = chunk.next
+
+    def traversal(self):
+        """Список элементов (как у LinkedList). Сложность: O(n)."""
+        return list(self)
+
+    def __len__(self):
+        """Число элементов. Сложность: O(1)."""
+        return self.size
+
+    def __str__(self):
+        """Строковое представление списка. Сложность: O(n)."""
+        return " -> ".join(map(str, self))
\ No newline at end of file
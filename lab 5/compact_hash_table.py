@@ -0,0 +1,145 @@
+import sys
+from array import array
+from hash_functions import fnv1a_hash_bytes
+
+FREE = -1     # пустая ячейка индекса
+DUMMY = -2    # ячейка удаленного элемента (tombstone)
+MASK_64 = (1 << 64) - 1
+GOLDEN = 0x9E3779B97F4A7C15  # множитель фибоначчиева хеширования
+
+
+class CompactHashTable:
+    """Компактная хеш-таблица: короткие строковые ключи и целые значения без объектов Python
+    
+    Ключи лежат подряд в одном bytearray, записи (смещение, хеш, значение)
+    хранятся в массивах array, а открытая адресация идет по массиву номеров
+    записей. На элемент не создается ни кортежа, ни строки, ни int.
+    """
+    
+    def __init__(self, size: int = 8, hash_func=fnv1a_hash_bytes):
+        self.hash_func = hash_func  # O(1) - хеш-функция от байтов ключа
+        self.arena = bytearray()  # O(1) - байты всех ключей подряд
+        self.offsets = array('Q', [0])  # O(1) - ключ записи i: arena[offsets[i]:offsets[i + 1]]
+        self.hashes = array('Q')  # O(1) - полные хеши записей: сравнение ключа только при совпадении
+        self.values = array('q')  # O(1) - 64-битные целые значения
+        self.alive = bytearray()  # O(1) - 0 для удаленных записей (место освобождается при перестроении)
+        self.count = 0  # O(1) - число живых элементов
+        capacity = 8
+        while capacity * 2 < size * 3:  # O(log n) - заполнение индекса не больше 2/3
+            capacity *= 2
+        self._build_index(capacity)  # O(n)
+    
+    def _build_index(self, capacity: int) -> None:
+        """Создание индекса заданной емкости по живым записям"""
+        typecode = 'i' if capacity < 1 << 31 else 'q'  # O(1) - 4 байта на ячейку, пока хватает
+        index = array(typecode, [FREE]) * capacity  # O(n)
+        mask = capacity - 1
+        shift = 64 - (capacity.bit_length() - 1)  # O(1) - ячейка берется из старших битов хеша
+        hashes, alive = self.hashes, self.alive
+        for entry in range(len(hashes)):  # O(n) - хеши не пересчитываются
+            if alive[entry]:
+                i = hashes[entry] >> shift
+                while index[i] != FREE:
+                    i = (i + 1) & mask
+                index[i] = entry
+        self.index, self.mask, self.shift = index, mask, shift
+        self.used = self.count  # O(1) - ячейки с записями и tombstone
+        self.max_used = capacity * 2 // 3  # O(1)
+    
+    def _hash(self, data: bytes) -> int:
+        """Вычисление 64-битного хеша с перемешиванием битов"""
+        return (self.hash_func(data) * GOLDEN) & MASK_64  # O(k)
+    
+    @staticmethod
+    def _encode(key) -> bytes:
+        """Байты ключа (строки кодируются в UTF-8)"""
+        return key.encode() if isinstance(key, str) else bytes(key)  # O(k)
+    
+    def _find(self, data: bytes, h: int) -> int:
+        """Ячейка индекса с ключом или -1"""
+        index, hashes, offsets, arena, mask = self.index, self.hashes, self.offsets, self.arena, self.mask
+        i = h >> self.shift
+        while True:  # O(1) в среднем
+            entry = index[i]
+            if entry == FREE:
+                return -1
+            # Байты ключа сравниваются только при совпадении полного хеша
+            if entry >= 0 and hashes[entry] == h and arena[offsets[entry]:offsets[entry + 1]] == data:
+                return i
+            i = (i + 1) & mask
+    
+    def insert(self, key, value: int) -> None:
+        """Вставка пары ключ-значение (значение - 64-битное целое)"""
+        data = self._encode(key)  # O(k)
+        h = self._hash(data)  # O(k)
+        slot = self._find(data, h)  # O(1) в среднем
+        if slot >= 0:
+            self.values[self.index[slot]] = value  # O(1) - обновление
+            return
+        index, mask = self.index, self.mask
+        i = h >> self.shift
+        while index[i] >= 0:  # O(1) в среднем - первая пустая или удаленная ячейка
+            i = (i + 1) & mask
+        if index[i] == FREE:
+            self.used += 1  # O(1)
+        self.values.append(value)  # O(1) амортизированно (TypeError для не целых - до изменений)
+        index[i] = len(self.hashes)  # O(1) - номер новой записи
+        self.arena += data  # O(k) амортизированно
+        self.offsets.append(len(self.arena))  # O(1)
+        self.hashes.append(h)  # O(1)
+        self.alive.append(1)  # O(1)
+        self.count += 1  # O(1)
+        # Перестроение при заполнении индекса или когда удаленные записи занимают больше половины массивов
+        if self.used > self.max_used or len(self.hashes) > 2 * self.count + 8:
+            self._resize()  # O(n), амортизированно O(1)
+    
+    def get(self, key):
+        """Получение значения по ключу"""
+        data = self._encode(key)  # O(k)
+        slot = self._find(data, self._hash(data))  # O(1) в среднем
+        return self.values[self.index[slot]] if slot >= 0 else None
+    
+    def remove(self, key) -> bool:
+        """Удаление пары ключ-значение"""
+        data = self._encode(key)  # O(k)
+        slot = self._find(data, self._hash(data))  # O(1) в среднем
+        if slot < 0:
+            return False
+        self.alive[self.index[slot]] = 0  # O(1) - байты ключа освободятся при перестроении
+        self.index[slot] = DUMMY  # O(1)
+        self.count -= 1  # O(1)
+        return True
+    
+    def _resize(self) -> None:
+        """Перестроение: удаленные записи вычищаются из арены и массивов, индекс растет при необходимости"""
+        if len(self.hashes) > self.count:  # O(n) - уплотнение записей
+            arena, offsets, hashes, values = bytearray(), array('Q', [0]), array('Q'), array('q')
+            old_arena, old_offsets = self.arena, self.offsets
+            for entry in range(len(self.hashes)):
+                if self.alive[entry]:
+                    arena += old_arena[old_offsets[entry]:old_offsets[entry + 1]]
+                    offsets.append(len(arena))
+                    hashes.append(self.hashes[entry])
+                    values.append(self.values[entry])
+            self.arena, self.offsets, self.hashes, self.values = arena, offsets, hashes, values
+            self.alive = bytearray([1]) * self.count
+        capacity = len(self.index)
+        while capacity < self.count * 3:  # O(log n) - после роста индекс заполнен не больше чем на 1/3
+            capacity *= 2
+        self._build_index(capacity)  # O(n)
+    
+    def keys(self):
+        """Ключи таблицы (строки) в порядке вставки"""
+        arena, offsets = self.arena, self.offsets
+        for entry in range(len(self.hashes)):  # O(n)
+            if self.alive[entry]:
+                yield arena[offsets[entry]:offsets[entry + 1]].decode()
+    
+    def memory_usage(self) -> int:
+        """Байты, занимаемые массивами таблицы"""
+        return sum(sys.getsizeof(part) for part in
+                   (self.arena, self.offsets, self.hashes, self.values, self.alive, self.index))  # O(1)
+    
+    def __len__(self) -> int:
+        """Число элементов в таблице"""
+        return self.count  # O(1)
\ No newline at end of file
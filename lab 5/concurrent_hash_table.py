@@ -0,0 +1,114 @@
+import threading
+from hash_functions import fast_polynomial_hash
+
+
+class ConcurrentHashTable:
+    """Потокобезопасная хеш-таблица с методом цепочек и разделением блокировок (lock striping)
+    
+    Ячейка i защищена блокировкой i % stripes. Размер таблицы кратен числу
+    блокировок, поэтому блокировка ключа (хеш % stripes) не меняется при росте.
+    Цепочки - неизменяемые кортежи: запись заменяет кортеж целиком, и чтение
+    без блокировок всегда видит согласованную цепочку (старую или новую).
+    """
+    
+    def __init__(self, size: int = 64, stripes: int = 16, max_load_factor: float = 1.0,
+                 hash_func=fast_polynomial_hash):
+        self.hash_func = hash_func  # O(1)
+        self.max_load_factor = max_load_factor  # O(1)
+        self.locks = [threading.Lock() for _ in range(stripes)]  # O(s) - по блокировке на группу ячеек
+        self.counts = [0] * stripes  # O(s) - число элементов под каждой блокировкой
+        size = max(size, stripes)
+        size += -size % stripes  # O(1) - размер кратен числу блокировок
+        self.table = [()] * size  # O(n) - ссылка на список заменяется только при росте
+    
+    def get(self, key: str, default=None):
+        """Получение значения по ключу без блокировок"""
+        table = self.table  # O(1) - один атомарный снимок ссылки
+        for k, v in table[self.hash_func(key) % len(table)]:  # O(m)
+            if k == key:
+                return v
+        return default
+    
+    def insert(self, key: str, value) -> None:
+        """Вставка пары ключ-значение под блокировкой своей группы ячеек"""
+        h = self.hash_func(key)  # O(k) - вне блокировки
+        stripe = h % len(self.locks)
+        with self.locks[stripe]:
+            table = self.table  # при росте таблица меняется только под всеми блокировками
+            index = h % len(table)
+            bucket = table[index]
+            for i, (k, v) in enumerate(bucket):  # O(m)
+                if k == key:
+                    table[index] = bucket[:i] + ((key, value),) + bucket[i + 1:]  # O(m) - копия цепочки
+                    return
+            table[index] = bucket + ((key, value),)  # O(m)
+            self.counts[stripe] += 1  # O(1)
+            grow = self.counts[stripe] > len(table) // len(self.locks) * self.max_load_factor
+        if grow:
+            self._resize(len(table))  # вне блокировки группы: иначе возможна взаимоблокировка
+    
+    def remove(self, key: str) -> bool:
+        """Удаление пары ключ-значение"""
+        h = self.hash_func(key)  # O(k)
+        stripe = h % len(self.locks)
+        with self.locks[stripe]:
+            table = self.table
+            index = h % len(table)
+            bucket = table[index]
+            for i, (k, v) in enumerate(bucket):  # O(m)
+                if k == key:
+                    table[index] = bucket[:i] + bucket[i + 1:]  # O(m)
+                    self.counts[stripe] -= 1  # O(1)
+                    return True
+        return False
+    
+    def _resize(self, observed_size: int) -> None:
+        """Удвоение таблицы под всеми блокировками (захватываются по порядку)"""
+        for lock in self.locks:  # O(s) - единый порядок захвата исключает взаимоблокировку
+            lock.acquire()
+        try:
+            if len(self.table) != observed_size:
+                return  # таблицу уже увеличил другой поток
+            new_size = observed_size * 2
+            new_table = [()] * new_size  # O(n)
+            for bucket in self.table:  # O(n) - хеши пересчитываются один раз
+                for entry in bucket:
+                    index = self.hash_func(entry[0]) % new_size
+                    new_table[index] = new_table[index] + (entry,)
+            self.table = new_table  # O(1) - публикация: читатели видят старую или новую таблицу
+        finally:
+            for lock in reversed(self.locks):
+                lock.release()
+    
+    def __len__(self) -> int:
+        """Число элементов (без общей блокировки - мгновенный снимок)"""
+        return sum(self.counts)  # O(s)
+
+
+class LockedHashTable:
+    """HashTableChaining под одной общей блокировкой (для сравнения)"""
+    
+    def __init__(self, table):
+        self.table = table  # O(1)
+        self.lock = threading.Lock()  # O(1)
+    
+    def get(self, key: str, default=None):
+        """Получение значения под общей блокировкой"""
+        with self.lock:
+            value = self.table.get(key)  # O(1) в среднем
+        return default if value is None else value
+    
+    def insert(self, key: str, value) -> None:
+        """Вставка под общей блокировкой"""
+        with self.lock:
+            self.table.insert(key, value)  # O(1) в среднем
+    
+    def remove(self, key: str) -> bool:
+        """Удаление под общей блокировкой"""
+        with self.lock:
+            return self.table.remove(key)  # O(1) в среднем
+    
+    def __len__(self) -> int:
+        """Число элементов"""
+        with self.lock:
+            return len(self.table)  # O(1)
\ No newline at end of file
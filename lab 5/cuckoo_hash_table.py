@@ -0,0 +1,125 @@
+import math
+import os
+import random
+from array import array
+from hash_functions import seeded_hash_words
+
+BUCKET_SLOTS = 4  # ячеек в корзине: при 4 ячейках и 2 хешах достижимо заполнение ~95%
+
+
+class CuckooHashTable:
+    """Кукушкина хеш-таблица: у ключа две корзины по 4 ячейки, поиск - не больше 8 сравнений
+    
+    При вставке в полные корзины ключ вытесняет случайного соседа в его
+    альтернативную корзину (и так далее, до max_kicks шагов). Если цепочка
+    вытеснений не закончилась, таблица перестраивается с новым ключом хеша.
+    """
+    
+    def __init__(self, size: int = 8, max_load_factor: float = 0.9, max_kicks: int = 500):
+        self.max_load_factor = max_load_factor  # O(1)
+        self.max_kicks = max_kicks  # O(1) - длина цепочки вытеснений до перестроения
+        self.rng = random.Random()  # O(1) - выбор вытесняемой ячейки
+        # Число корзин не обязано быть степенью двойки: таблицу можно заполнить ровно до max_load_factor
+        self._allocate(max(1, math.ceil(size / (BUCKET_SLOTS * max_load_factor))))  # O(n)
+    
+    def _allocate(self, bucket_count: int) -> None:
+        """Создание пустых корзин и нового ключа хеш-функции"""
+        self.bucket_count = bucket_count  # O(1)
+        self.seed = os.urandom(16)  # O(1) - новый ключ: новые пары корзин для всех ключей
+        slots = bucket_count * BUCKET_SLOTS
+        self.keys = [None] * slots  # O(n)
+        self.values = [None] * slots  # O(n)
+        self.hashes = array('Q', bytes(8 * slots))  # O(n) - оба хеша ключа в одном слове
+        self.count = 0  # O(1)
+    
+    def _hash(self, key: str) -> int:
+        """64-битное слово: младшая половина - первая корзина, старшая - вторая"""
+        return seeded_hash_words(key.encode("utf-8"), self.seed, 1)[0]  # O(k)
+    
+    def _buckets(self, h: int) -> tuple:
+        """Номера двух корзин ключа"""
+        return (h & 0xFFFFFFFF) % self.bucket_count, (h >> 32) % self.bucket_count  # O(1)
+    
+    def _find(self, key: str, h: int) -> int:
+        """Ячейка с ключом или -1 (просматриваются только две корзины)"""
+        keys = self.keys
+        for bucket in self._buckets(h):  # O(1) - худший случай 2 * BUCKET_SLOTS сравнений
+            start = bucket * BUCKET_SLOTS
+            bucket_keys = keys[start:start + BUCKET_SLOTS]  # O(1) - сравнения идут внутри list
+            if key in bucket_keys:
+                return start + bucket_keys.index(key)
+        return -1
+    
+    def get(self, key: str):
+        """Получение значения по ключу"""
+        i = self._find(key, self._hash(key))  # O(1) в худшем случае
+        return self.values[i] if i >= 0 else None
+    
+    def remove(self, key: str) -> bool:
+        """Удаление пары ключ-значение"""
+        i = self._find(key, self._hash(key))  # O(1) в худшем случае
+        if i < 0:
+            return False
+        self.keys[i] = self.values[i] = None  # O(1) - удаленная ячейка сразу свободна
+        self.count -= 1  # O(1)
+        return True
+    
+    def _place(self, key: str, value, h: int) -> tuple:
+        """Размещение новой записи; при неудаче возвращает вытесненную запись, иначе None"""
+        keys, values, hashes = self.keys, self.values, self.hashes
+        for _ in range(self.max_kicks):  # O(1) в среднем, O(max_kicks) в худшем
+            first, second = self._buckets(h)
+            for bucket in (first, second):
+                start = bucket * BUCKET_SLOTS
+                for i in range(start, start + BUCKET_SLOTS):
+                    if keys[i] is None:
+                        keys[i], values[i], hashes[i] = key, value, h
+                        return None
+            # Обе корзины заняты: вытесняем случайную запись одной из них
+            bucket = first if self.rng.random() < 0.5 else second
+            i = bucket * BUCKET_SLOTS + self.rng.randrange(BUCKET_SLOTS)
+            key, keys[i] = keys[i], key
+            value, values[i] = values[i], value
+            h, hashes[i] = hashes[i], h
+        return key, value
+    
+    def insert(self, key: str, value) -> None:
+        """Вставка пары ключ-значение"""
+        h = self._hash(key)  # O(k)
+        i = self._find(key, h)
+        if i >= 0:
+            self.values[i] = value  # O(1) - обновление
+            return
+        if self.count + 1 > self.bucket_count * BUCKET_SLOTS * self.max_load_factor:
+            self._rehash(self.bucket_count * 2)  # O(n), амортизированно O(1)
+            h = self._hash(key)
+        self.count += 1  # O(1)
+        homeless = self._place(key, value, h)
+        if homeless is not None:  # цикл вытеснений: перестроение с новым ключом хеша
+            self._rehash(self.bucket_count, homeless)
+    
+    def _rehash(self, bucket_count: int, extra: tuple = None) -> None:
+        """Перестроение таблицы с новым ключом хеша (extra - запись, оставшаяся без места)"""
+        entries = [(k, v) for k, v in zip(self.keys, self.values) if k is not None]  # O(n)
+        if extra is not None:
+            entries.append(extra)
+        count = len(entries)
+        while True:
+            self._allocate(bucket_count)  # O(n)
+            for k, v in entries:
+                homeless = self._place(k, v, self._hash(k))
+                if homeless is not None:
+                    break
+            else:
+                self.count = count  # O(1)
+                return
+            # Даже с новым ключом цепочка вытеснений не закончилась - увеличиваем таблицу
+            bucket_count *= 2
+    
+    def load_factor(self) -> float:
+        """Коэффициент заполнения ячеек"""
+        return self.count / (self.bucket_count * BUCKET_SLOTS)  # O(1)
+    
+    def __len__(self) -> int:
+        """Число элементов в таблице"""
+        return self.count  # O(1)
\ No newline at end of file
@@ -0,0 +1,230 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from hash_functions import fnv1a_hash_bytes
+
+# Формат файла:
+#   заголовок | каталог ячеек (bucket_count x uint64) | журнал записей
+# Ячейка каталога хранит смещение последней записи своей цепочки (0 - пусто),
+# каждая запись ссылается на предыдущую запись той же ячейки. Записи только
+# дописываются: обновление и удаление добавляют новую запись в начало цепочки.
+HEADER = struct.Struct('<8sQQQ')  # сигнатура, число ячеек, число живых ключей, конец журнала
+RECORD = struct.Struct('<QQII')   # предыдущая запись, хеш, длина ключа, длина значения
+SLOT = struct.Struct('<Q')
+MAGIC = b'HTDISK01'
+TOMBSTONE = 0xFFFFFFFF  # длина значения у записи об удалении
+
+
+def _encode(data) -> bytes:
+    """Байты ключа или значения (строки кодируются в UTF-8)"""
+    return data.encode() if isinstance(data, str) else bytes(data)  # O(k)
+
+
+def _bucket_offset(index: int) -> int:
+    """Смещение ячейки каталога в файле"""
+    return HEADER.size + index * SLOT.size  # O(1)
+
+
+class DiskHashTableWriter:
+    """Запись в файловую хеш-таблицу (дозапись в журнал, каталог обновляется на месте)
+    
+    Открытые DiskHashTable видят изменения только после close() и повторного
+    открытия; для замены файла под работающими читателями есть build() и compact().
+    """
+    
+    def __init__(self, path: str, bucket_count: int = 1024):
+        self.path = path  # O(1)
+        if os.path.exists(path):
+            self.file = open(path, 'r+b')  # O(1) - продолжение существующего файла
+            magic, self.bucket_count, self.count, self.end = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path}: не файл хеш-таблицы")
+        else:
+            self.file = open(path, 'w+b')  # O(1)
+            self.bucket_count, self.count = bucket_count, 0
+            self.end = _bucket_offset(bucket_count)  # O(1) - журнал начинается после каталога
+            self.file.write(HEADER.pack(MAGIC, bucket_count, 0, self.end))
+            self.file.write(bytes(SLOT.size * bucket_count))  # O(b) - пустой каталог
+    
+    def _read_head(self, index: int) -> int:
+        """Смещение последней записи цепочки"""
+        self.file.seek(_bucket_offset(index))
+        return SLOT.unpack(self.file.read(SLOT.size))[0]  # O(1)
+    
+    def _exists(self, data: bytes, h: int, head: int) -> bool:
+        """Есть ли живой ключ в цепочке (чтение с диска)"""
+        offset = head
+        while offset:  # O(m) где m - длина цепочки
+            self.file.seek(offset)
+            prev, rh, key_len, value_len = RECORD.unpack(self.file.read(RECORD.size))
+            if rh == h and key_len == len(data) and self.file.read(key_len) == data:
+                return value_len != TOMBSTONE
+            offset = prev
+        return False
+    
+    def _append(self, data: bytes, value: bytes, value_len: int) -> None:
+        """Дозапись записи в журнал и перенос на нее ячейки каталога"""
+        h = fnv1a_hash_bytes(data)  # O(k) - хеш стабилен между запусками (в отличие от hash())
+        index = h % self.bucket_count
+        head = self._read_head(index)
+        existed = self._exists(data, h, head)
+        if value_len == TOMBSTONE and not existed:
+            return
+        offset = self.end
+        self.file.seek(offset)
+        self.file.write(RECORD.pack(head, h, len(data), value_len) + data + value)  # O(k + v)
+        self.end += RECORD.size + len(data) + len(value)
+        self.count += (value_len != TOMBSTONE) - existed
+        # Заголовок с новым концом журнала пишется раньше ячейки: после падения процесса
+        # повторное открытие не допишет новую запись поверх той, на которую уже ссылается каталог
+        self._write_header()  # O(1)
+        self.file.seek(_bucket_offset(index))
+        self.file.write(SLOT.pack(offset))  # O(1) - новая запись становится началом цепочки
+    
+    def put(self, key, value) -> None:
+        """Запись пары ключ-значение (значение - bytes или str)"""
+        value = _encode(value)
+        if len(value) >= TOMBSTONE:
+            raise ValueError("Слишком длинное значение")
+        self._append(_encode(key), value, len(value))
+    
+    def remove(self, key) -> None:
+        """Удаление ключа (запись-tombstone)"""
+        self._append(_encode(key), b'', TOMBSTONE)
+    
+    def _write_header(self) -> None:
+        """Запись заголовка: число ячеек, число живых ключей и конец журнала"""
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, self.bucket_count, self.count, self.end))  # O(1)
+    
+    def flush(self) -> None:
+        """Запись заголовка и сброс буферов на диск"""
+        self._write_header()  # O(1)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+    
+    def close(self) -> None:
+        """Завершение записи"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DiskHashTable:
+    """Файловая хеш-таблица только для чтения: поиск через mmap и страничный кэш ОС"""
+    
+    def __init__(self, path: str):
+        self.path = path  # O(1)
+        with open(path, 'rb') as f:
+            # Отображение не читает файл: страницы подгружаются ОС при первом обращении
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # O(1)
+        magic, self.bucket_count, self.count, self.end = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.map.close()
+            raise ValueError(f"{path}: не файл хеш-таблицы")
+    
+    @staticmethod
+    def build(path: str, items, bucket_count: int = None) -> None:
+        """Построение файла по парам ключ-значение за один проход (при повторе ключа побеждает последняя пара)"""
+        records = {}
+        for key, value in items:  # O(n)
+            records[_encode(key)] = _encode(value)
+        bucket_count = bucket_count or max(16, 2 * len(records))  # коэффициент заполнения 0.5
+        directory = [0] * bucket_count  # O(b) - каталог строится в памяти и пишется один раз
+        end = _bucket_offset(bucket_count)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.seek(end)
+            for data, value in records.items():  # O(n) - последовательная запись журнала
+                h = fnv1a_hash_bytes(data)
+                index = h % bucket_count
+                f.write(RECORD.pack(directory[index], h, len(data), len(value)) + data + value)
+                directory[index] = end
+                end += RECORD.size + len(data) + len(value)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, bucket_count, len(records), end))
+            directory = array('Q', directory)  # O(b) - плоский буфер вместо b аргументов struct.pack
+            if sys.byteorder == 'big':
+                directory.byteswap()  # формат файла - little-endian
+            f.write(directory.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)  # O(1) - атомарная подмена: читатели видят старый или новый файл
+    
+    def _find(self, data: bytes) -> int:
+        """Смещение последней записи ключа или 0"""
+        h = fnv1a_hash_bytes(data)  # O(k)
+        offset = SLOT.unpack_from(self.map, _bucket_offset(h % self.bucket_count))[0]  # O(1)
+        while offset:  # O(1) в среднем
+            prev, rh, key_len, value_len = RECORD.unpack_from(self.map, offset)
+            start = offset + RECORD.size
+            # Ключ сравнивается только при совпадении полного хеша
+            if rh == h and key_len == len(data) and self.map[start:start + key_len] == data:
+                return offset
+            offset = prev
+        return 0
+    
+    def get(self, key):
+        """Значение ключа (bytes) или None"""
+        data = _encode(key)
+        offset = self._find(data)  # O(1) в среднем
+        if not offset:
+            return None
+        prev, h, key_len, value_len = RECORD.unpack_from(self.map, offset)
+        if value_len == TOMBSTONE:
+            return None
+        start = offset + RECORD.size + key_len
+        return self.map[start:start + value_len]  # O(v)
+    
+    def __contains__(self, key) -> bool:
+        """Проверка наличия ключа"""
+        return self.get(key) is not None
+    
+    def items(self):
+        """Живые пары (ключ, значение) в виде bytes"""
+        for index in range(self.bucket_count):  # O(b + записей)
+            offset = SLOT.unpack_from(self.map, _bucket_offset(index))[0]
+            seen = set()  # более новые записи ключа идут в цепочке раньше
+            while offset:
+                prev, h, key_len, value_len = RECORD.unpack_from(self.map, offset)
+                start = offset + RECORD.size
+                key = self.map[start:start + key_len]
+                if key not in seen:
+                    seen.add(key)
+                    if value_len != TOMBSTONE:
+                        yield key, self.map[start + key_len:start + key_len + value_len]
+                offset = prev
+    
+    def file_size(self) -> int:
+        """Размер файла в байтах"""
+        return self.end  # O(1)
+    
+    def close(self) -> None:
+        """Закрытие отображения"""
+        self.map.close()
+    
+    def __len__(self) -> int:
+        """Число живых ключей"""
+        return self.count  # O(1)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def compact(path: str, bucket_count: int = None) -> None:
+    """Сжатие файла: остаются только последние версии живых ключей, каталог подбирается заново"""
+    with DiskHashTable(path) as table:
+        items = list(table.items())  # O(n) - отображение закрывается до замены файла (нужно в Windows)
+    # Новый файл пишется рядом и атомарно заменяет старый (os.replace)
+    DiskHashTable.build(path, items, bucket_count)  # O(n)
\ No newline at end of file
@@ -0,0 +1,173 @@
+import random
+import time
+from hash_functions import simple_hash, polynomial_hash, fnv1a_hash, fast_polynomial_hash, make_seeded_hash, MASK_64
+
+try:
+    import numpy as np  # векторизованная статистика (необязательная зависимость)
+except ImportError:
+    np = None
+
+
+def bucket_counts(hashes: list, m: int) -> list:
+    """Число ключей в каждой из m ячеек"""
+    if np is not None:
+        if hashes and (min(hashes) < 0 or max(hashes) > MASK_64):
+            hashes = [h % m for h in hashes]  # O(n) - знаковые хеши (как у hash()) не помещаются в uint64
+        indexes = np.array(hashes, dtype=np.uint64) % np.uint64(m)  # O(n) без цикла Python
+        return np.bincount(indexes.astype(np.int64), minlength=m)
+    counts = [0] * m  # O(m)
+    for h in hashes:  # O(n)
+        counts[h % m] += 1
+    return counts
+
+
+def linear_probing_displacement(counts) -> int:
+    """Суммарное смещение ключей от своих ячеек при линейном пробировании
+
+    Перенос в ячейку i: W_i = max(0, W_{i-1} + c_i - 1). Это рекуррентность
+    Линдли, W_i = S_i - min(0, min S_j) для префиксных сумм S, поэтому
+    она считается без цикла. Обход начинается после минимума S: там
+    перенос нулевой, и переход через конец таблицы учитывается сам.
+    """
+    if np is not None:
+        steps = np.asarray(counts, dtype=np.int64) - 1
+        start = int(np.argmin(np.cumsum(steps))) + 1  # O(m)
+        prefix = np.cumsum(np.roll(steps, -start))  # O(m)
+        carry = prefix - np.minimum(np.minimum.accumulate(prefix), 0)
+        return int(carry.sum())
+    m = len(counts)
+    prefix, lowest, start = 0, 0, 0
+    for i in range(m):  # O(m) - поиск ячейки, где перенос обнуляется
+        prefix += counts[i] - 1
+        if prefix < lowest:
+            lowest, start = prefix, i + 1
+    total, carry = 0, 0
+    for i in range(start, start + m):  # O(m)
+        carry = max(0, carry + counts[i % m] - 1)
+        total += carry
+    return total
+
+
+def analyze_distribution(hashes: list, m: int, histogram_limit: int = 8) -> dict:
+    """Статистика распределения хешей по m ячейкам"""
+    counts = bucket_counts(hashes, m)
+    n = len(hashes)
+    expected = n / m  # O(1) - ожидаемое число ключей в ячейке при равномерном хеше
+    if np is not None:
+        histogram = np.bincount(np.minimum(counts, histogram_limit), minlength=histogram_limit + 1).tolist()
+        chi_squared = float(((counts - expected) ** 2).sum() / expected)
+        sum_squares = int((counts.astype(np.int64) ** 2).sum())
+        max_chain = int(counts.max())
+    else:
+        histogram = [0] * (histogram_limit + 1)
+        for c in counts:  # O(m)
+            histogram[min(c, histogram_limit)] += 1
+        chi_squared = sum((c - expected) ** 2 for c in counts) / expected
+        sum_squares = sum(c * c for c in counts)
+        max_chain = max(counts)
+    used = m - histogram[0]
+    report = {
+        "keys": n,
+        "buckets": m,
+        "histogram": histogram,  # histogram[c] - число ячеек с c ключами (последняя - c и больше)
+        "max_chain": max_chain,
+        "avg_chain": n / used if used else 0.0,  # средняя длина непустой цепочки
+        "chi_squared": chi_squared,
+        # Для равномерного хеша хи-квадрат близок к числу степеней свободы m - 1
+        "chi_squared_ratio": chi_squared / (m - 1) if m > 1 else 0.0,
+        # Метод цепочек: k-й ключ цепочки находится за k проб, промах просматривает всю цепочку;
+        # отсутствующие ключи распределены так же, как имеющиеся (ячейка с вероятностью c / n)
+        "chaining_hit_probes": (sum_squares + n) / (2 * n) if n else 0.0,
+        "chaining_miss_probes": sum_squares / n if n else 0.0,
+        "uniform_hit_probes": 1 + expected / 2,
+        "uniform_miss_probes": 1 + expected,  # цепочка, взвешенная по ключам: сам ключ и еще alpha в среднем
+    }
+    if n < m:
+        alpha = n / m
+        report["linear_hit_probes"] = 1 + linear_probing_displacement(counts) / n if n else 1.0
+        report["uniform_linear_hit_probes"] = (1 + 1 / (1 - alpha)) / 2  # оценка Кнута
+    return report
+
+
+def flip_bit(key: str, position: int, bit: int) -> str:
+    """Ключ с инвертированным битом bit символа position"""
+    return key[:position] + chr(ord(key[position]) ^ (1 << bit)) + key[position + 1:]
+
+
+def avalanche(hash_func, keys: list, samples: int = 500, key_bits: int = 7) -> dict:
+    """Лавинный эффект: доля битов хеша, меняющихся при инверсии одного бита ключа"""
+    sample = random.sample(keys, min(samples, len(keys)))
+    base, flipped = [], []
+    for key in sample:  # O(samples * len * key_bits) вычислений хеша
+        h = hash_func(key) & MASK_64  # O(1) - отрицательный хеш как 64-битное дополнение до двух
+        for position in range(len(key)):
+            for bit in range(key_bits):  # младшие 7 бит: ASCII-символ остается ASCII
+                base.append(h)
+                flipped.append(hash_func(flip_bit(key, position, bit)) & MASK_64)
+    if not base:
+        return {"score": 0.0, "worst_bit_bias": 0.0, "output_bits": 0}
+    output_bits = max(1, max(h.bit_length() for h in base))  # разрядность значений функции
+    if np is not None:
+        diffs = np.array(base, dtype=np.uint64) ^ np.array(flipped, dtype=np.uint64)
+        bits = np.unpackbits(diffs.astype("<u8").view(np.uint8), bitorder="little").reshape(-1, 64)[:, :output_bits]
+        per_bit = bits.mean(axis=0)  # O(pairs * 64) - вероятность смены каждого бита
+        score, worst = float(per_bit.mean()), float(np.abs(per_bit - 0.5).max())
+    else:
+        changes = [0] * output_bits
+        for a, b in zip(base, flipped):
+            diff = a ^ b
+            for bit in range(output_bits):
+                changes[bit] += (diff >> bit) & 1
+        per_bit = [c / len(base) for c in changes]
+        score, worst = sum(per_bit) / output_bits, max(abs(p - 0.5) for p in per_bit)
+    # Идеальная функция: score = 0.5, каждый бит меняется с вероятностью 1/2
+    return {"score": score, "worst_bit_bias": worst, "output_bits": output_bits}
+
+
+def analyze_hash(hash_func, keys: list, m: int = None, avalanche_samples: int = 500) -> dict:
+    """Полный отчет о качестве хеш-функции на наборе ключей"""
+    m = m or len(keys)
+    start = time.perf_counter()
+    hashes = list(map(hash_func, keys))  # O(n * k) - единственный проход функции по всем ключам
+    hash_time = time.perf_counter() - start
+    report = analyze_distribution(hashes, m)
+    report["hash_time"] = hash_time
+    report["avalanche"] = avalanche(hash_func, keys, avalanche_samples)
+    return report
+
+
+def print_hash_report(name: str, report: dict) -> None:
+    """Печать отчета analyze_hash()"""
+    print(f"\n{name}: {report['keys']} ключей, {report['buckets']} ячеек, "
+          f"хеширование {report['hash_time']:.3f} с")
+    histogram = report["histogram"]
+    labels = [str(c) for c in range(len(histogram) - 1)] + [f"{len(histogram) - 1}+"]
+    print("  Заполненность ячеек: " + ", ".join(f"{l}: {c}" for l, c in zip(labels, histogram)))
+    print(f"  Цепочки: макс. {report['max_chain']}, средняя непустая {report['avg_chain']:.2f}")
+    print(f"  Хи-квадрат: {report['chi_squared']:.0f} (относ. равномерного {report['chi_squared_ratio']:.2f})")
+    aval = report["avalanche"]
+    print(f"  Лавинный эффект: {aval['score']:.3f} (идеал 0.5), "
+          f"худший бит отклоняется на {aval['worst_bit_bias']:.3f}, разрядность {aval['output_bits']}")
+    print(f"  Пробы (цепочки): успех {report['chaining_hit_probes']:.2f} "
+          f"(равномерно {report['uniform_hit_probes']:.2f}), "
+          f"промах {report['chaining_miss_probes']:.2f} (равномерно {report['uniform_miss_probes']:.2f})")
+    if "linear_hit_probes" in report:
+        print(f"  Пробы (линейное пробирование): успех {report['linear_hit_probes']:.2f} "
+              f"(равномерно {report['uniform_linear_hit_probes']:.2f})")
+
+
+def analyze_hash_quality(n: int = 50000):
+    """Отчеты о качестве хеш-функций на ключах-идентификаторах"""
+    print("\n" + "=" * 40)
+    print(f"Качество хеш-функций (статистика: {'numpy' if np is not None else 'Python'}):")
+    keys = [f"user_{i:07d}" for i in range(n)]
+    functions = {
+        "simple_hash": simple_hash,
+        "polynomial_hash": polynomial_hash,
+        "fnv1a_hash": fnv1a_hash,
+        "fast_polynomial_hash": fast_polynomial_hash,
+        "seeded (BLAKE2b)": make_seeded_hash(),
+    }
+    for name, func in functions.items():
+        # Таблица с коэффициентом заполнения 0.5, чтобы оценить и линейное пробирование
+        print_hash_report(name, analyze_hash(func, keys, 2 * n))
\ No newline at end of file
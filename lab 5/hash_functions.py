@@ -1,3 +1,8 @@
+import os
+from hashlib import blake2b
+from struct import unpack, iter_unpack
+
+
 def simple_hash(key: str) -> int:
     """Простая хеш-функция: сумма кодов символов"""
     h = 0
@@ -13,4 +18,68 @@ def polynomial_hash(key: str, p: int = 31, m: int = 10**9 + 7) -> int:
     for char in key:
         h = (h + (ord(char) * power)) % m  # O(1) - умножение и сложение
         power = (power * p) % m  # O(1) - умножение
-    return h  # O(1)
\ No newline at end of file
+    return h  # O(1)
+
+
+FNV_OFFSET_64 = 0xCBF29CE484222325
+FNV_PRIME_64 = 0x100000001B3
+MASK_64 = (1 << 64) - 1
+MERSENNE_61 = (1 << 61) - 1  # модуль 2^61 - 1: остаток берется сложением и сдвигом
+POLY_BASE = 0x1F3D5B79A3C1E5  # основание полиномиального хеша (< 2^61)
+
+
+def fnv1a_hash_bytes(data: bytes) -> int:
+    """FNV-1a (64 бит) над байтами"""
+    h = FNV_OFFSET_64
+    for byte in data:  # O(k) - одна операция xor и одно умножение на байт
+        h = ((h ^ byte) * FNV_PRIME_64) & MASK_64
+    return h
+
+
+def fnv1a_hash(key: str) -> int:
+    """FNV-1a (64 бит) над UTF-8 байтами строки"""
+    return fnv1a_hash_bytes(key.encode("utf-8"))  # O(k)
+
+
+def polynomial_hash_bytes(data: bytes, base: int = POLY_BASE) -> int:
+    """Полиномиальный хеш по модулю 2^61 - 1 над 8-байтовыми словами (little-endian на любой платформе)
+    
+    Слово (до 2^64) не приводится по модулю заранее, поэтому слова, отличающиеся
+    на кратное 2^61 - 1, дают одинаковый вклад: для подобранных злоумышленником
+    ключей нужен seeded_hash_bytes.
+    """
+    n = len(data)
+    if n <= 8:
+        # Короткий ключ - одно слово, без цикла
+        return (int.from_bytes(data, "little") * base + n) % MERSENNE_61  # O(1)
+    padded = data + bytes(-n % 8)  # O(k) - дополнение до целого числа слов
+    h = 0
+    for word, in iter_unpack("<Q", padded):  # O(k/8) - одна итерация на 8 байт, порядок байт фиксирован
+        h = (h * base + word) % MERSENNE_61
+    return (h * base + n) % MERSENNE_61  # длина различает ключи, отличающиеся нулевым хвостом
+
+
+def fast_polynomial_hash(key: str) -> int:
+    """Полиномиальный хеш над UTF-8 байтами строки, по 8 байт за шаг"""
+    return polynomial_hash_bytes(key.encode("utf-8"))  # O(k/8)
+
+
+def seeded_hash_bytes(data: bytes, seed: bytes) -> int:
+    """Хеш с секретным ключом (BLAKE2b, 64 бит) - устойчив к подбору коллизий"""
+    return int.from_bytes(blake2b(data, digest_size=8, key=seed).digest(), "little")  # O(k)
+
+
+def seeded_hash_words(data: bytes, seed: bytes, count: int = 2) -> tuple:
+    """count независимых 64-битных хешей из одного вызова BLAKE2b (для схем с несколькими хешами)"""
+    return unpack(f"<{count}Q", blake2b(data, digest_size=8 * count, key=seed).digest())  # O(k)
+
+
+def make_seeded_hash(seed: bytes = None):
+    """Создание хеш-функции для строк со случайным (или заданным) секретным ключом"""
+    if seed is None:
+        seed = os.urandom(16)  # O(1) - новый ключ на каждую таблицу/процесс
+    
+    def seeded_hash(key: str) -> int:
+        return seeded_hash_bytes(key.encode("utf-8"), seed)  # O(k)
+    
+    return seeded_hash
\ No newline at end of file
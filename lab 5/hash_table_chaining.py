@@ -3,44 +3,187 @@ from hash_functions import simple_hash
 class HashTableChaining:
     """Хеш-таблица с методом цепочек"""
     
-    def __init__(self, size: int = 10):
+    def __init__(self, size: int = 10, max_load_factor: float = 1.0, incremental: bool = True,
+                 hash_func=simple_hash):
         self.size = size  # O(1) - присваивание
+        self.hash_func = hash_func  # O(1) - хеш-функция строки (simple_hash, fnv1a_hash, ...)
         self.table = [[] for _ in range(size)]  # O(n) - создание n списков
-        
+        self.count = 0  # O(1) - число элементов
+        self.max_load_factor = max_load_factor  # O(1) - порог роста таблицы
+        self.incremental = incremental  # O(1) - постепенное (как в Redis) или разовое перехеширование
+        self.rehash_steps = 8  # O(1) - сколько записей переносится за одну операцию
+        self._new_table = None  # O(1) - вторая таблица во время перехеширования
+        self._new_size = 0  # O(1)
+        self._rehash_index = 0  # O(1) - цепочки старой таблицы с меньшим индексом уже перенесены
+    
     def _hash(self, key: str) -> int:
         """Вычисление хеша для ключа"""
-        return simple_hash(key) % self.size  # O(k) где k - длина ключа
-        
+        return self.hash_func(key) % self.size  # O(k) где k - длина ключа
+    
+    def _new_chain(self, h: int) -> list:
+        """Цепочка новой таблицы для хеша h (создается при первом обращении)"""
+        index = h % self._new_size  # O(1)
+        chain = self._new_table[index]  # O(1)
+        if chain is None:
+            chain = self._new_table[index] = []  # O(1)
+        return chain
+    
+    def _chains(self, key: str) -> tuple:
+        """Цепочки, в которых может находиться ключ: (основная, дополнительная или None)"""
+        return self._chains_for_hash(self.hash_func(key))  # O(k)
+    
+    def _chains_for_hash(self, h: int) -> tuple:
+        """Цепочки для уже вычисленного хеша (пакетные операции хешируют ключи заранее)"""
+        index = h % self.size  # O(1)
+        if self._new_table is None or index > self._rehash_index:
+            return self.table[index], None  # O(1)
+        if index < self._rehash_index:
+            return self._new_chain(h), None  # O(1) - цепочка уже перенесена
+        # Цепочка переносится прямо сейчас: часть записей уже в новой таблице
+        return self.table[index], self._new_chain(h)  # O(1)
+    
+    def _start_rehash(self, new_size: int) -> None:
+        """Создание второй таблицы и начало переноса цепочек"""
+        self._new_size = new_size  # O(1)
+        # Цепочки новой таблицы создаются постепенно: [None] * n выделяется без заметной паузы
+        self._new_table = [None] * new_size  # O(n), но без создания n списков
+        self._rehash_index = 0  # O(1)
+        if not self.incremental:
+            self.finish_rehash()  # O(n) - разовая пауза
+    
+    def _rehash_step(self, budget: int) -> None:
+        """Перенос до budget записей из старой таблицы в новую"""
+        empty_visits = budget * 10  # O(1) - ограничение на просмотр пустых цепочек
+        ratio_size = self.size  # O(1)
+        while budget > 0 and self._rehash_index < self.size:
+            i = self._rehash_index
+            bucket = self.table[i]
+            if bucket:
+                while bucket and budget > 0:  # O(budget) - длинная цепочка переносится по частям
+                    entry = bucket.pop()
+                    self._new_chain(self.hash_func(entry[0])).append(entry)
+                    budget -= 1
+                if bucket:
+                    break
+            else:
+                empty_visits -= 1
+            self.table[i] = None  # O(1) - старые цепочки освобождаются по одной, а не разом в конце
+            # Заранее создаем цепочки новой таблицы в диапазоне i * new / old ... (i + 1) * new / old,
+            # чтобы к концу переноса существовали все цепочки (записи i-й цепочки при этом
+            # попадают в ячейки h % new_size и могут лежать вне диапазона; такие цепочки создает _new_chain)
+            for j in range(i * self._new_size // ratio_size, (i + 1) * self._new_size // ratio_size):
+                if self._new_table[j] is None:
+                    self._new_table[j] = []
+            self._rehash_index += 1
+            if empty_visits == 0:
+                break
+        if self._rehash_index >= self.size:
+            # Перенос завершен: новая таблица становится основной
+            self.table = self._new_table  # O(1)
+            self.size = self._new_size  # O(1)
+            self._new_table = None  # O(1)
+            self._new_size = 0  # O(1)
+            self._rehash_index = 0  # O(1)
+    
+    def finish_rehash(self) -> None:
+        """Завершение начатого перехеширования за один вызов"""
+        while self._new_table is not None:  # O(n)
+            self._rehash_step(self.count + 1)
+    
+    def is_rehashing(self) -> bool:
+        """Идет ли перенос цепочек в новую таблицу"""
+        return self._new_table is not None  # O(1)
+    
+    def load_factor(self) -> float:
+        """Коэффициент заполнения"""
+        return self.count / (self._new_size or self.size)  # O(1)
+    
+    def _put(self, bucket: list, moved: list, key: str, value) -> None:
+        """Обновление ключа в его цепочках или добавление в основную цепочку"""
+        for chain in (bucket, moved or ()):
+            for i, (k, v) in enumerate(chain):  # O(m) где m - размер цепочки
+                if k == key:
+                    chain[i] = (key, value)  # O(1) - обновление
+                    return
+        bucket.append((key, value))  # O(1) - добавление в конец списка
+        self.count += 1  # O(1)
+    
+    def _lookup(self, bucket: list, moved: list, key: str):
+        """Значение ключа из его цепочек или None"""
+        for chain in (bucket, moved or ()):
+            for k, v in chain:  # O(m)
+                if k == key:
+                    return v  # O(1) - возврат значения
+        return None  # O(1)
+    
+    def _delete(self, bucket: list, moved: list, key: str) -> bool:
+        """Удаление ключа из его цепочек"""
+        for chain in (bucket, moved or ()):
+            for i, (k, v) in enumerate(chain):  # O(m)
+                if k == key:
+                    del chain[i]  # O(m) в худшем случае (удаление из середины списка)
+                    self.count -= 1  # O(1)
+                    return True
+        return False
+    
     def insert(self, key: str, value) -> None:
         """Вставка пары ключ-значение"""
-        index = self._hash(key)  # O(k)
-        bucket = self.table[index]  # O(1) - доступ по индексу
-        
-        # Проверка, не существует ли уже такой ключ
-        for i, (k, v) in enumerate(bucket):  # O(m) где m - размер цепочки
-            if k == key:
-                bucket[i] = (key, value)  # O(1) - обновление
-                return
-                
-        bucket.append((key, value))  # O(1) - добавление в конец списка
-        
+        if self._new_table is not None:
+            self._rehash_step(self.rehash_steps)  # O(1) - шаг постепенного переноса
+        self._put(*self._chains(key), key, value)  # O(k + m)
+        if self._new_table is None and self.count > self.size * self.max_load_factor:
+            self._start_rehash(self.size * 2)  # перенос записей - постепенно
+    
     def get(self, key: str):
         """Получение значения по ключу"""
-        index = self._hash(key)  # O(k)
-        bucket = self.table[index]  # O(1)
-        
-        for k, v in bucket:  # O(m)
-            if k == key:
-                return v  # O(1) - возврат значения
-        return None  # O(1)
-        
+        if self._new_table is not None:
+            self._rehash_step(self.rehash_steps)  # O(1)
+        return self._lookup(*self._chains(key), key)  # O(k + m)
+    
     def remove(self, key: str) -> bool:
         """Удаление пары ключ-значение"""
-        index = self._hash(key)  # O(k)
-        bucket = self.table[index]  # O(1)
-        
-        for i, (k, v) in enumerate(bucket):  # O(m)
-            if k == key:
-                del bucket[i]  # O(m) в худшем случае (удаление из середины списка)
-                return True
-        return False
\ No newline at end of file
+        if self._new_table is not None:
+            self._rehash_step(self.rehash_steps)  # O(1)
+        return self._delete(*self._chains(key), key)  # O(k + m)
+    
+    def _reserve(self, extra: int) -> None:
+        """Начало роста таблицы под extra новых элементов (записи переносятся постепенно)"""
+        if self._new_table is not None:
+            return  # перенос уже идет: его продвигают шаги операций
+        new_size = self.size
+        while self.count + extra > new_size * self.max_load_factor:  # O(log n)
+            new_size *= 2
+        if new_size != self.size:
+            self._start_rehash(new_size)  # O(1) при постепенном перехешировании
+    
+    def insert_many(self, items) -> None:
+        """Вставка пакета пар ключ-значение (при повторе ключа побеждает последняя пара)"""
+        items = list(items)  # O(n)
+        hashes = list(map(self.hash_func, (key for key, _ in items)))  # O(n * k) - хеши пакета разом
+        self._reserve(len(items))  # одно перехеширование под весь пакет вместо нескольких удвоений
+        for index, ((key, value), h) in enumerate(zip(items, hashes)):  # O(n * m)
+            if self._new_table is not None:
+                self._rehash_step(self.rehash_steps)  # O(1) - перенос не завершается принудительно
+            elif self.count + 1 > self.size * self.max_load_factor:
+                self._reserve(len(items) - index)  # предыдущий перенос закончился посреди пакета
+            self._put(*self._chains_for_hash(h), key, value)
+    
+    def get_many(self, keys) -> list:
+        """Значения для пакета ключей в порядке запроса (None для отсутствующих)"""
+        keys = list(keys)  # O(n)
+        if self._new_table is not None:
+            self._rehash_step(self.rehash_steps)  # O(1) - как у одиночного get, таблица только читается
+        return [self._lookup(*self._chains_for_hash(h), key)
+                for key, h in zip(keys, map(self.hash_func, keys))]  # O(n * m)
+    
+    def remove_many(self, keys) -> list:
+        """Удаление пакета ключей, для каждого ключа - был ли он удален"""
+        keys = list(keys)  # O(n)
+        if self._new_table is not None:
+            self._rehash_step(self.rehash_steps)  # O(1) - как у одиночного remove
+        return [self._delete(*self._chains_for_hash(h), key)
+                for key, h in zip(keys, map(self.hash_func, keys))]  # O(n * m)
+    
+    def __len__(self) -> int:
+        """Число элементов в таблице"""
+        return self.count  # O(1)
\ No newline at end of file
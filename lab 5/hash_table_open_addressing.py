@@ -0,0 +1,134 @@
+from array import array
+from hash_functions import polynomial_hash
+
+EMPTY = 0x80    # управляющий байт пустой ячейки
+DELETED = 0xFE  # управляющий байт удаленной ячейки (tombstone)
+MASK_64 = (1 << 64) - 1
+GOLDEN = 0x9E3779B97F4A7C15  # множитель фибоначчиева хеширования
+
+
+class HashTableOpenAddressing:
+    """Хеш-таблица с открытой адресацией (линейное пробирование, управляющие байты)"""
+    
+    def __init__(self, size: int = 10, max_load_factor: float = 0.75, hash_func=polynomial_hash):
+        self.hash_func = hash_func  # O(1) - хеш-функция строки
+        self.max_load_factor = max_load_factor  # O(1) - доля занятых ячеек (с tombstone)
+        capacity = 8
+        while capacity * max_load_factor < size:  # O(log n) - степень двойки
+            capacity *= 2
+        self._allocate(capacity)  # O(n)
+    
+    def _allocate(self, capacity: int) -> None:
+        """Создание параллельных массивов заданной емкости"""
+        self.size = capacity  # O(1) - число ячеек
+        self.mask = capacity - 1  # O(1)
+        self.shift = 64 - (capacity.bit_length() - 1)  # O(1) - индекс берется из старших битов
+        self.ctrl = bytearray([EMPTY]) * capacity  # O(n) - управляющие байты
+        self.hashes = array('Q', bytes(8 * capacity))  # O(n) - полные хеши для перестроения
+        self.keys = [None] * capacity  # O(n)
+        self.values = [None] * capacity  # O(n)
+        self.count = 0  # O(1) - число живых элементов
+        self.used = 0  # O(1) - живые элементы + tombstone
+        self.max_used = int(capacity * self.max_load_factor)  # O(1)
+    
+    def _hash(self, key: str) -> int:
+        """Вычисление 64-битного хеша с перемешиванием битов"""
+        return (self.hash_func(key) * GOLDEN) & MASK_64  # O(k) где k - длина ключа
+    
+    def _find(self, key: str, h: int) -> int:
+        """Индекс ячейки с ключом или -1"""
+        ctrl, keys, mask = self.ctrl, self.keys, self.mask
+        tag = h & 0x7F  # O(1) - 7 младших бит хеша хранятся в управляющем байте
+        i = h >> self.shift  # O(1)
+        while True:  # O(1) в среднем
+            c = ctrl[i]
+            if c == EMPTY:
+                return -1
+            # Ключи сравниваются только при совпадении управляющего байта
+            if c == tag and keys[i] == key:
+                return i
+            i = (i + 1) & mask
+    
+    def insert(self, key: str, value) -> None:
+        """Вставка пары ключ-значение"""
+        h = self._hash(key)  # O(k)
+        ctrl, keys, mask = self.ctrl, self.keys, self.mask
+        tag = h & 0x7F
+        i = h >> self.shift
+        tombstone = -1
+        while True:  # O(1) в среднем
+            c = ctrl[i]
+            if c == EMPTY:
+                break
+            if c == DELETED:
+                if tombstone < 0:
+                    tombstone = i  # O(1) - первую удаленную ячейку можно переиспользовать
+            elif c == tag and keys[i] == key:
+                self.values[i] = value  # O(1) - обновление
+                return
+            i = (i + 1) & mask
+        if tombstone >= 0:
+            i = tombstone
+        else:
+            self.used += 1  # O(1) - занята новая пустая ячейка
+        ctrl[i] = tag  # O(1)
+        self.hashes[i] = h  # O(1)
+        keys[i] = key  # O(1)
+        self.values[i] = value  # O(1)
+        self.count += 1  # O(1)
+        if self.used > self.max_used:
+            self._resize()  # O(n), амортизированно O(1)
+    
+    def get(self, key: str):
+        """Получение значения по ключу"""
+        i = self._find(key, self._hash(key))  # O(k)
+        return self.values[i] if i >= 0 else None  # O(1)
+    
+    def remove(self, key: str) -> bool:
+        """Удаление пары ключ-значение"""
+        i = self._find(key, self._hash(key))  # O(k)
+        if i < 0:
+            return False
+        # Если следующая ячейка пуста, цепочка пробирования здесь обрывается и tombstone не нужен
+        if self.ctrl[(i + 1) & self.mask] == EMPTY:
+            self.ctrl[i] = EMPTY  # O(1)
+            self.used -= 1  # O(1)
+        else:
+            self.ctrl[i] = DELETED  # O(1)
+        self.keys[i] = None  # O(1) - освобождаем ссылки
+        self.values[i] = None  # O(1)
+        self.count -= 1  # O(1)
+        return True
+    
+    def _resize(self) -> None:
+        """Перестроение таблицы: удаление tombstone и увеличение емкости при необходимости"""
+        old_ctrl, old_hashes, old_keys, old_values = self.ctrl, self.hashes, self.keys, self.values
+        count = self.count
+        capacity = self.size
+        if count * 2 > self.max_used:  # O(1) - много живых элементов: растем
+            capacity *= 2
+        self._allocate(capacity)  # O(n)
+        ctrl, hashes, keys, values, mask = self.ctrl, self.hashes, self.keys, self.values, self.mask
+        for j in range(len(old_ctrl)):  # O(n) - ключи не сравниваются, хеши не пересчитываются
+            if old_ctrl[j] < EMPTY:
+                h = old_hashes[j]
+                i = h >> self.shift
+                while ctrl[i] != EMPTY:
+                    i = (i + 1) & mask
+                ctrl[i] = old_ctrl[j]
+                hashes[i] = h
+                keys[i] = old_keys[j]
+                values[i] = old_values[j]
+        self.count = self.used = count  # O(1) - tombstone больше нет
+    
+    def average_probe_length(self) -> float:
+        """Среднее число проб при успешном поиске"""
+        total = 0
+        for i in range(self.size):  # O(n)
+            if self.ctrl[i] < EMPTY:
+                total += ((i - (self.hashes[i] >> self.shift)) & self.mask) + 1
+        return total / self.count if self.count else 0.0
+    
+    def __len__(self) -> int:
+        """Число элементов в таблице"""
+        return self.count  # O(1)
\ No newline at end of file
@@ -1,7 +1,8 @@
 import time
-from hash_functions import simple_hash, polynomial_hash
+from hash_functions import simple_hash, polynomial_hash, fnv1a_hash, fast_polynomial_hash
 from hash_table_chaining import HashTableChaining
-from performance_analysis import measure_performance
+from performance_analysis import measure_performance, measure_resize_latency, compare_hash_functions, measure_memory, measure_disk_table, measure_concurrency, measure_static_lookup
+from hash_analysis import analyze_hash_quality
 
 def main():
     print("Лабораторная работа 5: Хеш-функции и хеш-таблицы")
@@ -17,6 +18,7 @@ def main():
         h1 = simple_hash(s)
         h2 = polynomial_hash(s)
         print(f"'{s}': простая хеш = {h1}, полиномиальная хеш = {h2}")
+        print(f"    FNV-1a = {fnv1a_hash(s)}, полиномиальная по 8 байт = {fast_polynomial_hash(s)}")
     
     # Демонстрация работы хеш-таблицы
     print("\n2. Демонстрация работы хеш-таблицы:")
@@ -61,6 +63,13 @@ def main():
     print("-" * 30)
     time.sleep(1)
     measure_performance()
+    measure_resize_latency()
+    compare_hash_functions()
+    analyze_hash_quality()
+    measure_memory()
+    measure_disk_table()
+    measure_concurrency()
+    measure_static_lookup()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
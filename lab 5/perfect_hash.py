@@ -0,0 +1,107 @@
+import os
+from array import array
+from hash_functions import seeded_hash_words
+
+
+class PerfectHashTable:
+    """Минимальная совершенная хеш-функция (CHD) для неизменяемого набора ключей
+    
+    Ключи разбиваются на корзины первым хешем; для каждой корзины, начиная с
+    самых больших, подбирается смещение d = d0 * n + d1, при котором все ее
+    ключи попадают в свободные и разные ячейки (f1 + d0 * f2 + d1) % n.
+    Поиск: один хеш, одно чтение смещения и одно сравнение ключа.
+    """
+    
+    def __init__(self, items, bucket_size: float = 4.0, max_attempts: int = 10):
+        items = dict(items)  # O(n) - при повторе ключа побеждает последняя пара
+        self.n = len(items)  # O(1) - ячеек ровно столько же, сколько ключей
+        self.bucket_count = max(1, int(self.n / bucket_size))  # O(1) - в среднем bucket_size ключей на корзину
+        for _ in range(max_attempts):  # O(1) в среднем - новая попытка с другим ключом хеша
+            self.seed = os.urandom(16)
+            if self._build(items):
+                return
+        raise RuntimeError("Не удалось построить совершенную хеш-функцию")
+    
+    def _hashes(self, key: str) -> tuple:
+        """Корзина и пара хешей (f1, f2) ключа"""
+        g, f1, f2 = seeded_hash_words(key.encode("utf-8"), self.seed, 3)  # O(k)
+        return g % self.bucket_count, f1 % self.n, f2 % self.n
+    
+    def _build(self, items: dict) -> bool:
+        """Подбор смещений для всех корзин; False, если какая-то корзина не разместилась"""
+        n = self.n
+        buckets = [[] for _ in range(self.bucket_count)]  # O(b)
+        for key in items:  # O(n) - хеши каждого ключа считаются один раз
+            bucket, f1, f2 = self._hashes(key)
+            buckets[bucket].append((f1, f2, key))
+        
+        self.displacements = array('Q', bytes(8 * self.bucket_count))  # O(b) - 8 байт на корзину
+        self.keys = [None] * n  # O(n) - для проверки, что ключ из набора
+        self.values = [None] * n  # O(n)
+        taken = bytearray(n)  # O(n)
+        order = sorted(range(self.bucket_count), key=lambda b: -len(buckets[b]))  # O(b log b)
+        free = None
+        # Большие корзины размещаются первыми, пока свободных ячеек много
+        for index in order:
+            entries = buckets[index]
+            if not entries:
+                break
+            if len(entries) == 1:
+                # Корзина из одного ключа занимает любую свободную ячейку s: d0 = 0, d1 = s - f1
+                if free is None:
+                    free = iter([s for s in range(n) if not taken[s]])  # O(n) - один раз
+                slot = next(free)
+                f1, f2, key = entries[0]
+                d, slots = (slot - f1) % n, [slot]
+            else:
+                slots = self._place(entries, taken)  # O(1) в среднем для маленьких корзин
+                if slots is None:
+                    return False
+                d, slots = slots
+            self.displacements[index] = d
+            for slot, (f1, f2, key) in zip(slots, entries):
+                taken[slot] = 1
+                self.keys[slot] = key
+                self.values[slot] = items[key]
+        return True
+    
+    def _place(self, entries: list, taken: bytearray) -> tuple:
+        """Смещение d и ячейки для корзины из нескольких ключей или None"""
+        n = self.n
+        for d0 in range(n):
+            bases = [(f1 + d0 * f2) % n for f1, f2, key in entries]  # O(k)
+            if len(set(bases)) < len(bases):
+                continue  # сдвиг d1 не устраняет совпадения внутри корзины
+            first = bases[0]
+            for d1 in range(n):  # O(1) в среднем: быстрый отказ по ячейке первого ключа
+                if taken[(first + d1) % n]:
+                    continue
+                slots = [(b + d1) % n for b in bases]
+                if not any(taken[s] for s in slots):
+                    return d0 * n + d1, slots
+        return None
+    
+    def index(self, key: str) -> int:
+        """Ячейка ключа (для ключа не из набора - произвольная ячейка)"""
+        bucket, f1, f2 = self._hashes(key)  # O(k)
+        d0, d1 = divmod(self.displacements[bucket], self.n)  # O(1)
+        return (f1 + d0 * f2 + d1) % self.n
+    
+    def get(self, key: str):
+        """Получение значения по ключу за одну пробу"""
+        if not self.n:
+            return None
+        slot = self.index(key)  # O(1)
+        return self.values[slot] if self.keys[slot] == key else None
+    
+    def __contains__(self, key: str) -> bool:
+        """Проверка принадлежности ключа набору"""
+        return self.n > 0 and self.keys[self.index(key)] == key  # O(1)
+    
+    def load_factor(self) -> float:
+        """Коэффициент заполнения (минимальная функция - все ячейки заняты)"""
+        return 1.0  # O(1)
+    
+    def __len__(self) -> int:
+        """Число ключей"""
+        return self.n  # O(1)
\ No newline at end of file
@@ -1,12 +1,51 @@
+import gc
+import os
+import sys
 import time
 import random
 import string
+import threading
+import tempfile
+import tracemalloc
+from hash_functions import simple_hash, polynomial_hash, fnv1a_hash, fast_polynomial_hash, make_seeded_hash
 from hash_table_chaining import HashTableChaining
+from hash_table_open_addressing import HashTableOpenAddressing
+from compact_hash_table import CompactHashTable
+from disk_hash_table import DiskHashTable, DiskHashTableWriter, compact
+from concurrent_hash_table import ConcurrentHashTable, LockedHashTable
+from cuckoo_hash_table import CuckooHashTable, BUCKET_SLOTS
+from perfect_hash import PerfectHashTable
 
 def generate_random_key(length: int = 5) -> str:
     """Генерация случайного ключа"""
     return ''.join(random.choices(string.ascii_letters, k=length))  # O(k)
 
+def benchmark_table(ht, keys: list, missing_keys: list) -> dict:
+    """Суммарное время (мс) пакетов операций над таблицей"""
+    results = {}
+    
+    start = time.perf_counter()
+    for i, key in enumerate(keys):  # O(n) вставок
+        ht.insert(key, i)
+    results["insert"] = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    for key in keys:  # O(n) успешных поисков
+        ht.get(key)
+    results["hit"] = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    for key in missing_keys:  # O(n) неуспешных поисков
+        ht.get(key)
+    results["miss"] = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    for key in keys[::2]:  # O(n/2) удалений
+        ht.remove(key)
+    results["remove"] = (time.perf_counter() - start) * 1000
+    return results
+
+
 def measure_performance():
     """Измерение производительности хеш-таблицы"""
     # Создаем хеш-таблицу
@@ -64,6 +103,7 @@ def measure_performance():
     print("Дополнительная статистика:")
     
     # Считаем количество коллизий
+    ht.finish_rehash()  # статистика по одной (основной) таблице
     collisions = 0
     max_chain_length = 0
     for bucket in ht.table:
@@ -75,4 +115,288 @@ def measure_performance():
     
     print(f"Общее количество коллизий: {collisions}")
     print(f"Максимальная длина цепочки: {max_chain_length}")
-    print(f"Коэффициент заполнения: {1000 / ht.size:.2f}")
\ No newline at end of file
+    print(f"Размер таблицы после роста: {ht.size}")
+    print(f"Коэффициент заполнения: {ht.load_factor():.2f}")
+    
+    # Сравнение метода цепочек с открытой адресацией
+    print("\n" + "=" * 40)
+    print("Метод цепочек против открытой адресации:")
+    n = 20000
+    keys = list({generate_random_key(8) for _ in range(n)})
+    missing_keys = [generate_random_key(9) for _ in range(len(keys))]
+    engines = {
+        "Цепочки": HashTableChaining(size=len(keys), hash_func=fast_polynomial_hash),
+        "Откр. адресация": HashTableOpenAddressing(hash_func=fast_polynomial_hash),  # растет от начального размера
+    }
+    print(f"{'Таблица':<18} {'Вставка':<10} {'Поиск+':<10} {'Поиск-':<10} {'Удаление':<10} (мс на {len(keys)} операций)")
+    for name, table in engines.items():
+        r = benchmark_table(table, keys, missing_keys)
+        print(f"{name:<18} {r['insert']:<10.2f} {r['hit']:<10.2f} {r['miss']:<10.2f} {r['remove']:<10.2f}")
+    oa_table = engines["Откр. адресация"]
+    print(f"Открытая адресация: {oa_table.size} ячеек, средняя длина пробирования {oa_table.average_probe_length():.2f}")
+    
+    # Пакетные операции против цикла одиночных вызовов
+    print("\n" + "=" * 40)
+    n = 100000
+    print(f"Пакетные операции ({n} ключей, мкс на ключ):")
+    keys = [f"user_{i:07d}" for i in range(n)]
+    items = [(key, i) for i, key in enumerate(keys)]
+    single, batch = HashTableChaining(hash_func=fast_polynomial_hash), HashTableChaining(hash_func=fast_polynomial_hash)
+    timings = {}
+    
+    start = time.perf_counter()
+    for key, value in items:  # O(n) вызовов insert с постепенным ростом
+        single.insert(key, value)
+    single.finish_rehash()
+    timings["Вставка"] = [time.perf_counter() - start]
+    start = time.perf_counter()
+    batch.insert_many(items)  # O(n) - один рост под весь пакет
+    timings["Вставка"].append(time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    for key in keys:
+        single.get(key)
+    timings["Поиск"] = [time.perf_counter() - start]
+    start = time.perf_counter()
+    batch.get_many(keys)
+    timings["Поиск"].append(time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    for key in keys:
+        single.remove(key)
+    timings["Удаление"] = [time.perf_counter() - start]
+    start = time.perf_counter()
+    batch.remove_many(keys)
+    timings["Удаление"].append(time.perf_counter() - start)
+    
+    print(f"{'Операция':<10} {'По одному':<11} {'Пакетом':<9} {'Ускорение':<9}")
+    for name, (one, many) in timings.items():
+        print(f"{name:<10} {one / n * 1e6:<11.3f} {many / n * 1e6:<9.3f} {one / many:<9.2f}")
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """Перцентиль p (0-100) отсортированного списка"""
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))
+    return sorted_values[index]
+
+
+def measure_resize_latency(n: int = 100000):
+    """Задержки вставки во время роста таблицы: разовое и постепенное перехеширование"""
+    print("\n" + "=" * 40)
+    print(f"Задержки вставки при росте таблицы ({n} вставок, начальный размер 10):")
+    keys = [generate_random_key(random.randint(4, 40)) for _ in range(n)]
+    
+    print(f"{'Перехеширование':<16} {'p50 (мкс)':<11} {'p99 (мкс)':<11} {'p99.9 (мкс)':<13} {'Макс (мкс)':<12} {'Всего (мс)':<10}")
+    for name, incremental in (("Разовое", False), ("Постепенное", True)):
+        ht = HashTableChaining(size=10, incremental=incremental, hash_func=fast_polynomial_hash)
+        latencies = []
+        gc.disable()  # как в timeit: паузы сборщика мусора не относятся к таблице
+        for i, key in enumerate(keys):
+            start = time.perf_counter()
+            ht.insert(key, i)
+            latencies.append((time.perf_counter() - start) * 1_000_000)  # мкс
+        gc.enable()
+        total = sum(latencies) / 1000
+        latencies.sort()
+        print(f"{name:<16} {percentile(latencies, 50):<11.2f} {percentile(latencies, 99):<11.2f} "
+              f"{percentile(latencies, 99.9):<13.2f} {latencies[-1]:<12.2f} {total:<10.2f}")
+
+
+def generate_key_sets(n: int) -> dict:
+    """Наборы ключей, похожие на реальные данные"""
+    resources = ["users", "orders", "items", "sessions", "payments"]
+    names = ["ivan", "petr", "anna", "olga", "sergey", "maria", "alex", "elena"]
+    letters = list("abcdefghij")
+    anagrams = set()
+    while len(anagrams) < n:  # перестановки одних и тех же букв
+        random.shuffle(letters)
+        anagrams.add("".join(letters))
+    return {
+        "Случайные строки": list({generate_random_key(8) for _ in range(n)}),
+        "Последовательные ID": [f"user_{i:07d}" for i in range(n)],
+        "URL": [f"/api/v1/{resources[i % 5]}/{i}/details" for i in range(n)],
+        "Email": [f"{names[i % 8]}.{names[i // 8 % 8]}{i}@example.com" for i in range(n)],
+        "Анаграммы": list(anagrams),
+    }
+
+
+def compare_hash_functions(n: int = 20000):
+    """Доля коллизий и скорость хеш-функций на разных наборах ключей"""
+    print("\n" + "=" * 40)
+    print(f"Сравнение хеш-функций ({n} ключей, {n} ячеек):")
+    functions = {
+        "simple_hash": simple_hash,
+        "polynomial_hash": polynomial_hash,
+        "fnv1a_hash": fnv1a_hash,
+        "fast_polynomial": fast_polynomial_hash,
+        "seeded (BLAKE2b)": make_seeded_hash(),
+    }
+    
+    for set_name, keys in generate_key_sets(n).items():
+        m = len(keys)
+        # Ожидаемое число коллизий для идеально равномерной функции
+        expected = m - m * (1 - (1 - 1 / m) ** m)
+        print(f"\n{set_name} (ожидаемых коллизий при равномерном хеше: {expected:.0f})")
+        print(f"{'Функция':<18} {'Ключей/мкс':<12} {'Коллизий':<10} {'Относ. ожидаемого':<18} {'Макс. цепочка':<14}")
+        for name, func in functions.items():
+            start = time.perf_counter()
+            hashes = [func(key) for key in keys]
+            elapsed = time.perf_counter() - start
+            
+            counts = {}
+            for h in hashes:
+                counts[h % m] = counts.get(h % m, 0) + 1
+            collisions = m - len(counts)
+            print(f"{name:<18} {m / elapsed / 1_000_000:<12.3f} {collisions:<10} "
+                  f"{collisions / expected:<18.2f} {max(counts.values()):<14}")
+
+
+def measure_memory(n: int = 100000):
+    """Байты на элемент: таблицы с объектами Python против компактной таблицы"""
+    print("\n" + "=" * 40)
+    print(f"Память на элемент ({n} коротких ключей, целые значения):")
+    keys = [f"user_{i:07d}" for i in range(n)]
+    # Строки ключей созданы заранее и не попадают в замер: их добавляем отдельно,
+    # потому что таблицы с объектами хранят ссылки на них, а компактная копирует байты
+    key_bytes = sum(sys.getsizeof(key) for key in keys)
+    engines = {
+        "dict": dict,
+        "Цепочки": lambda: HashTableChaining(hash_func=fast_polynomial_hash),
+        "Откр. адресация": lambda: HashTableOpenAddressing(hash_func=fast_polynomial_hash),
+        "Компактная": CompactHashTable,
+    }
+    print(f"{'Таблица':<18} {'Структура':<11} {'С ключами':<11} (байт на элемент)")
+    for name, engine in engines.items():
+        gc.collect()
+        tracemalloc.start()
+        table = engine()
+        if isinstance(table, dict):
+            for i, key in enumerate(keys):
+                table[key] = i + 1000  # значения вне кэша малых int
+        else:
+            for i, key in enumerate(keys):
+                table.insert(key, i + 1000)
+        if isinstance(table, HashTableChaining):
+            table.finish_rehash()
+        structure, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        with_keys = structure if isinstance(table, CompactHashTable) else structure + key_bytes
+        print(f"{name:<18} {structure / n:<11.1f} {with_keys / n:<11.1f}")
+        del table
+
+
+def measure_disk_table(n: int = 100000):
+    """Файловая хеш-таблица: построение, открытие, поиск и сжатие"""
+    print("\n" + "=" * 40)
+    print(f"Файловая хеш-таблица ({n} ключей):")
+    items = [(f"user_{i:07d}", f"profile-{i}") for i in range(n)]
+    lookups = random.sample([key for key, _ in items], min(n, 20000))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.db")
+        start = time.perf_counter()
+        DiskHashTable.build(path, items)  # O(n) - заранее, вне запуска сервиса
+        print(f"Построение файла: {(time.perf_counter() - start) * 1000:.1f} мс")
+        
+        # Запуск сервиса: перестроение таблицы в памяти против открытия файла
+        start = time.perf_counter()
+        ht = HashTableChaining(hash_func=fast_polynomial_hash)
+        ht.insert_many(items)
+        print(f"Перестроение HashTableChaining: {(time.perf_counter() - start) * 1000:.1f} мс")
+        start = time.perf_counter()
+        table = DiskHashTable(path)
+        print(f"Открытие файла (mmap): {(time.perf_counter() - start) * 1000:.3f} мс")
+        
+        for name, lookup in (("HashTableChaining", ht.get), ("Файл (mmap)", table.get)):
+            start = time.perf_counter()
+            for key in lookups:
+                lookup(key)
+            print(f"Поиск, {name}: {(time.perf_counter() - start) / len(lookups) * 1e6:.2f} мкс")
+        table.close()
+        
+        # Обновление половины ключей дописывает записи, сжатие их убирает
+        with DiskHashTableWriter(path) as writer:
+            for key, value in items[::2]:
+                writer.put(key, value + "-v2")
+        print(f"Размер файла после обновлений: {os.path.getsize(path) / 1024:.0f} КБ")
+        start = time.perf_counter()
+        compact(path)
+        print(f"Сжатие: {(time.perf_counter() - start) * 1000:.1f} мс, "
+              f"размер {os.path.getsize(path) / 1024:.0f} КБ")
+
+
+def run_mixed_workload(table, keys: list, threads: int, operations: int, read_ratio: float) -> float:
+    """Смешанные чтения и записи из нескольких потоков, возвращает операций в секунду"""
+    per_thread = operations // threads
+    
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(per_thread):
+            key = keys[rng.randrange(len(keys))]
+            if rng.random() < read_ratio:
+                table.get(key)
+            else:
+                table.insert(key, seed)
+    
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def measure_concurrency(operations: int = 100000):
+    """Пропускная способность общей блокировки и разделенных блокировок по числу потоков"""
+    print("\n" + "=" * 40)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Конкурентный доступ ({operations} операций, GIL {'включен' if gil else 'выключен'}):")
+    keys = [f"user_{i:07d}" for i in range(10000)]
+    for read_ratio in (0.5, 0.9, 0.99):
+        print(f"\nЧтений {read_ratio:.0%}")
+        print(f"{'Потоков':<9} {'Общая блокировка (оп/с)':<25} {'Разделенные (оп/с)':<20}")
+        for threads in (1, 2, 4, 8, 16):
+            locked = LockedHashTable(HashTableChaining(size=len(keys), hash_func=fast_polynomial_hash))
+            striped = ConcurrentHashTable(size=len(keys))
+            for i, key in enumerate(keys):
+                locked.insert(key, i)
+                striped.insert(key, i)
+            print(f"{threads:<9} {run_mixed_workload(locked, keys, threads, operations, read_ratio):<25.0f} "
+                  f"{run_mixed_workload(striped, keys, threads, operations, read_ratio):<20.0f}")
+
+
+def measure_static_lookup(n: int = 100000):
+    """Задержка поиска: цепочки при высоком заполнении, кукушкина таблица и совершенный хеш"""
+    print("\n" + "=" * 40)
+    print(f"Поиск в статическом наборе ({n} ключей, у всех таблиц хеш BLAKE2b):")
+    items = [(f"route_{i:07d}", i) for i in range(n)]
+    lookups = [key for key, _ in random.sample(items, min(n, 50000))]
+    engines = {}
+    for alpha in (1, 2, 4):
+        # Размер фиксирован: коэффициент заполнения alpha без роста
+        ht = HashTableChaining(size=n // alpha, max_load_factor=alpha, hash_func=make_seeded_hash())
+        engines[f"Цепочки, заполнение {alpha}"] = (ht, lambda ht=ht: ht.insert_many(items))
+    cuckoo = CuckooHashTable(size=n, max_load_factor=0.95)
+    engines["Кукушкина таблица"] = (cuckoo, lambda: [cuckoo.insert(key, value) for key, value in items])
+    engines["Совершенный хеш (CHD)"] = (None, lambda: PerfectHashTable(items))
+    
+    print(f"{'Таблица':<26} {'Заполнение':<12} {'Построение (мс)':<17} {'Поиск (мкс)':<13} {'Худший поиск (сравнений)':<10}")
+    for name, (table, build) in engines.items():
+        start = time.perf_counter()
+        result = build()
+        build_time = (time.perf_counter() - start) * 1000
+        table = table or result
+        lookup_time = float("inf")
+        for _ in range(3):  # лучший из трех проходов - меньше шума
+            start = time.perf_counter()
+            for key in lookups:
+                table.get(key)
+            lookup_time = min(lookup_time, (time.perf_counter() - start) / len(lookups) * 1e6)
+        if isinstance(table, HashTableChaining):
+            worst = max(len(bucket) for bucket in table.table)  # самая длинная цепочка
+        elif isinstance(table, CuckooHashTable):
+            worst = 2 * BUCKET_SLOTS  # две корзины
+        else:
+            worst = 1  # одна ячейка
+        print(f"{name:<26} {table.load_factor():<12.2f} {build_time:<17.1f} {lookup_time:<13.2f} {worst:<10}")
\ No newline at end of file
@@ -1,3 +1,18 @@
+from hash_table_chaining import HashTableChaining
+from hash_table_open_addressing import HashTableOpenAddressing
+from compact_hash_table import CompactHashTable
+from disk_hash_table import DiskHashTable, DiskHashTableWriter, compact
+from concurrent_hash_table import ConcurrentHashTable
+from cuckoo_hash_table import CuckooHashTable
+from perfect_hash import PerfectHashTable
+import os
+import tempfile
+import threading
+from hash_functions import simple_hash, fnv1a_hash, fast_polynomial_hash, polynomial_hash_bytes, make_seeded_hash
+import hash_analysis
+from hash_analysis import analyze_distribution, avalanche, bucket_counts
+
+
 def test_hash_table():
     """Тестирование хеш-таблицы"""
     ht = HashTableChaining(size=5)
@@ -41,5 +56,310 @@ def test_hash_table():
     
     print("\nВсе тесты пройдены успешно!")
 
+
+def test_resizing():
+    """Тестирование роста таблицы и постепенного перехеширования"""
+    for incremental in (True, False):
+        ht = HashTableChaining(size=4, incremental=incremental)
+        
+        for i in range(500):
+            ht.insert(f"key{i}", i)
+            # Во время переноса цепочек все ключи должны оставаться доступными
+            if i % 50 == 0:
+                assert all(ht.get(f"key{j}") == j for j in range(i + 1))
+        
+        assert len(ht) == 500
+        assert ht.load_factor() <= ht.max_load_factor
+        for i in range(0, 500, 3):
+            assert ht.remove(f"key{i}") == True
+        ht.finish_rehash()
+        assert not ht.is_rehashing()
+        assert ht.size >= 256
+        assert sum(len(bucket) for bucket in ht.table) == len(ht)
+        assert all(ht.get(f"key{i}") == (None if i % 3 == 0 else i) for i in range(500))
+    print("✓ Рост таблицы работает")
+
+
+def test_batch_operations():
+    """Тестирование пакетных операций"""
+    ht = HashTableChaining(size=4)
+    for i in range(10):
+        ht.insert(f"key{i}", i)
+    assert ht.is_rehashing() or ht.size > 4
+    
+    # Обновление существующих ключей, новые ключи и повтор ключа внутри пакета
+    ht.insert_many([(f"key{i}", -i) for i in range(5, 300)] + [("key7", "last")])
+    assert len(ht) == 300
+    assert ht.load_factor() <= ht.max_load_factor
+    assert ht.get_many(["key3", "key7", "key299", "missing"]) == [3, "last", -299, None]
+    
+    assert ht.remove_many(["key0", "missing", "key0", "key250"]) == [True, False, False, True]
+    assert len(ht) == 298
+    assert ht.get("key0") is None and ht.get("key1") == 1
+    ht.insert("key0", 0)  # одиночные операции после пакетных
+    assert ht.get_many(["key0"]) == [0]
+    
+    # Пакет во время постепенного перехеширования не завершает перенос принудительно
+    ht = HashTableChaining(size=64)
+    for i in range(65):
+        ht.insert(f"key{i}", i)
+    assert ht.is_rehashing()
+    assert ht.get_many(["key1", "key64", "missing"]) == [1, 64, None]
+    assert ht.remove_many(["key2", "missing"]) == [True, False]
+    ht.insert_many([("key3", "new"), ("extra", 1)])
+    assert ht.is_rehashing() and ht._rehash_index < 64
+    assert len(ht) == 65
+    assert ht.get_many(["key3", "extra", "key2", "key60"]) == ["new", 1, None, 60]
+    ht.finish_rehash()
+    assert sum(len(bucket) for bucket in ht.table) == len(ht)
+    print("✓ Пакетные операции работают")
+
+
+def test_hash_functions():
+    """Тестирование хеш-функций и передачи функции в таблицу"""
+    # Эталонные значения FNV-1a (64 бит)
+    assert fnv1a_hash("") == 0xCBF29CE484222325
+    assert fnv1a_hash("a") == 0xAF63DC4C8601EC8C
+    
+    # Анаграммы различаются, в отличие от simple_hash
+    assert fast_polynomial_hash("listen") != fast_polynomial_hash("silent")
+    assert fast_polynomial_hash("ab") != fast_polynomial_hash("ab\x00")  # учитывается длина
+    # Слова читаются как little-endian: значение одинаково на любой платформе
+    assert polynomial_hash_bytes(b"hello, world!") == 0x104FACBBBF36E1DE
+    long_key = "очень длинный ключ " * 10
+    assert fast_polynomial_hash(long_key) == fast_polynomial_hash(long_key)
+    
+    seeded_a = make_seeded_hash(b"seed-a")
+    seeded_b = make_seeded_hash(b"seed-b")
+    assert seeded_a("key") == make_seeded_hash(b"seed-a")("key")
+    assert seeded_a("key") != seeded_b("key")
+    
+    for func in (fnv1a_hash, fast_polynomial_hash, make_seeded_hash()):
+        ht = HashTableChaining(size=4, hash_func=func)
+        oa = HashTableOpenAddressing(hash_func=func)
+        for i in range(200):
+            ht.insert(f"key{i}", i)
+            oa.insert(f"key{i}", i)
+        assert all(ht.get(f"key{i}") == i and oa.get(f"key{i}") == i for i in range(200))
+    print("✓ Хеш-функции работают")
+
+
+def test_hash_analysis():
+    """Тестирование анализатора качества хеш-функций"""
+    # По одному ключу в половине ячеек
+    report = analyze_distribution(list(range(100)), 200)
+    assert report["chi_squared"] == 200 * 0.5 ** 2 / 0.5  # каждая ячейка отклоняется на 0.5
+    assert report["max_chain"] == 1 and report["histogram"][:2] == [100, 100]
+    assert report["linear_hit_probes"] == 1.0
+    
+    # Все ключи в одной ячейке: цепочка из n ключей, линейное пробирование 1 + (n - 1) / 2
+    report = analyze_distribution([7] * 10, 100)
+    assert report["max_chain"] == 10 and report["histogram"][-1] == 1
+    assert report["chaining_hit_probes"] == 5.5
+    assert report["linear_hit_probes"] == 5.5
+    
+    # Кластер, переходящий через конец таблицы: ключи в ячейках 9, 0, 1 и 2
+    report = analyze_distribution([9, 9, 9, 0], 10)
+    assert report["linear_hit_probes"] == 1 + (0 + 1 + 2 + 2) / 4
+    
+    keys = [f"key{i}" for i in range(200)]
+    assert avalanche(simple_hash, keys)["score"] < 0.3
+    assert abs(avalanche(make_seeded_hash(), keys)["score"] - 0.5) < 0.05
+    
+    # Отрицательные хеши (встроенный hash()) дают одинаковый результат с numpy и без него
+    with_numpy = (list(bucket_counts([-1, -5, 3], 7)), avalanche(hash, keys, samples=50))
+    saved_np, hash_analysis.np = hash_analysis.np, None
+    try:
+        without_numpy = (bucket_counts([-1, -5, 3], 7), avalanche(hash, keys, samples=50))
+    finally:
+        hash_analysis.np = saved_np
+    assert with_numpy[0] == without_numpy[0] == [0, 0, 1, 1, 0, 0, 1]
+    assert with_numpy[1]["output_bits"] == without_numpy[1]["output_bits"] == 64
+    assert abs(with_numpy[1]["score"] - without_numpy[1]["score"]) < 0.05
+    print("✓ Анализатор хеш-функций работает")
+
+
+def test_compact_table():
+    """Тестирование компактной хеш-таблицы"""
+    ht = CompactHashTable()
+    for i in range(1000):
+        ht.insert(f"key{i}", i)
+    ht.insert("ключ", -2 ** 63)  # не-ASCII ключ и граница int64
+    ht.insert(b"raw", 7)  # ключ-байты
+    assert len(ht) == 1002
+    assert ht.get("key999") == 999 and ht.get("ключ") == -2 ** 63 and ht.get("raw") == 7
+    assert ht.get("key1000") is None
+    
+    ht.insert("key5", 5000)  # обновление
+    assert ht.get("key5") == 5000 and len(ht) == 1002
+    ht.insert("key5", 5)
+    for i in range(0, 1000, 2):
+        assert ht.remove(f"key{i}") == True
+    assert ht.remove("key0") == False
+    for i in range(1000, 3000):  # рост с уплотнением удаленных записей
+        ht.insert(f"key{i}", i)
+    assert len(ht) == len(ht.hashes) - (len(ht.alive) - sum(ht.alive))
+    assert all(ht.get(f"key{i}") == (None if i % 2 == 0 and i < 1000 else i) for i in range(3000))
+    assert sorted(ht.keys())[:2] == ["key1", "key1000"]
+    
+    try:
+        ht.insert("float", 1.5)  # значения - только целые
+        assert False
+    except TypeError:
+        assert ht.get("float") is None
+    print("✓ Компактная таблица работает")
+
+
+def test_disk_table():
+    """Тестирование файловой хеш-таблицы"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.db")
+        DiskHashTable.build(path, [(f"key{i}", f"value{i}") for i in range(100)] + [("key1", "new")])
+        with DiskHashTable(path) as table:
+            assert len(table) == 100
+            assert table.get("key5") == b"value5" and table.get("key1") == b"new"
+            assert table.get("missing") is None and "key99" in table
+        
+        # Дозапись: обновление, удаление и новые ключи
+        with DiskHashTableWriter(path) as writer:
+            writer.put("key5", b"\x00\xff")
+            writer.remove("key6")
+            writer.remove("missing")
+            writer.put("ключ", "значение")
+        size = os.path.getsize(path)
+        with DiskHashTable(path) as table:
+            assert len(table) == 100
+            assert table.get("key5") == b"\x00\xff" and table.get("key6") is None
+            assert table.get("ключ") == "значение".encode()
+            expected = dict(table.items())
+        
+        compact(path)
+        assert os.path.getsize(path) < size
+        with DiskHashTable(path) as table:
+            assert dict(table.items()) == expected and len(table) == 100
+        
+        # Запись в новый файл без построения
+        with DiskHashTableWriter(os.path.join(directory, "new.db"), bucket_count=4) as writer:
+            for i in range(50):
+                writer.put(str(i), str(i * i))
+        with DiskHashTable(os.path.join(directory, "new.db")) as table:
+            assert len(table) == 50 and table.get("7") == b"49"
+        
+        # Падение процесса без flush(): данные уже у ОС, заголовок не переписан при закрытии
+        writer = DiskHashTableWriter(os.path.join(directory, "new.db"))
+        writer.put("after", "crash")
+        writer.remove("7")
+        writer.file.close()
+        with DiskHashTableWriter(os.path.join(directory, "new.db")) as writer:
+            writer.put("next", "write")  # не должна затереть записи, на которые ссылается каталог
+        with DiskHashTable(os.path.join(directory, "new.db")) as table:
+            assert table.get("after") == b"crash" and table.get("next") == b"write"
+            assert table.get("7") is None and table.get("8") == b"64" and len(table) == 51
+    print("✓ Файловая таблица работает")
+
+
+def test_concurrent_table():
+    """Тестирование потокобезопасной хеш-таблицы"""
+    ht = ConcurrentHashTable(size=4, stripes=4)
+    errors = []
+    
+    def writer(thread):
+        # Каждый поток пишет свои ключи, таблица растет во время записи
+        for i in range(2000):
+            ht.insert(f"t{thread}-{i}", i)
+            if i % 3 == 0:
+                ht.remove(f"t{thread}-{i}")
+    
+    def reader():
+        for _ in range(2000):
+            value = ht.get("t0-1")
+            if value not in (None, 1):
+                errors.append(value)
+    
+    threads = [threading.Thread(target=writer, args=(t,)) for t in range(8)]
+    threads += [threading.Thread(target=reader) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    assert not errors
+    assert len(ht) == 8 * (2000 - 667)
+    assert len(ht.table) % len(ht.locks) == 0 and len(ht.table) > 4
+    assert sum(len(bucket) for bucket in ht.table) == len(ht)
+    assert all(ht.get(f"t{t}-{i}") == (None if i % 3 == 0 else i) for t in range(8) for i in range(2000))
+    ht.insert("t0-1", "new")
+    assert ht.get("t0-1") == "new" and ht.get("missing", 0) == 0
+    print("✓ Потокобезопасная таблица работает")
+
+
+def test_cuckoo_and_perfect_hash():
+    """Тестирование кукушкиной таблицы и совершенного хеша"""
+    ht = CuckooHashTable(max_load_factor=0.95)
+    for i in range(3000):
+        ht.insert(f"key{i}", i)
+    assert len(ht) == 3000 and ht.load_factor() <= 0.95
+    ht.insert("key7", "new")
+    assert ht.get("key7") == "new" and ht.get("key2999") == 2999 and ht.get("missing") is None
+    for i in range(0, 3000, 2):
+        assert ht.remove(f"key{i}") == True
+    assert ht.remove("key0") == False and len(ht) == 1500
+    assert all(ht.get(f"key{i}") == (None if i % 2 == 0 else i) for i in range(1, 3000) if i != 7)
+    
+    items = [(f"route{i}", i * 10) for i in range(2000)]
+    ph = PerfectHashTable(items)
+    assert len(ph) == 2000
+    assert sorted(ph.index(key) for key, _ in items) == list(range(2000))  # минимальная и совершенная
+    assert all(ph.get(key) == value for key, value in items)
+    assert ph.get("route2000") is None and "route5" in ph and "other" not in ph
+    assert PerfectHashTable([]).get("x") is None
+    print("✓ Кукушкина таблица и совершенный хеш работают")
+
+
+def test_open_addressing():
+    """Тестирование хеш-таблицы с открытой адресацией"""
+    ht = HashTableOpenAddressing()
+    
+    # Тест 1: Тот же интерфейс, что у HashTableChaining
+    print("Тест 1: Вставка, обновление, удаление")
+    ht.insert("apple", 10)
+    ht.insert("banana", 20)
+    ht.insert("apple", 100)
+    assert ht.get("apple") == 100
+    assert ht.get("banana") == 20
+    assert ht.get("cherry") is None
+    assert ht.remove("banana") == True
+    assert ht.remove("banana") == False
+    assert ht.get("banana") is None
+    assert len(ht) == 1
+    print("✓ Тест 1 пройден")
+    
+    # Тест 2: Рост таблицы и повторное использование удаленных ячеек
+    print("\nТест 2: Рост таблицы и tombstone")
+    for i in range(1000):
+        ht.insert(f"key{i}", i)
+    for i in range(0, 1000, 2):
+        assert ht.remove(f"key{i}")
+    for i in range(1000):
+        assert ht.get(f"key{i}") == (None if i % 2 == 0 else i)
+    for i in range(0, 1000, 2):
+        ht.insert(f"key{i}", -i)
+    assert all(ht.get(f"key{i}") == (-i if i % 2 == 0 else i) for i in range(1000))
+    assert len(ht) == 1001
+    assert ht.used < ht.size  # всегда остаются пустые ячейки
+    print("✓ Тест 2 пройден")
+    
+    print("\nВсе тесты открытой адресации пройдены успешно!")
+
+
 if __name__ == "__main__":
-    test_hash_table()
\ No newline at end of file
+    test_hash_table()
+    test_resizing()
+    test_batch_operations()
+    test_hash_functions()
+    test_hash_analysis()
+    test_compact_table()
+    test_disk_table()
+    test_concurrent_table()
+    test_cuckoo_and_perfect_hash()
+    test_open_addressing()
\ No newline at end of file
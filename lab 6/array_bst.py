@@ -0,0 +1,154 @@
+from array import array
+
+NIL = -1  # индекс "пустой ссылки"
+
+
+class ArrayBST:
+    """Бинарное дерево поиска в виде структуры массивов (struct-of-arrays)
+    
+    Узел - это индекс i: значение values[i], дети left[i] и right[i] (NIL - нет
+    ребенка). Три плоских массива array по 8 байт на узел вместо объекта
+    TreeNode. Удаленные ячейки связываются через left в список свободных
+    и переиспользуются при вставке.
+    """
+    
+    def __init__(self, typecode: str = 'q'):
+        self.values = array(typecode)  # O(1) - 'q': 64-битные целые без объектов int
+        self.left = array('q')  # O(1) - индексы левых детей
+        self.right = array('q')  # O(1) - индексы правых детей
+        self.root = NIL  # O(1)
+        self.free = NIL  # O(1) - голова списка свободных ячеек
+        self.size = 0  # O(1)
+    
+    @classmethod
+    def from_sorted(cls, values, typecode: str = 'q') -> "ArrayBST":
+        """Сбалансированное дерево из отсортированных значений за O(n): ячейка i хранит i-е значение"""
+        tree = cls(typecode)  # O(1)
+        keys = tree.values
+        for value in values:  # O(n) - повторы пропускаются
+            if not keys or value > keys[-1]:
+                keys.append(value)
+            elif value < keys[-1]:
+                raise ValueError("Значения должны быть отсортированы")
+        n = len(keys)
+        left = array('q', [NIL]) * n  # O(n)
+        right = array('q', [NIL]) * n
+        
+        # Корень отрезка - его середина; явный стек отрезков глубиной O(log n)
+        stack = [(0, n)] if n else []
+        while stack:  # O(n)
+            low, high = stack.pop()
+            middle = (low + high) // 2
+            if low < middle:
+                left[middle] = (low + middle) // 2
+                stack.append((low, middle))
+            if middle + 1 < high:
+                right[middle] = (middle + 1 + high) // 2
+                stack.append((middle + 1, high))
+        tree.left, tree.right = left, right
+        tree.root = n // 2 if n else NIL
+        tree.size = n
+        return tree
+    
+    def _allocate(self, value) -> int:
+        """Ячейка под новый узел: из списка свободных или в конце массивов"""
+        index = self.free
+        if index == NIL:
+            self.values.append(value)  # O(1) амортизированно
+            self.left.append(NIL)
+            self.right.append(NIL)
+            return len(self.values) - 1
+        self.free = self.left[index]  # O(1)
+        self.values[index] = value
+        self.left[index] = self.right[index] = NIL
+        return index
+    
+    def insert(self, value: int) -> None:
+        """Вставка значения в дерево (итеративная версия)"""
+        values, left, right = self.values, self.left, self.right  # O(1) - локальные ссылки в цикле
+        if self.root == NIL:
+            self.root = self._allocate(value)
+            self.size = 1
+            return
+        current = self.root
+        while True:  # O(h)
+            if value < values[current]:
+                if left[current] == NIL:
+                    left[current] = self._allocate(value)
+                    break
+                current = left[current]
+            elif value > values[current]:
+                if right[current] == NIL:
+                    right[current] = self._allocate(value)
+                    break
+                current = right[current]
+            else:
+                return  # Значение уже существует
+        self.size += 1
+    
+    def search(self, value: int) -> bool:
+        """Поиск значения в дереве"""
+        values, left, right = self.values, self.left, self.right
+        current = self.root
+        while current != NIL:  # O(h)
+            node_value = values[current]
+            if value == node_value:
+                return True
+            current = left[current] if value < node_value else right[current]
+        return False
+    
+    def delete(self, value: int) -> bool:
+        """Удаление значения, ячейка узла уходит в список свободных"""
+        values, left, right = self.values, self.left, self.right
+        parent, current = NIL, self.root
+        while current != NIL and values[current] != value:  # O(h)
+            parent = current
+            current = left[current] if value < values[current] else right[current]
+        if current == NIL:
+            return False
+        
+        if left[current] != NIL and right[current] != NIL:
+            # Два ребенка: значение заменяется преемником, удаляется ячейка преемника
+            parent, successor = current, right[current]
+            while left[successor] != NIL:  # O(h)
+                parent, successor = successor, left[successor]
+            values[current] = values[successor]
+            current = successor
+        
+        child = left[current] if left[current] != NIL else right[current]  # O(1) - не больше одного ребенка
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == current:
+            left[parent] = child
+        else:
+            right[parent] = child
+        left[current] = self.free  # O(1) - ячейка в список свободных
+        self.free = current
+        self.size -= 1
+        return True
+    
+    def __iter__(self):
+        """Ленивый in-order обход с явным стеком"""
+        values, left, right = self.values, self.left, self.right
+        stack = []  # O(h)
+        current = self.root
+        while stack or current != NIL:  # O(n)
+            if current != NIL:
+                stack.append(current)
+                current = left[current]
+            else:
+                current = stack.pop()
+                yield values[current]
+                current = right[current]
+    
+    def inorder_traversal(self) -> list:
+        """Обход дерева в порядке in-order"""
+        return list(self)  # O(n)
+    
+    def memory_usage(self) -> int:
+        """Байт в буферах массивов (без запаса на рост)"""
+        return sum(len(a) * a.itemsize for a in (self.values, self.left, self.right))  # O(1)
+    
+    def __len__(self) -> int:
+        """Число значений в дереве"""
+        return self.size  # O(1)
\ No newline at end of file
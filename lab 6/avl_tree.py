@@ -0,0 +1,133 @@
+from binary_search_tree import TreeNode, BinarySearchTree
+
+
+class AVLNode(TreeNode):
+    """Узел AVL-дерева (хранит высоту поддерева)"""
+    __slots__ = ("height",)  # O(1) - к слотам TreeNode добавляется только высота
+    
+    def __init__(self, value: int):
+        super().__init__(value)  # O(1)
+        self.height = 1  # O(1) - высота листа
+
+
+def _height(node: AVLNode) -> int:
+    """Высота поддерева (0 для пустого)"""
+    return node.height if node is not None else 0  # O(1)
+
+
+class AVLTree(BinarySearchTree):
+    """Сбалансированное AVL-дерево: высоты поддеревьев узла отличаются не больше чем на 1
+    
+    Высота дерева не превышает 1.44 log2(n), поэтому вставка, удаление и поиск
+    выполняются за O(log n) при любом порядке входных данных. Обе операции
+    итеративные: путь от корня хранится в списке, балансировка идет по нему вверх.
+    """
+    node_type = AVLNode  # from_sorted строит идеально сбалансированное (значит, AVL) дерево
+    
+    def _refresh(self, node: AVLNode) -> None:
+        """Пересчет высоты и размера поддерева узла по детям"""
+        super()._refresh(node)  # O(1) - размер для rank/select
+        node.height = 1 + max(_height(node.left), _height(node.right))  # O(1)
+    
+    def _rotate_left(self, node: AVLNode) -> AVLNode:
+        """Левый поворот, возвращает новый корень поддерева"""
+        pivot = node.right  # O(1)
+        node.right = pivot.left
+        pivot.left = node
+        self._refresh(node)  # O(1) - сначала нижний узел
+        self._refresh(pivot)
+        return pivot
+    
+    def _rotate_right(self, node: AVLNode) -> AVLNode:
+        """Правый поворот, возвращает новый корень поддерева"""
+        pivot = node.left  # O(1)
+        node.left = pivot.right
+        pivot.right = node
+        self._refresh(node)  # O(1)
+        self._refresh(pivot)
+        return pivot
+    
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """Восстановление баланса узла, возвращает новый корень поддерева"""
+        self._refresh(node)  # O(1)
+        balance = _height(node.left) - _height(node.right)
+        if balance > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)  # O(1) - случай левый-правый
+            return self._rotate_right(node)
+        if balance < -1:
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)  # O(1) - случай правый-левый
+            return self._rotate_left(node)
+        return node
+    
+    def _rebalance_path(self, path: list) -> None:
+        """Балансировка узлов пути снизу вверх с перевешиванием новых корней поддеревьев"""
+        for i in range(len(path) - 1, -1, -1):  # O(log n)
+            node = path[i]
+            subtree = self._rebalance(node)  # O(1)
+            if subtree is not node:
+                if i == 0:
+                    self.root = subtree
+                elif path[i - 1].left is node:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
+    
+    def insert(self, value: int) -> None:
+        """Вставка значения с балансировкой (итеративная версия)"""
+        if self.root is None:
+            self.root = AVLNode(value)  # O(1)
+            return
+        
+        path = []  # O(log n) - узлы от корня до родителя нового узла
+        current = self.root
+        while current is not None:  # O(log n)
+            path.append(current)
+            if value < current.value:
+                current = current.left
+            elif value > current.value:
+                current = current.right
+            else:
+                return  # Значение уже существует
+        
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = AVLNode(value)  # O(1)
+        else:
+            parent.right = AVLNode(value)  # O(1)
+        self._rebalance_path(path)  # O(log n)
+    
+    def delete(self, value: int) -> bool:
+        """Удаление значения с балансировкой, возвращает True, если значение было в дереве"""
+        path = []  # O(log n)
+        current = self.root
+        while current is not None and current.value != value:  # O(log n)
+            path.append(current)
+            current = current.left if value < current.value else current.right
+        if current is None:
+            return False
+        
+        if current.left is not None and current.right is not None:
+            # Два ребенка: значение заменяется преемником, удаляется узел преемника
+            path.append(current)
+            successor = current.right
+            while successor.left is not None:  # O(log n)
+                path.append(successor)
+                successor = successor.left
+            current.value = successor.value  # O(1)
+            current = successor
+        
+        child = current.left if current.left is not None else current.right  # O(1) - не больше одного ребенка
+        if not path:
+            self.root = child
+        elif path[-1].left is current:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self._rebalance_path(path)  # O(log n)
+        return True
+    
+    def height(self) -> int:
+        """Высота дерева"""
+        return _height(self.root)  # O(1)
\ No newline at end of file
@@ -0,0 +1,164 @@
+from bisect import bisect_left, bisect_right
+
+
+class BPlusLeaf:
+    """Лист B+-дерева: отсортированный список значений и ссылка на следующий лист"""
+    __slots__ = ("keys", "next")
+    
+    def __init__(self, keys: list):
+        self.keys = keys  # O(1) - значения листа по возрастанию
+        self.next = None  # O(1) - следующий лист (для обхода диапазонов)
+
+
+class BPlusInternal:
+    """Внутренний узел B+-дерева: разделители и дети (children[i] < keys[i] <= children[i + 1])"""
+    __slots__ = ("keys", "children")
+    
+    def __init__(self, keys: list, children: list):
+        self.keys = keys  # O(1)
+        self.children = children  # O(1)
+
+
+class BPlusTree:
+    """B+-дерево: широкие узлы-массивы, поиск внутри узла двоичным поиском (bisect)
+    
+    Все значения лежат в листьях, листья связаны в список. Высота дерева
+    log_order(n): при order = 64 миллион значений помещается в 4 уровня,
+    поэтому поиск проходит всего несколько узлов вместо ~20 у бинарного дерева.
+    """
+    
+    def __init__(self, order: int = 64):
+        if order < 3:
+            raise ValueError("Порядок B+-дерева должен быть не меньше 3")
+        self.order = order  # O(1) - максимальное число значений в листе и детей у внутреннего узла
+        self.root = BPlusLeaf([])  # O(1)
+        self.size = 0  # O(1)
+    
+    @classmethod
+    def from_sorted(cls, values, order: int = 64) -> "BPlusTree":
+        """Построение дерева из отсортированных значений за O(n) (повторы пропускаются)"""
+        tree = cls(order)  # O(1)
+        keys = []
+        for value in values:  # O(n)
+            if not keys or value > keys[-1]:
+                keys.append(value)
+            elif value < keys[-1]:
+                raise ValueError("Значения должны быть отсортированы")
+        if not keys:
+            return tree
+        
+        # Листья заполняются целиком; последний лист делит значения с предыдущим,
+        # чтобы в каждом было не меньше половины
+        chunks = [keys[i:i + order] for i in range(0, len(keys), order)]  # O(n)
+        if len(chunks) > 1 and len(chunks[-1]) < order // 2:
+            merged = chunks[-2] + chunks[-1]
+            middle = len(merged) // 2
+            chunks[-2:] = [merged[:middle], merged[middle:]]
+        level = [BPlusLeaf(chunk) for chunk in chunks]  # O(n)
+        for leaf, following in zip(level, level[1:]):
+            leaf.next = following
+        firsts = [chunk[0] for chunk in chunks]  # наименьшее значение каждого поддерева
+        
+        # Уровни внутренних узлов строятся снизу вверх: O(n / order) узлов всего
+        while len(level) > 1:
+            starts = list(range(0, len(level), order))
+            if len(starts) > 1 and len(level) - starts[-1] < 2:
+                starts[-1] -= 1  # у внутреннего узла не меньше двух детей: забираем ребенка у соседа
+            bounds = starts + [len(level)]
+            parents, parent_firsts = [], []
+            for start, stop in zip(bounds, bounds[1:]):
+                parents.append(BPlusInternal(firsts[start + 1:stop], level[start:stop]))
+                parent_firsts.append(firsts[start])
+            level, firsts = parents, parent_firsts
+        tree.root = level[0]
+        tree.size = len(keys)
+        return tree
+    
+    def _find_leaf(self, value) -> BPlusLeaf:
+        """Лист, в котором должно находиться значение"""
+        node = self.root
+        while isinstance(node, BPlusInternal):  # O(log_order n) уровней
+            node = node.children[bisect_right(node.keys, value)]  # O(log order) внутри узла
+        return node
+    
+    def search(self, value) -> bool:
+        """Поиск значения в дереве"""
+        keys = self._find_leaf(value).keys  # O(log n)
+        i = bisect_left(keys, value)  # O(log order)
+        return i < len(keys) and keys[i] == value
+    
+    def insert(self, value) -> None:
+        """Вставка значения (итеративная, с расщеплением переполненных узлов)"""
+        path = []  # O(log n) - внутренние узлы и номера детей на пути к листу
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            i = bisect_right(node.keys, value)
+            path.append((node, i))
+            node = node.children[i]
+        
+        keys = node.keys
+        i = bisect_left(keys, value)  # O(log order)
+        if i < len(keys) and keys[i] == value:
+            return  # Значение уже существует
+        keys.insert(i, value)  # O(order) - сдвиг внутри одного массива
+        self.size += 1
+        if len(keys) <= self.order:
+            return
+        
+        # Расщепление листа: правая половина уходит в новый лист
+        middle = len(keys) // 2
+        right = BPlusLeaf(keys[middle:])
+        del keys[middle:]
+        right.next, node.next = node.next, right
+        separator, new_child = right.keys[0], right
+        
+        while path:  # O(log n) - расщепления поднимаются к корню
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)  # O(order)
+            parent.children.insert(i + 1, new_child)
+            if len(parent.children) <= self.order:
+                return
+            middle = len(parent.keys) // 2
+            separator = parent.keys[middle]  # разделитель поднимается выше и не остается в узлах
+            new_child = BPlusInternal(parent.keys[middle + 1:], parent.children[middle + 1:])
+            del parent.keys[middle:]
+            del parent.children[middle + 1:]
+        
+        # Расщепился корень: дерево растет на один уровень вверх
+        self.root = BPlusInternal([separator], [self.root, new_child])
+    
+    def range(self, low, high):
+        """Значения из [low, high] по возрастанию: спуск к первому листу и проход по списку листьев"""
+        leaf = self._find_leaf(low)  # O(log n)
+        i = bisect_left(leaf.keys, low)
+        while leaf is not None:  # O(k / order) листьев для k значений
+            keys = leaf.keys
+            end = bisect_right(keys, high)
+            yield from keys[i:end]
+            if end < len(keys):
+                return
+            leaf, i = leaf.next, 0
+    
+    def __iter__(self):
+        """Все значения по возрастанию"""
+        node = self.root
+        while isinstance(node, BPlusInternal):  # O(log n) - самый левый лист
+            node = node.children[0]
+        while node is not None:  # O(n)
+            yield from node.keys
+            node = node.next
+    
+    def inorder_traversal(self) -> list:
+        """Список значений по возрастанию (как у BinarySearchTree)"""
+        return list(self)  # O(n)
+    
+    def height(self) -> int:
+        """Число уровней дерева"""
+        levels, node = 1, self.root
+        while isinstance(node, BPlusInternal):  # O(log n)
+            levels, node = levels + 1, node.children[0]
+        return levels
+    
+    def __len__(self) -> int:
+        """Число значений"""
+        return self.size  # O(1)
\ No newline at end of file
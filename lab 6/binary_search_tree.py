@@ -1,17 +1,61 @@
 class TreeNode:
     """Узел бинарного дерева поиска"""
+    __slots__ = ("value", "left", "right", "size")  # без __dict__ у каждого узла
+    
     def __init__(self, value: int):
         self.value = value  # O(1) - присваивание
         self.left = None    # O(1) - присваивание
         self.right = None   # O(1) - присваивание
+        self.size = 1       # O(1) - число узлов в поддереве (для rank/select)
+
+
+def _size(node: TreeNode) -> int:
+    """Размер поддерева (0 для пустого)"""
+    return node.size if node is not None else 0  # O(1)
 
 
 class BinarySearchTree:
     """Бинарное дерево поиска (BST)"""
+    node_type = TreeNode  # класс узлов для массового построения (наследники подставляют свой)
     
     def __init__(self):
         self.root = None  # O(1) - инициализация корня
+    
+    @classmethod
+    def from_sorted(cls, values) -> "BinarySearchTree":
+        """Идеально сбалансированное дерево из отсортированных значений за O(n) (повторы пропускаются)"""
+        keys = []
+        for value in values:  # O(n)
+            if not keys or value > keys[-1]:
+                keys.append(value)
+            elif value < keys[-1]:
+                raise ValueError("Значения должны быть отсортированы")
         
+        tree = cls()  # O(1)
+        # Явный стек отрезков вместо рекурсии: глубина стека O(log n)
+        stack = [(0, len(keys), None, False)]
+        while stack:  # O(n) - каждый отрезок дает один узел
+            low, high, parent, is_left = stack.pop()
+            if low >= high:
+                continue
+            middle = (low + high) // 2  # середина отрезка - корень поддерева
+            node = cls.node_type(keys[middle])
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((low, middle, node, True))
+            stack.append((middle + 1, high, node, False))
+        tree._refresh_all()  # O(n) - размеры (и высоты у наследников) снизу вверх
+        return tree
+    
+    @classmethod
+    def from_iterable(cls, values) -> "BinarySearchTree":
+        """Идеально сбалансированное дерево из произвольных значений: сортировка + from_sorted"""
+        return cls.from_sorted(sorted(values))  # O(n log n)
+    
     def insert(self, value: int) -> None:
         """Вставка значения в дерево (итеративная версия)"""
         new_node = TreeNode(value)  # O(1) - создание узла
@@ -22,9 +66,11 @@ class BinarySearchTree:
         
         current = self.root  # O(1)
         parent = None  # O(1)
+        path = []  # O(1) - узлы, размеры поддеревьев которых вырастут
         
         while current is not None:  # O(h) где h - высота дерева
             parent = current  # O(1)
+            path.append(current)  # O(1)
             if value < current.value:  # O(1) - сравнение
                 current = current.left  # O(1)
             elif value > current.value:  # O(1) - сравнение
@@ -38,7 +84,76 @@ class BinarySearchTree:
             parent.left = new_node  # O(1)
         else:
             parent.right = new_node  # O(1)
+        for node in path:  # O(h) - значение новое, поддеревья на пути выросли на 1
+            node.size += 1
+    
+    def _refresh(self, node: TreeNode) -> None:
+        """Пересчет служебных полей узла по детям (наследники добавляют свои поля)"""
+        node.size = 1 + _size(node.left) + _size(node.right)  # O(1)
+    
+    def _refresh_all(self) -> None:
+        """Пересчет служебных полей всех узлов: итеративный post-order обход"""
+        stack = []  # O(h)
+        node, last = self.root, None
+        while stack or node is not None:  # O(n)
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right is not None and top.right is not last:
+                    node = top.right  # O(1) - сначала правое поддерево
+                else:
+                    self._refresh(top)  # O(1) - оба ребенка уже пересчитаны
+                    last = stack.pop()
+    
+    def rebalance(self) -> None:
+        """Перестройка в сбалансированное дерево на месте за O(n) (алгоритм Day-Stout-Warren)"""
+        pseudo_root = TreeNode(None)  # O(1) - фиктивный корень упрощает повороты у вершины
+        pseudo_root.right = self.root
+        
+        # 1. Дерево в "лозу": правыми поворотами получаем цепочку по правым ссылкам
+        count = 0
+        tail, rest = pseudo_root, pseudo_root.right
+        while rest is not None:  # O(n) - каждый поворот переносит один узел в цепочку
+            if rest.left is None:
+                tail, rest = rest, rest.right
+                count += 1
+            else:
+                pivot = rest.left
+                rest.left = pivot.right
+                pivot.right = rest
+                rest = tail.right = pivot
         
+        # 2. Лоза в дерево: серии левых поворотов через узел, сначала лишние листья нижнего уровня
+        leaves = count + 1 - (1 << ((count + 1).bit_length() - 1))  # O(1) - сверх полного дерева
+        self._compress(pseudo_root, leaves)
+        remaining = count - leaves
+        while remaining > 1:  # O(log n) серий, всего O(n) поворотов
+            remaining //= 2
+            self._compress(pseudo_root, remaining)
+        self.root = pseudo_root.right
+        self._refresh_all()  # O(n)
+    
+    @staticmethod
+    def _compress(pseudo_root: TreeNode, count: int) -> None:
+        """count левых поворотов вдоль правой цепочки через узел"""
+        scanner = pseudo_root
+        for _ in range(count):  # O(count)
+            child = scanner.right
+            scanner.right = child.right
+            scanner = scanner.right
+            child.right = scanner.left
+            scanner.left = child
+    
+    def height(self) -> int:
+        """Высота дерева (обход по уровням без рекурсии)"""
+        levels, level = 0, [self.root] if self.root is not None else []
+        while level:  # O(n)
+            levels += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return levels
+    
     def search(self, value: int) -> bool:
         """Поиск значения в дереве (итеративная версия)"""
         current = self.root  # O(1)
@@ -50,18 +165,104 @@ class BinarySearchTree:
                 current = current.left  # O(1)
             else:
                 current = current.right  # O(1)
-                
+        
         return False  # O(1)
-            
+    
+    def __iter__(self):
+        """Ленивый in-order обход (явный стек вместо рекурсии)"""
+        stack = []  # O(h) памяти
+        node = self.root
+        while stack or node is not None:  # O(n) для полного обхода
+            if node is not None:
+                stack.append(node)  # O(1) - спуск влево
+                node = node.left
+            else:
+                node = stack.pop()  # O(1)
+                yield node.value
+                node = node.right
+    
     def inorder_traversal(self) -> list:
         """Обход дерева в порядке in-order (левый-корень-правый)"""
-        result = []  # O(1) - создание списка
-        self._inorder_recursive(self.root, result)  # O(n) - обход всех узлов
-        return result  # O(1) - возврат
-        
-    def _inorder_recursive(self, node: TreeNode, result: list) -> None:
-        """Рекурсивный in-order обход"""
-        if node is not None:  # O(1) - проверка
-            self._inorder_recursive(node.left, result)  # O(n) рекурсия
-            result.append(node.value)  # O(1) - добавление в список
-            self._inorder_recursive(node.right, result)  # O(n) рекурсия
\ No newline at end of file
+        return list(self)  # O(n) - итеративный обход, глубина дерева не ограничена стеком вызовов
+    
+    def range(self, low: int, high: int):
+        """Значения из [low, high] по возрастанию: O(h + k) узлов для k значений"""
+        stack = []  # O(h)
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                if node.value < low:
+                    node = node.right  # O(1) - левое поддерево целиком меньше low
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if node.value > high:
+                    return  # O(1) - дальше только большие значения
+                yield node.value
+                node = node.right
+    
+    def floor(self, value: int):
+        """Наибольшее значение <= value или None"""
+        current, best = self.root, None  # O(1)
+        while current is not None:  # O(h)
+            if current.value == value:
+                return value
+            if current.value < value:
+                best, current = current.value, current.right
+            else:
+                current = current.left
+        return best
+    
+    def ceiling(self, value: int):
+        """Наименьшее значение >= value или None"""
+        current, best = self.root, None  # O(1)
+        while current is not None:  # O(h)
+            if current.value == value:
+                return value
+            if current.value > value:
+                best, current = current.value, current.left
+            else:
+                current = current.right
+        return best
+    
+    def successor(self, value: int):
+        """Наименьшее значение > value или None"""
+        current, best = self.root, None  # O(1)
+        while current is not None:  # O(h)
+            if current.value > value:
+                best, current = current.value, current.left
+            else:
+                current = current.right
+        return best
+    
+    def rank(self, value: int) -> int:
+        """Число значений меньше value"""
+        current, result = self.root, 0  # O(1)
+        while current is not None:  # O(h) - размеры поддеревьев вместо обхода
+            if value <= current.value:
+                current = current.left
+            else:
+                result += 1 + _size(current.left)  # O(1) - узел и все его левое поддерево меньше
+                current = current.right
+        return result
+    
+    def select(self, k: int) -> int:
+        """k-е по возрастанию значение (с нуля)"""
+        if not 0 <= k < len(self):
+            raise IndexError("Индекс вне диапазона")
+        current = self.root  # O(1)
+        while True:  # O(h)
+            left = _size(current.left)
+            if k < left:
+                current = current.left
+            elif k == left:
+                return current.value
+            else:
+                k -= left + 1  # O(1) - пропускаем левое поддерево и сам узел
+                current = current.right
+    
+    def __len__(self) -> int:
+        """Число значений в дереве"""
+        return _size(self.root)  # O(1)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from binary_search_tree import BinarySearchTree
+from avl_tree import AVLTree
 from tree_analysis import test_bst_operations, analyze_trees
 
 
@@ -29,12 +30,36 @@ def demonstrate_bst():
     traversal_result = bst.inorder_traversal()
     print(f"   Результат: {traversal_result}")
     
-    print("\n4. Демонстрация свойств BST:")
+    print("\n4. Диапазоны и порядковые статистики:")
+    print(f"   Значения из [25, 65]: {list(bst.range(25, 65))}")
+    print(f"   floor(45) = {bst.floor(45)}, ceiling(45) = {bst.ceiling(45)}, successor(50) = {bst.successor(50)}")
+    print(f"   rank(60) = {bst.rank(60)} (значений меньше 60), select(0) = {bst.select(0)}, "
+          f"select({len(bst) - 1}) = {bst.select(len(bst) - 1)}")
+    
+    print("\n5. Демонстрация свойств BST:")
     print("   - In-order обход возвращает отсортированные значения")
     print("   - Левые потомки меньше родителя")
     print("   - Правые потомки больше родителя")
 
 
+def demonstrate_avl():
+    """Демонстрация AVL-дерева на отсортированных данных"""
+    print("\n" + "=" * 50)
+    print("AVL-дерево (самобалансирующееся)")
+    print("-" * 30)
+    
+    avl = AVLTree()
+    for value in range(1, 16):  # отсортированный вход - худший случай для обычного BST
+        avl.insert(value)
+    print(f"Вставлены значения 1..15, высота дерева: {avl.height()} (у обычного BST было бы 15)")
+    print(f"Корень: {avl.root.value}")
+    
+    for value in [8, 1, 2, 3]:
+        avl.delete(value)
+        print(f"Удалено {value}: высота {avl.height()}, корень {avl.root.value}")
+    print(f"In-order обход: {avl.inorder_traversal()}")
+
+
 def simple_performance_test():
     """Простой тест производительности"""
     print("\n" + "=" * 50)
@@ -88,9 +113,11 @@ def simple_performance_test():
 
 if __name__ == "__main__":
     demonstrate_bst()
+    demonstrate_avl()
     simple_performance_test()
     print("\n" + "=" * 50)
     print("Выводы:")
     print("- Сбалансированное дерево обеспечивает O(log n) время операций")
     print("- Вырожденное дерево вырождается в связный список с O(n) временем")
-    print("- Время операций в вырожденном дереве растет линейно с размером")
\ No newline at end of file
+    print("- Время операций в вырожденном дереве растет линейно с размером")
+    print("- AVL-дерево сохраняет высоту O(log n) при любом порядке вставки")
\ No newline at end of file
@@ -0,0 +1,154 @@
+class PersistentNode:
+    """Неизменяемый узел: ключ, значение, дети, высота и размер поддерева"""
+    __slots__ = ("key", "value", "left", "right", "height", "size")
+    
+    def __init__(self, key, value, left, right):
+        self.key = key  # O(1)
+        self.value = value  # O(1)
+        self.left = left  # O(1) - поддеревья разделяются между версиями и не меняются
+        self.right = right  # O(1)
+        self.height = 1 + max(_height(left), _height(right))  # O(1)
+        self.size = 1 + _size(left) + _size(right)  # O(1)
+
+
+def _height(node: PersistentNode) -> int:
+    """Высота поддерева (0 для пустого)"""
+    return node.height if node is not None else 0  # O(1)
+
+
+def _size(node: PersistentNode) -> int:
+    """Размер поддерева (0 для пустого)"""
+    return node.size if node is not None else 0  # O(1)
+
+
+def _balance(key, value, left: PersistentNode, right: PersistentNode) -> PersistentNode:
+    """Новый узел с AVL-балансировкой: повороты создают новые узлы вместо изменения старых"""
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) < _height(left.right):
+            pivot = left.right  # O(1) - случай левый-правый
+            return PersistentNode(pivot.key, pivot.value,
+                                  PersistentNode(left.key, left.value, left.left, pivot.left),
+                                  PersistentNode(key, value, pivot.right, right))
+        return PersistentNode(left.key, left.value, left.left, PersistentNode(key, value, left.right, right))
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) < _height(right.left):
+            pivot = right.left  # O(1) - случай правый-левый
+            return PersistentNode(pivot.key, pivot.value,
+                                  PersistentNode(key, value, left, pivot.left),
+                                  PersistentNode(right.key, right.value, pivot.right, right.right))
+        return PersistentNode(right.key, right.value, PersistentNode(key, value, left, right.left), right.right)
+    return PersistentNode(key, value, left, right)  # O(1)
+
+
+class PersistentTree:
+    """Персистентный упорядоченный словарь на AVL-дереве с копированием пути
+    
+    Версия не изменяется никогда: insert и delete возвращают новую версию,
+    в которой заново созданы только O(log n) узлов пути от корня, а все
+    остальные поддеревья общие со старой версией. Снимок - это просто
+    ссылка на версию, O(1) по времени и памяти.
+    """
+    
+    def __init__(self, root: PersistentNode = None):
+        self.root = root  # O(1)
+    
+    def _rebuild(self, path: list, subtree: PersistentNode) -> "PersistentTree":
+        """Копирование пути снизу вверх с балансировкой; path - (ключ, значение, узел, ушли ли влево)"""
+        for key, value, node, went_left in reversed(path):  # O(log n)
+            if went_left:
+                subtree = _balance(key, value, subtree, node.right)
+            else:
+                subtree = _balance(key, value, node.left, subtree)
+        return PersistentTree(subtree)
+    
+    def insert(self, key, value=None) -> "PersistentTree":
+        """Новая версия с парой ключ-значение (итеративная версия)"""
+        path = []  # O(log n)
+        node = self.root
+        while node is not None:  # O(log n)
+            if key < node.key:
+                path.append((node.key, node.value, node, True))
+                node = node.left
+            elif key > node.key:
+                path.append((node.key, node.value, node, False))
+                node = node.right
+            else:
+                if node.value is value:
+                    return self  # O(1) - версия не меняется
+                return self._rebuild(path, PersistentNode(key, value, node.left, node.right))
+        return self._rebuild(path, PersistentNode(key, value, None, None))
+    
+    def delete(self, key) -> "PersistentTree":
+        """Новая версия без ключа (та же версия, если ключа нет)"""
+        path = []  # O(log n)
+        node = self.root
+        while node is not None and node.key != key:  # O(log n)
+            went_left = key < node.key
+            path.append((node.key, node.value, node, went_left))
+            node = node.left if went_left else node.right
+        if node is None:
+            return self
+        
+        if node.left is not None and node.right is not None:
+            # Два ребенка: узел пути получает ключ преемника, узел преемника удаляется
+            target = len(path)
+            path.append(None)
+            successor = node.right
+            while successor.left is not None:  # O(log n)
+                path.append((successor.key, successor.value, successor, True))
+                successor = successor.left
+            path[target] = (successor.key, successor.value, node, False)
+            return self._rebuild(path, successor.right)
+        return self._rebuild(path, node.left if node.left is not None else node.right)
+    
+    def get(self, key, default=None):
+        """Значение по ключу"""
+        node = self.root
+        while node is not None:  # O(log n)
+            if key == node.key:
+                return node.value
+            node = node.left if key < node.key else node.right
+        return default
+    
+    def search(self, key) -> bool:
+        """Поиск ключа (как у BinarySearchTree)"""
+        node = self.root
+        while node is not None:  # O(log n)
+            if key == node.key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
+    
+    def __contains__(self, key) -> bool:
+        """Проверка наличия ключа"""
+        return self.search(key)  # O(log n)
+    
+    def items(self):
+        """Пары (ключ, значение) по возрастанию ключей (явный стек)"""
+        stack = []  # O(log n)
+        node = self.root
+        while stack or node is not None:  # O(n)
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.key, node.value
+                node = node.right
+    
+    def __iter__(self):
+        """Ключи по возрастанию"""
+        for key, value in self.items():  # O(n)
+            yield key
+    
+    def inorder_traversal(self) -> list:
+        """Список ключей по возрастанию"""
+        return list(self)  # O(n)
+    
+    def height(self) -> int:
+        """Высота дерева"""
+        return _height(self.root)  # O(1)
+    
+    def __len__(self) -> int:
+        """Число ключей"""
+        return _size(self.root)  # O(1)
\ No newline at end of file
@@ -0,0 +1,120 @@
+import random
+
+MAX_LEVEL = 32  # хватает для 4^32 значений при p = 0.25
+
+
+class SkipNode:
+    """Узел списка с пропусками: значение и массив ссылок вперед (по одной на уровень)"""
+    __slots__ = ("value", "next")
+    
+    def __init__(self, value, level: int):
+        self.value = value  # O(1)
+        self.next = [None] * level  # O(level) - все уровни узла в одном списке, без узла на уровень
+
+
+class SkipList:
+    """Список с пропусками (skip list): упорядоченное множество без балансировки
+    
+    Уровень узла выбирается случайно (уровень k с вероятностью p^(k-1)),
+    поэтому поиск, вставка и удаление выполняются за O(log n) в среднем при
+    любом порядке входных данных. Изменение затрагивает только ссылки
+    соседей: новый узел полностью заполняется до того, как на него
+    сошлется предшественник, и читатель всегда видит целую цепочку.
+    API совпадает с BinarySearchTree.
+    """
+    
+    def __init__(self, p: float = 0.25, max_level: int = MAX_LEVEL, seed=None):
+        self.p = p  # O(1) - вероятность подняться на уровень выше
+        self.max_level = max_level  # O(1)
+        self.rng = random.Random(seed)  # O(1)
+        self.head = SkipNode(None, max_level)  # O(L) - фиктивная голова на всех уровнях
+        self.level = 1  # O(1) - число используемых уровней
+        self.size = 0  # O(1)
+    
+    def _random_level(self) -> int:
+        """Случайный уровень нового узла"""
+        level, rand, p = 1, self.rng.random, self.p
+        while level < self.max_level and rand() < p:  # O(1) в среднем: 1 / (1 - p) итераций
+            level += 1
+        return level
+    
+    def _predecessors(self, value) -> list:
+        """Последний узел со значением < value на каждом уровне"""
+        update = [None] * self.level  # O(log n) - только используемые уровни
+        node = self.head
+        for i in range(self.level - 1, -1, -1):  # O(log n) в среднем
+            following = node.next[i]
+            while following is not None and following.value < value:
+                node, following = following, following.next[i]
+            update[i] = node
+        return update
+    
+    def _lower_bound(self, value) -> SkipNode:
+        """Первый узел со значением >= value или None"""
+        node = self.head
+        for i in range(self.level - 1, -1, -1):  # O(log n) в среднем
+            following = node.next[i]
+            while following is not None and following.value < value:
+                node, following = following, following.next[i]
+        return node.next[0]
+    
+    def insert(self, value) -> None:
+        """Вставка значения"""
+        update = self._predecessors(value)  # O(log n)
+        following = update[0].next[0]
+        if following is not None and following.value == value:
+            return  # Значение уже существует
+        level = self._random_level()
+        if level > self.level:
+            update.extend([self.head] * (level - self.level))  # на новых уровнях предшественник - голова
+        node = SkipNode(value, level)  # O(level) - одно выделение на узел
+        for i in range(level):  # сначала ссылки нового узла, затем ссылки на него
+            node.next[i] = update[i].next[i]
+            update[i].next[i] = node
+        if level > self.level:
+            self.level = level  # O(1)
+        self.size += 1
+    
+    def search(self, value) -> bool:
+        """Поиск значения"""
+        node = self._lower_bound(value)  # O(log n)
+        return node is not None and node.value == value
+    
+    def delete(self, value) -> bool:
+        """Удаление значения, возвращает True, если значение было в списке"""
+        update = self._predecessors(value)  # O(log n)
+        node = update[0].next[0]
+        if node is None or node.value != value:
+            return False
+        for i in range(len(node.next) - 1, -1, -1):  # O(level) - сверху вниз
+            update[i].next[i] = node.next[i]
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1  # O(1) - опустевшие верхние уровни
+        self.size -= 1
+        return True
+    
+    def __iter__(self):
+        """Значения по возрастанию (проход по нижнему уровню)"""
+        node = self.head.next[0]
+        while node is not None:  # O(n)
+            yield node.value
+            node = node.next[0]
+    
+    def inorder_traversal(self) -> list:
+        """Список значений по возрастанию (как у BinarySearchTree)"""
+        return list(self)  # O(n)
+    
+    def range(self, low, high):
+        """Значения из [low, high]: спуск к low за O(log n), затем по нижнему уровню"""
+        node = self._lower_bound(low)  # O(log n)
+        while node is not None and node.value <= high:  # O(k)
+            yield node.value
+            node = node.next[0]
+    
+    def height(self) -> int:
+        """Число используемых уровней (аналог высоты дерева)"""
+        return self.level  # O(1)
+    
+    def __len__(self) -> int:
+        """Число значений"""
+        return self.size  # O(1)
\ No newline at end of file
@@ -0,0 +1,426 @@
+import bisect
+import random
+import unittest
+from binary_search_tree import BinarySearchTree
+from avl_tree import AVLTree
+from b_tree import BPlusTree, BPlusInternal
+from array_bst import ArrayBST, NIL
+from skip_list import SkipList
+from persistent_tree import PersistentTree
+
+
+def check_bst(test, node, low=None, high=None):
+    """Проверка порядка и полей size (и height у AVL) поддерева, возвращает (размер, высоту)"""
+    if node is None:
+        return 0, 0
+    if low is not None:
+        test.assertGreater(node.value, low)
+    if high is not None:
+        test.assertLess(node.value, high)
+    left_size, left_height = check_bst(test, node.left, low, node.value)
+    right_size, right_height = check_bst(test, node.right, node.value, high)
+    size, height = 1 + left_size + right_size, 1 + max(left_height, right_height)
+    test.assertEqual(node.size, size)
+    if hasattr(node, "height"):
+        test.assertEqual(node.height, height)
+        test.assertLessEqual(abs(left_height - right_height), 1)  # баланс AVL
+    return size, height
+
+
+class TestBinarySearchTree(unittest.TestCase):
+    """Тесты для BinarySearchTree"""
+    
+    def setUp(self):
+        self.rng = random.Random(6)
+        self.values = self.rng.sample(range(1000), 300)
+        self.tree = BinarySearchTree()
+        for v in self.values:
+            self.tree.insert(v)
+        self.reference = sorted(self.values)
+    
+    def test_insert_and_search(self):
+        """Тест вставки, повторов и поиска против отсортированного списка"""
+        for v in self.values[:50]:
+            self.tree.insert(v)  # повтор ничего не меняет
+        
+        self.assertEqual(self.tree.inorder_traversal(), self.reference)
+        self.assertEqual(list(self.tree), self.reference)
+        self.assertEqual(len(self.tree), len(self.reference))
+        check_bst(self, self.tree.root)
+        for v in range(-5, 1005):
+            self.assertEqual(self.tree.search(v), v in self.values)
+    
+    def test_order_statistics(self):
+        """Тест rank и select по размерам поддеревьев"""
+        for i, v in enumerate(self.reference):
+            self.assertEqual(self.tree.select(i), v)
+            self.assertEqual(self.tree.rank(v), i)
+        for v in range(-5, 1005):
+            self.assertEqual(self.tree.rank(v), bisect.bisect_left(self.reference, v))
+        
+        with self.assertRaises(IndexError):
+            self.tree.select(len(self.reference))
+        with self.assertRaises(IndexError):
+            self.tree.select(-1)
+    
+    def test_range_floor_ceiling(self):
+        """Тест range, floor, ceiling и successor"""
+        ref = self.reference
+        for _ in range(200):
+            low = self.rng.randint(-10, 1010)
+            high = low + self.rng.randint(-5, 200)
+            expected = ref[bisect.bisect_left(ref, low):bisect.bisect_right(ref, high)]
+            self.assertEqual(list(self.tree.range(low, high)), expected)
+        
+        for v in range(-5, 1005):
+            i = bisect.bisect_right(ref, v)
+            self.assertEqual(self.tree.floor(v), ref[i - 1] if i else None)
+            self.assertEqual(self.tree.successor(v), ref[i] if i < len(ref) else None)
+            j = bisect.bisect_left(ref, v)
+            self.assertEqual(self.tree.ceiling(v), ref[j] if j < len(ref) else None)
+    
+    def test_from_sorted(self):
+        """Тест массового построения: баланс, повторы и неотсортированный вход"""
+        for n in [0, 1, 2, 7, 8, 100, 1000]:
+            tree = BinarySearchTree.from_sorted(range(n))
+            self.assertEqual(tree.inorder_traversal(), list(range(n)))
+            self.assertEqual(len(tree), n)
+            self.assertEqual(tree.height(), n.bit_length())  # идеально сбалансированное
+            check_bst(self, tree.root)
+        
+        tree = BinarySearchTree.from_sorted([1, 1, 2, 3, 3, 3])
+        self.assertEqual(tree.inorder_traversal(), [1, 2, 3])
+        self.assertEqual(len(tree), 3)
+        
+        with self.assertRaises(ValueError):
+            BinarySearchTree.from_sorted([1, 3, 2])
+        
+        tree = BinarySearchTree.from_iterable(self.values + self.values[:10])
+        self.assertEqual(tree.inorder_traversal(), self.reference)
+        check_bst(self, tree.root)
+    
+    def test_rebalance(self):
+        """Тест перестройки DSW: вырожденное и случайное дерево"""
+        for n in [0, 1, 2, 3, 15, 16, 17, 500]:
+            tree = BinarySearchTree()
+            for v in range(n):  # вырожденное дерево-цепочка
+                tree.insert(v)
+            tree.rebalance()
+            self.assertEqual(tree.inorder_traversal(), list(range(n)))
+            self.assertEqual(tree.height(), n.bit_length())
+            check_bst(self, tree.root)
+        
+        self.tree.rebalance()
+        self.assertEqual(self.tree.inorder_traversal(), self.reference)
+        self.assertEqual(self.tree.height(), len(self.reference).bit_length())
+        check_bst(self, self.tree.root)
+        
+        self.tree.insert(1001)  # размеры остаются верными для следующих вставок
+        self.assertEqual(self.tree.select(len(self.reference)), 1001)
+        check_bst(self, self.tree.root)
+
+
+class TestAVLTree(unittest.TestCase):
+    """Тесты для AVLTree"""
+    
+    def test_sorted_insert(self):
+        """Тест вставки по возрастанию: высота остается логарифмической"""
+        tree = AVLTree()
+        for v in range(1000):
+            tree.insert(v)
+        
+        self.assertEqual(tree.inorder_traversal(), list(range(1000)))
+        self.assertLessEqual(tree.height(), 11)
+        check_bst(self, tree.root)
+    
+    def test_random_insert_delete(self):
+        """Тест случайных вставок и удалений против множества"""
+        rng = random.Random(7)
+        tree, reference = AVLTree(), set()
+        for step in range(3000):
+            v = rng.randrange(400)
+            if rng.random() < 0.55:
+                tree.insert(v)
+                reference.add(v)
+            else:
+                self.assertEqual(tree.delete(v), v in reference)
+                reference.discard(v)
+            if step % 100 == 0:
+                check_bst(self, tree.root)
+        
+        check_bst(self, tree.root)
+        self.assertEqual(tree.inorder_traversal(), sorted(reference))
+        self.assertEqual(len(tree), len(reference))
+        for i, v in enumerate(sorted(reference)):
+            self.assertEqual(tree.select(i), v)
+    
+    def test_delete_all(self):
+        """Тест удаления всех значений (узлы с двумя детьми и корень)"""
+        tree = AVLTree.from_sorted(range(200))
+        check_bst(self, tree.root)
+        order = list(range(200))
+        random.Random(8).shuffle(order)
+        for i, v in enumerate(order):
+            self.assertTrue(tree.delete(v))
+            self.assertFalse(tree.delete(v))
+            self.assertEqual(len(tree), 199 - i)
+            check_bst(self, tree.root)
+        
+        self.assertIsNone(tree.root)
+        self.assertEqual(tree.height(), 0)
+        self.assertFalse(tree.delete(0))
+
+
+class TestBPlusTree(unittest.TestCase):
+    """Тесты для BPlusTree"""
+    
+    def check_structure(self, tree):
+        """Проверка листьев на одной глубине, границ разделителей и цепочки листьев"""
+        leaves, depths = [], set()
+        stack = [(tree.root, None, None, 1)]
+        while stack:
+            node, low, high, depth = stack.pop()
+            for key in node.keys:
+                if low is not None:
+                    self.assertGreaterEqual(key, low)
+                if high is not None:
+                    self.assertLess(key, high)
+            self.assertEqual(node.keys, sorted(set(node.keys)))
+            if isinstance(node, BPlusInternal):
+                self.assertEqual(len(node.children), len(node.keys) + 1)
+                self.assertLessEqual(len(node.children), tree.order)
+                bounds = [low] + node.keys + [high]
+                for i in range(len(node.children) - 1, -1, -1):  # стек: левый ребенок снимается первым
+                    stack.append((node.children[i], bounds[i], bounds[i + 1], depth + 1))
+            else:
+                self.assertLessEqual(len(node.keys), tree.order)
+                leaves.append(node)
+                depths.add(depth)
+        
+        self.assertLessEqual(len(depths), 1)
+        for leaf, following in zip(leaves, leaves[1:]):
+            self.assertIs(leaf.next, following)  # цепочка листьев в порядке обхода
+        self.assertIsNone(leaves[-1].next)
+        if depths:
+            self.assertEqual(tree.height(), depths.pop())
+    
+    def test_insert_with_splits(self):
+        """Тест случайных вставок с расщеплениями при малом порядке"""
+        rng = random.Random(9)
+        for order in [3, 4, 5, 16]:
+            tree, reference = BPlusTree(order), set()
+            for _ in range(2000):
+                v = rng.randrange(3000)
+                tree.insert(v)
+                reference.add(v)
+            
+            self.check_structure(tree)
+            self.assertGreater(tree.height(), 2)
+            self.assertEqual(tree.inorder_traversal(), sorted(reference))
+            self.assertEqual(len(tree), len(reference))
+            for v in range(-5, 3005, 7):
+                self.assertEqual(tree.search(v), v in reference)
+    
+    def test_range(self):
+        """Тест диапазонов, пересекающих несколько листьев"""
+        rng = random.Random(10)
+        values = sorted(rng.sample(range(5000), 1000))
+        tree = BPlusTree(4)
+        for v in rng.sample(values, len(values)):
+            tree.insert(v)
+        
+        for _ in range(200):
+            low = rng.randint(-10, 5010)
+            high = low + rng.randint(-5, 600)
+            expected = values[bisect.bisect_left(values, low):bisect.bisect_right(values, high)]
+            self.assertEqual(list(tree.range(low, high)), expected)
+    
+    def test_from_sorted(self):
+        """Тест массового построения и вставок в построенное дерево"""
+        for order in [3, 4, 64]:
+            for n in [0, 1, order, order + 1, 2 * order + 1, 1000]:
+                tree = BPlusTree.from_sorted(range(0, 2 * n, 2), order)
+                self.check_structure(tree)
+                self.assertEqual(tree.inorder_traversal(), list(range(0, 2 * n, 2)))
+                self.assertEqual(len(tree), n)
+                
+                for v in range(-1, 2 * n + 1, 3):
+                    tree.insert(v)
+                self.check_structure(tree)
+                expected = sorted(set(range(0, 2 * n, 2)) | set(range(-1, 2 * n + 1, 3)))
+                self.assertEqual(tree.inorder_traversal(), expected)
+        
+        with self.assertRaises(ValueError):
+            BPlusTree.from_sorted([2, 1])
+        with self.assertRaises(ValueError):
+            BPlusTree(2)
+
+
+class TestArrayBST(unittest.TestCase):
+    """Тесты для ArrayBST"""
+    
+    def test_random_insert_delete(self):
+        """Тест случайных вставок и удалений против множества"""
+        rng = random.Random(11)
+        tree, reference = ArrayBST(), set()
+        for _ in range(3000):
+            v = rng.randrange(-300, 300)
+            if rng.random() < 0.55:
+                tree.insert(v)
+                reference.add(v)
+            else:
+                self.assertEqual(tree.delete(v), v in reference)
+                reference.discard(v)
+        
+        self.assertEqual(tree.inorder_traversal(), sorted(reference))
+        self.assertEqual(len(tree), len(reference))
+        for v in range(-305, 305):
+            self.assertEqual(tree.search(v), v in reference)
+        self.assertLessEqual(len(tree.values), 600)  # удаленные ячейки переиспользуются
+    
+    def test_free_list_reuse(self):
+        """Тест переиспользования ячеек после удаления"""
+        tree = ArrayBST.from_sorted(range(100))
+        for v in range(0, 100, 2):
+            self.assertTrue(tree.delete(v))
+        memory = tree.memory_usage()
+        for v in range(1000, 1050):
+            tree.insert(v)
+        
+        self.assertEqual(tree.memory_usage(), memory)
+        self.assertEqual(tree.inorder_traversal(), list(range(1, 100, 2)) + list(range(1000, 1050)))
+    
+    def test_from_sorted(self):
+        """Тест массового построения"""
+        for n in [0, 1, 2, 7, 8, 1000]:
+            tree = ArrayBST.from_sorted(range(n))
+            self.assertEqual(tree.inorder_traversal(), list(range(n)))
+            self.assertEqual(len(tree), n)
+            self.assertEqual(tree.root == NIL, n == 0)
+            for v in range(-1, n + 1):
+                self.assertEqual(tree.search(v), 0 <= v < n)
+        
+        with self.assertRaises(ValueError):
+            ArrayBST.from_sorted([3, 2])
+
+
+class TestSkipList(unittest.TestCase):
+    """Тесты для SkipList"""
+    
+    def check_levels(self, skip_list):
+        """Каждый уровень - отсортированная подпоследовательность нижнего"""
+        bottom = skip_list.inorder_traversal()
+        for i in range(skip_list.max_level):
+            level, node = [], skip_list.head.next[i]
+            while node is not None:
+                level.append(node.value)
+                node = node.next[i]
+            self.assertEqual(level, sorted(level))
+            self.assertTrue(set(level) <= set(bottom))
+            if i >= skip_list.level:
+                self.assertEqual(level, [])
+    
+    def test_random_insert_delete(self):
+        """Тест случайных вставок и удалений против множества"""
+        rng = random.Random(12)
+        skip_list, reference = SkipList(seed=12), set()
+        for _ in range(3000):
+            v = rng.randrange(500)
+            if rng.random() < 0.55:
+                skip_list.insert(v)
+                reference.add(v)
+            else:
+                self.assertEqual(skip_list.delete(v), v in reference)
+                reference.discard(v)
+        
+        self.check_levels(skip_list)
+        self.assertEqual(skip_list.inorder_traversal(), sorted(reference))
+        self.assertEqual(len(skip_list), len(reference))
+        for v in range(-5, 505):
+            self.assertEqual(skip_list.search(v), v in reference)
+        
+        ref = sorted(reference)
+        for _ in range(100):
+            low = rng.randint(-10, 510)
+            high = low + rng.randint(-5, 100)
+            expected = ref[bisect.bisect_left(ref, low):bisect.bisect_right(ref, high)]
+            self.assertEqual(list(skip_list.range(low, high)), expected)
+    
+    def test_delete_all(self):
+        """Тест удаления всех значений: уровни опускаются до одного"""
+        skip_list = SkipList(p=0.5, seed=13)
+        for v in range(300):
+            skip_list.insert(v)
+        self.assertGreater(skip_list.height(), 1)
+        
+        for v in range(300):
+            self.assertTrue(skip_list.delete(v))
+        self.assertFalse(skip_list.delete(0))
+        self.assertEqual(skip_list.height(), 1)
+        self.assertEqual(len(skip_list), 0)
+        self.check_levels(skip_list)
+
+
+class TestPersistentTree(unittest.TestCase):
+    """Тесты для PersistentTree"""
+    
+    def check_node(self, node, low=None, high=None):
+        """Проверка порядка, баланса, высот и размеров, возвращает (размер, высоту)"""
+        if node is None:
+            return 0, 0
+        if low is not None:
+            self.assertGreater(node.key, low)
+        if high is not None:
+            self.assertLess(node.key, high)
+        left_size, left_height = self.check_node(node.left, low, node.key)
+        right_size, right_height = self.check_node(node.right, node.key, high)
+        self.assertLessEqual(abs(left_height - right_height), 1)
+        self.assertEqual(node.size, 1 + left_size + right_size)
+        self.assertEqual(node.height, 1 + max(left_height, right_height))
+        return node.size, node.height
+    
+    def test_versions_unchanged(self):
+        """Тест неизменности старых версий после последующих вставок и удалений"""
+        rng = random.Random(14)
+        tree, reference = PersistentTree(), {}
+        versions = [(tree, dict(reference))]
+        for step in range(2000):
+            key = rng.randrange(300)
+            if rng.random() < 0.6:
+                tree = tree.insert(key, step)
+                reference[key] = step
+            else:
+                tree = tree.delete(key)
+                reference.pop(key, None)
+            versions.append((tree, dict(reference)))
+        
+        for version, snapshot in versions[::50] + versions[-5:]:
+            self.check_node(version.root)
+            self.assertEqual(list(version.items()), sorted(snapshot.items()))
+            self.assertEqual(len(version), len(snapshot))
+        for key in range(-5, 305):
+            self.assertEqual(tree.get(key, -1), reference.get(key, -1))
+            self.assertEqual(key in tree, key in reference)
+    
+    def test_snapshot_isolation(self):
+        """Тест: изменения новой версии не видны в снимке"""
+        base = PersistentTree()
+        for key in range(100):
+            base = base.insert(key, str(key))
+        snapshot = base
+        
+        updated = base.insert(50, "new").delete(0).insert(1000, "x")
+        self.assertEqual(snapshot.get(50), "50")
+        self.assertIn(0, snapshot)
+        self.assertNotIn(1000, snapshot)
+        self.assertEqual(snapshot.inorder_traversal(), list(range(100)))
+        self.assertEqual(updated.get(50), "new")
+        self.assertEqual(updated.inorder_traversal(), list(range(1, 100)) + [1000])
+        
+        self.assertIs(base.delete(5000), base)  # нет ключа - та же версия
+        value = base.get(7)
+        self.assertIs(base.insert(7, value), base)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
\ No newline at end of file
@@ -1,19 +1,20 @@
+import copy
 import time
 import random
-import sys
-from binary_search_tree import BinarySearchTree
-
-# Увеличиваем лимит рекурсии для больших деревьев
-sys.setrecursionlimit(10000)
+import math
+import tracemalloc
+from binary_search_tree import TreeNode, BinarySearchTree
+from avl_tree import AVLTree
+from b_tree import BPlusTree
+from array_bst import ArrayBST
+from skip_list import SkipList
+from persistent_tree import PersistentTree
 
 def generate_balanced_tree(size: int) -> BinarySearchTree:
-    """Генерация сбалансированного дерева (случайные значения)"""
-    bst = BinarySearchTree()  # O(1)
+    """Генерация сбалансированного дерева (случайные значения, массовое построение)"""
     # Используем больше значений для уменьшения вероятности дубликатов
     values = random.sample(range(size * 10), size)  # O(n) - генерация уникальных значений
-    for value in values:  # O(n) вставок
-        bst.insert(value)  # O(log n) каждая вставка
-    return bst  # O(1)
+    return BinarySearchTree.from_iterable(values)  # O(n log n) сортировка + O(n) построение
 
 
 def generate_degenerate_tree(size: int) -> BinarySearchTree:
@@ -25,6 +26,22 @@ def generate_degenerate_tree(size: int) -> BinarySearchTree:
     return bst  # O(1)
 
 
+def generate_avl_tree(size: int) -> AVLTree:
+    """Генерация AVL-дерева из отсортированных значений (худший порядок для BST)"""
+    avl = AVLTree()  # O(1)
+    for i in range(size):  # O(n) итераций
+        avl.insert(i)  # O(log n) каждая вставка благодаря балансировке
+    return avl  # O(1)
+
+
+def generate_skip_list(values) -> SkipList:
+    """Генерация списка с пропусками вставками значений в заданном порядке"""
+    skip_list = SkipList()  # O(1)
+    for value in values:  # O(n) итераций
+        skip_list.insert(value)  # O(log n) в среднем при любом порядке
+    return skip_list  # O(1)
+
+
 def measure_search_time(tree: BinarySearchTree, search_values: list) -> float:
     """Измерение времени поиска значений в дереве"""
     start_time = time.perf_counter()  # O(1)
@@ -37,11 +54,11 @@ def measure_search_time(tree: BinarySearchTree, search_values: list) -> float:
 
 
 def analyze_trees():
-    """Анализ производительности сбалансированного и вырожденного деревьев"""
+    """Анализ производительности сбалансированного и вырожденного деревьев, AVL и skip list"""
     print("Анализ производительности бинарных деревьев поиска")
     print("=" * 60)
     
-    # Уменьшаем размеры для избежания рекурсии
+    # Вырожденное дерево строится за O(n^2), поэтому размеры небольшие
     sizes = [100, 200, 300, 400]  # Более мелкие размеры
     search_count = 50  # Уменьшаем количество поисков
     
@@ -62,7 +79,251 @@ def analyze_trees():
         degenerate_tree = generate_degenerate_tree(size)  # O(n²)
         degenerate_time = measure_search_time(degenerate_tree, search_values)  # O(kn)
         print(f"{size:<10} {'Вырожденное':<20} {degenerate_time:<20.4f}")
+        
+        # AVL-дерево на тех же отсортированных данных
+        avl_tree = generate_avl_tree(size)  # O(n log n)
+        avl_time = measure_search_time(avl_tree, search_values)  # O(k log n)
+        print(f"{size:<10} {'AVL (отсорт. вход)':<20} {avl_time:<20.4f}")
+        
+        # Список с пропусками на тех же отсортированных данных: без балансировки
+        skip_list = generate_skip_list(range(size))  # O(n log n) в среднем
+        skip_time = measure_search_time(skip_list, search_values)  # O(k log n)
+        print(f"{size:<10} {'Skip list (отсорт.)':<20} {skip_time:<20.4f}")
+        
+        # То же вырожденное дерево после перестройки за O(n)
+        degenerate_tree.rebalance()  # O(n)
+        rebalanced_time = measure_search_time(degenerate_tree, search_values)  # O(k log n)
+        print(f"{size:<10} {'После rebalance()':<20} {rebalanced_time:<20.4f}")
         print()
+    
+    # Большие размеры: вырожденное BST строилось бы O(n²), AVL - O(n log n)
+    print("AVL-дерево на отсортированных данных")
+    print(f"{'Размер':<10} {'Построение (с)':<16} {'Поиск 1000 (мс)':<17} {'Высота':<8} {'1.44 log2(n)':<12}")
+    print("-" * 60)
+    for size in [1000, 10000, 100000, 1000000]:
+        start = time.perf_counter()
+        avl_tree = generate_avl_tree(size)  # O(n log n)
+        build_time = time.perf_counter() - start
+        search_values = random.sample(range(size * 2), 1000)  # половина поисков - промахи
+        avl_time = measure_search_time(avl_tree, search_values)  # O(k log n)
+        print(f"{size:<10} {build_time:<16.2f} {avl_time:<17.4f} {avl_tree.height():<8} "
+              f"{1.44 * math.log2(size):<12.1f}")
+    
+    # BST, AVL и skip list на случайном и отсортированном входе
+    size = 100000
+    random_values = random.sample(range(size * 10), size)
+    sorted_values = sorted(random_values)
+    search_values = random.sample(range(size * 10), 10000)
+    print(f"\nBST, AVL и skip list ({size} значений, {len(search_values)} поисков)")
+    print(f"{'Структура':<12} {'Вход':<16} {'Построение (с)':<16} {'Поиск (мс)':<12} {'Высота/уровни':<14}")
+    print("-" * 70)
+    structures = {"BST": BinarySearchTree, "AVL": AVLTree, "Skip list": SkipList}
+    for name, cls in structures.items():
+        for order, values in (("случайный", random_values), ("отсортированный", sorted_values)):
+            if cls is BinarySearchTree and values is sorted_values:
+                print(f"{name:<12} {order:<16} {'O(n^2), пропущено':<16}")
+                continue
+            start = time.perf_counter()
+            structure = cls()
+            for value in values:  # O(n log n)
+                structure.insert(value)
+            build_time = time.perf_counter() - start
+            search_time = measure_search_time(structure, search_values)
+            print(f"{name:<12} {order:<16} {build_time:<16.2f} {search_time:<12.2f} {structure.height():<14}")
+
+
+def compare_bulk_build(size: int = 1000000):
+    """Построение BST: поэлементные вставки против from_sorted/from_iterable и rebalance()"""
+    print(f"\nМассовое построение BST ({size} значений)")
+    print(f"{'Способ':<28} {'Время (с)':<12} {'Высота':<8}")
+    print("-" * 50)
+    values = random.sample(range(size * 10), size)  # O(n)
+    sorted_values = sorted(values)
+    
+    def build_by_insert():
+        tree = BinarySearchTree()
+        for value in values:  # O(n log n) в среднем
+            tree.insert(value)
+        return tree
+    
+    builders = {
+        "insert() по одному": build_by_insert,
+        "from_iterable()": lambda: BinarySearchTree.from_iterable(values),
+        "from_sorted()": lambda: BinarySearchTree.from_sorted(sorted_values),
+    }
+    for name, build in builders.items():
+        start = time.perf_counter()
+        tree = build()
+        print(f"{name:<28} {time.perf_counter() - start:<12.2f} {tree.height():<8}")
+    
+    # Вырожденное дерево из цепочки: перестройка без поэлементных вставок
+    chain = BinarySearchTree()
+    previous = None
+    for value in sorted_values:  # O(n) - та же цепочка, что дали бы отсортированные вставки, без O(n^2)
+        node = TreeNode(value)
+        if previous is None:
+            chain.root = node
+        else:
+            previous.right = node
+        previous = node
+    start = time.perf_counter()
+    chain.rebalance()  # O(n)
+    print(f"{'rebalance() вырожденного':<28} {time.perf_counter() - start:<12.2f} {chain.height():<8}")
+    print(f"Минимальная высота: {math.ceil(math.log2(size + 1))}")
+
+
+class PlainTreeNode:
+    """Узел с __dict__ (как TreeNode до __slots__) - базовая линия для сравнения памяти"""
+    def __init__(self, value: int):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+class PlainTree(BinarySearchTree):
+    """BinarySearchTree на узлах с __dict__"""
+    node_type = PlainTreeNode
+
+
+def compare_node_storage(size: int = 1000000):
+    """Память и время построения узлов: объекты с __dict__, __slots__ и массивы с индексами
+    
+    Рассчитано и на size = 10 000 000 (около 1 ГБ для узлов с __dict__).
+    """
+    print(f"\nХранение узлов дерева ({size} значений, сбалансированное построение)")
+    print(f"{'Узлы':<30} {'Построение (с)':<16} {'Байт/узел':<11} {'Поисков/с':<12}")
+    print("-" * 70)
+    values = list(range(0, size * 2, 2))  # O(n) - значения созданы заранее и не считаются
+    search_values = random.sample(range(size * 2), 100000)
+    variants = {
+        "TreeNode с __dict__": PlainTree.from_sorted,
+        "TreeNode с __slots__": BinarySearchTree.from_sorted,
+        "ArrayBST (array + индексы)": ArrayBST.from_sorted,
+    }
+    for name, build in variants.items():
+        start = time.perf_counter()
+        tree = build(values)  # время - без tracemalloc, он замедляет выделения
+        build_time = time.perf_counter() - start
+        search_time = measure_search_time(tree, search_values) / 1000  # с
+        del tree
+        tracemalloc.start()
+        tree = build(values)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+        print(f"{name:<30} {build_time:<16.2f} {memory / size:<11.1f} {len(search_values) / search_time:<12.0f}")
+
+
+def compare_ordered_indexes(size: int = 200000):
+    """Память на значение и скорость поиска: BST, AVL и B+-дерево"""
+    print(f"\nУпорядоченные индексы ({size} случайных значений)")
+    print(f"{'Структура':<26} {'Построение (с)':<16} {'Байт/значение':<15} {'Поисков/с':<12}")
+    print("-" * 70)
+    values = random.sample(range(size * 10), size)  # O(n)
+    sorted_values = sorted(values)
+    search_values = random.sample(range(size * 10), 100000)
+    
+    def build_by_insert(tree):
+        for value in values:  # случайный порядок: у BST высота O(log n) в среднем
+            tree.insert(value)
+        return tree
+    
+    builders = {
+        "BinarySearchTree": lambda: build_by_insert(BinarySearchTree()),
+        "AVLTree": lambda: build_by_insert(AVLTree()),
+        "BPlusTree (вставки)": lambda: build_by_insert(BPlusTree()),
+        "BPlusTree.from_sorted": lambda: BPlusTree.from_sorted(sorted_values),
+    }
+    for name, build in builders.items():
+        tracemalloc.start()
+        start = time.perf_counter()
+        tree = build()
+        build_time = time.perf_counter() - start
+        memory, peak = tracemalloc.get_traced_memory()  # сами значения созданы заранее и не считаются
+        tracemalloc.stop()
+        search_time = measure_search_time(tree, search_values) / 1000  # с
+        print(f"{name:<26} {build_time:<16.2f} {memory / size:<15.1f} {len(search_values) / search_time:<12.0f}")
+    
+    # Диапазонный запрос: B+-дерево идет по связанным листьям
+    low = sorted_values[size // 2]
+    high = low + size // 10  # около 1% значений
+    tree = BPlusTree.from_sorted(sorted_values)
+    start = time.perf_counter()
+    found = sum(1 for _ in tree.range(low, high))
+    print(f"Диапазон [{low}, {high}] в B+-дереве: {found} значений за {(time.perf_counter() - start) * 1000:.3f} мс")
+
+
+def compare_range_queries(size: int = 200000, queries: int = 100):
+    """Диапазонные запросы и порядковые статистики против полного обхода дерева"""
+    print(f"\nДиапазонные запросы ({size} значений, {queries} запросов)")
+    print("-" * 60)
+    values = random.sample(range(size * 10), size)  # O(n)
+    tree = AVLTree()
+    for value in values:  # O(n log n)
+        tree.insert(value)
+    lows = [random.randrange(size * 10) for _ in range(queries)]
+    width = 1000  # около 100 значений в диапазоне
+    
+    start = time.perf_counter()
+    full = [[v for v in tree.inorder_traversal() if low <= v <= low + width] for low in lows]  # O(n) на запрос
+    full_time = time.perf_counter() - start
+    start = time.perf_counter()
+    scanned = [list(tree.range(low, low + width)) for low in lows]  # O(log n + k) на запрос
+    range_time = time.perf_counter() - start
+    assert full == scanned
+    print(f"Полный обход + фильтр: {full_time / queries * 1000:.3f} мс/запрос")
+    print(f"range(low, high):      {range_time / queries * 1000:.3f} мс/запрос "
+          f"(в {full_time / range_time:.0f} раз быстрее)")
+    
+    start = time.perf_counter()
+    for low in lows:
+        tree.rank(low)  # O(log n)
+        tree.select(low % size)  # O(log n)
+    order_time = time.perf_counter() - start
+    print(f"rank + select:         {order_time / queries * 1000:.4f} мс/запрос")
+
+
+def compare_snapshots(size: int = 100000, versions: int = 1000):
+    """Версии упорядоченного словаря: копирование пути против copy.deepcopy дерева"""
+    print(f"\nСнимки после каждого изменения ({size} ключей)")
+    print(f"{'Способ':<34} {'Версий':<8} {'мс/версия':<11} {'КБ/версия':<10}")
+    print("-" * 66)
+    keys = random.sample(range(size * 10), size)  # O(n)
+    updates = [random.randrange(size * 10) for _ in range(versions * 2)]  # вторая половина - для замера памяти
+    
+    def measure(name, count, make_version):
+        snapshots = []  # все версии остаются доступными
+        start = time.perf_counter()
+        for i in range(count):  # время - без tracemalloc, он во много раз замедляет deepcopy
+            snapshots.append(make_version(i))
+        elapsed = time.perf_counter() - start
+        samples = max(1, count // 10)
+        tracemalloc.start()
+        for i in range(samples):  # память новых версий поверх уже существующих
+            snapshots.append(make_version(count + i))
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{name:<34} {count:<8} {elapsed / count * 1000:<11.3f} {memory / samples / 1024:<10.1f}")
+    
+    bst = BinarySearchTree.from_iterable(keys)  # O(n)
+    
+    def deepcopy_version(i):
+        bst.insert(updates[i])  # O(log n)
+        return copy.deepcopy(bst)  # O(n) - копия всех узлов
+    
+    measure("BinarySearchTree + deepcopy", max(1, versions // 200), deepcopy_version)
+    
+    version = PersistentTree()
+    for key in keys:  # O(n log n)
+        version = version.insert(key, key)
+    
+    def persistent_version(i):
+        nonlocal version
+        version = version.insert(updates[i], i)  # O(log n) новых узлов, остальное общее
+        return version
+    
+    measure("PersistentTree (копирование пути)", versions, persistent_version)
 
 
 def test_bst_operations():
@@ -99,4 +360,9 @@ def test_bst_operations():
 if __name__ == "__main__":
     test_bst_operations()
     print("\n" + "=" * 60)
-    analyze_trees()
\ No newline at end of file
+    analyze_trees()
+    compare_bulk_build()
+    compare_node_storage()
+    compare_ordered_indexes()
+    compare_range_queries()
+    compare_snapshots()
\ No newline at end of file
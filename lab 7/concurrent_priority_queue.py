@@ -0,0 +1,153 @@
+import asyncio
+import itertools
+import queue
+import threading
+from collections import deque
+from heap import MinHeap
+
+
+class BlockingPriorityQueue:
+    """Потокобезопасная блокирующая очередь с приоритетом на основе min-heap"""
+    
+    def __init__(self, maxsize: int = 0, heap_class=MinHeap):
+        self.maxsize = maxsize  # O(1) - 0 означает неограниченную очередь
+        self.heap = heap_class()  # O(1) - записи (приоритет, порядковый номер, элемент)
+        self._counter = itertools.count()  # O(1) - FIFO при равных приоритетах
+        self._lock = threading.Lock()  # O(1)
+        self._not_empty = threading.Condition(self._lock)  # O(1) - ожидание элементов
+        self._not_full = threading.Condition(self._lock)  # O(1) - ожидание места (backpressure)
+    
+    def _is_full(self) -> bool:
+        """Проверка заполненности (вызывается под блокировкой)"""
+        return 0 < self.maxsize <= len(self.heap)  # O(1)
+    
+    @staticmethod
+    def _wait(condition: threading.Condition, predicate, block: bool, timeout) -> bool:
+        """Ожидание условия с таймаутом, возвращает False при неуспехе"""
+        if not block:
+            return predicate()  # O(1)
+        if timeout is not None and timeout < 0:
+            raise ValueError("Таймаут должен быть неотрицательным")
+        return condition.wait_for(predicate, timeout)  # пробуждение по notify, без опроса
+    
+    def put(self, item, priority, block: bool = True, timeout: float = None) -> None:
+        """Добавление элемента; при заполненной очереди ждет освобождения места"""
+        with self._not_full:
+            if not self._wait(self._not_full, lambda: not self._is_full(), block, timeout):
+                raise queue.Full
+            self.heap.insert((priority, next(self._counter), item))  # O(log n)
+            self._not_empty.notify()  # O(1) - будим одного потребителя
+    
+    def get(self, block: bool = True, timeout: float = None):
+        """Извлечение элемента с наивысшим приоритетом; при пустой очереди ждет"""
+        with self._not_empty:
+            if not self._wait(self._not_empty, lambda: not self.heap.is_empty(), block, timeout):
+                raise queue.Empty
+            priority, order, item = self.heap.extract_min()  # O(log n)
+            self._not_full.notify()  # O(1) - будим одного производителя
+            return item
+    
+    def put_nowait(self, item, priority) -> None:
+        """Добавление без ожидания (queue.Full при заполненной очереди)"""
+        self.put(item, priority, block=False)
+    
+    def get_nowait(self):
+        """Извлечение без ожидания (queue.Empty при пустой очереди)"""
+        return self.get(block=False)
+    
+    def qsize(self) -> int:
+        """Текущий размер очереди"""
+        with self._lock:
+            return len(self.heap)  # O(1)
+    
+    def empty(self) -> bool:
+        """Проверка на пустоту"""
+        return self.qsize() == 0  # O(1)
+    
+    def full(self) -> bool:
+        """Проверка заполненности"""
+        with self._lock:
+            return self._is_full()  # O(1)
+    
+    def __len__(self) -> int:
+        """Размер очереди"""
+        return self.qsize()  # O(1)
+
+
+class AsyncPriorityQueue:
+    """Очередь с приоритетом для asyncio: await put()/await get() на основе min-heap"""
+    
+    def __init__(self, maxsize: int = 0, heap_class=MinHeap):
+        self.maxsize = maxsize  # O(1) - 0 означает неограниченную очередь
+        self.heap = heap_class()  # O(1) - записи (приоритет, порядковый номер, элемент)
+        self._counter = itertools.count()  # O(1) - FIFO при равных приоритетах
+        self._getters = deque()  # O(1) - future ожидающих потребителей
+        self._putters = deque()  # O(1) - future ожидающих производителей
+    
+    @staticmethod
+    def _wakeup_next(waiters: deque) -> None:
+        """Пробуждение первого еще ожидающего future"""
+        while waiters:
+            waiter = waiters.popleft()  # O(1)
+            if not waiter.done():
+                waiter.set_result(None)  # O(1)
+                break
+    
+    async def _wait(self, waiters: deque, predicate) -> None:
+        """Ожидание, пока predicate не станет ложным"""
+        while predicate():
+            waiter = asyncio.get_running_loop().create_future()  # O(1)
+            waiters.append(waiter)  # O(1)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)  # O(k) - только при отмене
+                except ValueError:
+                    pass
+                # Если нас разбудили, но задачу отменили - передаем пробуждение следующему
+                if not predicate() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+    
+    def full(self) -> bool:
+        """Проверка заполненности"""
+        return 0 < self.maxsize <= len(self.heap)  # O(1)
+    
+    def empty(self) -> bool:
+        """Проверка на пустоту"""
+        return self.heap.is_empty()  # O(1)
+    
+    def qsize(self) -> int:
+        """Текущий размер очереди"""
+        return len(self.heap)  # O(1)
+    
+    def put_nowait(self, item, priority) -> None:
+        """Добавление без ожидания (asyncio.QueueFull при заполненной очереди)"""
+        if self.full():
+            raise asyncio.QueueFull
+        self.heap.insert((priority, next(self._counter), item))  # O(log n)
+        self._wakeup_next(self._getters)  # O(1)
+    
+    def get_nowait(self):
+        """Извлечение без ожидания (asyncio.QueueEmpty при пустой очереди)"""
+        if self.heap.is_empty():
+            raise asyncio.QueueEmpty
+        priority, order, item = self.heap.extract_min()  # O(log n)
+        self._wakeup_next(self._putters)  # O(1)
+        return item
+    
+    async def put(self, item, priority) -> None:
+        """Добавление элемента; при заполненной очереди ждет освобождения места"""
+        await self._wait(self._putters, self.full)
+        self.put_nowait(item, priority)
+    
+    async def get(self):
+        """Извлечение элемента с наивысшим приоритетом; при пустой очереди ждет"""
+        await self._wait(self._getters, self.empty)
+        return self.get_nowait()
+    
+    def __len__(self) -> int:
+        """Размер очереди"""
+        return len(self.heap)  # O(1)
\ No newline at end of file
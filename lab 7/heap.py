@@ -94,10 +94,316 @@ class MinHeap:
         for i in range(len(self.heap) // 2 - 1, -1, -1):  # O(n/2) итераций
             self._sift_down(i)  # O(log n) каждая
             
+    def decrease_key(self, index: int, value: int) -> None:
+        """Уменьшение значения элемента по индексу в массиве"""
+        if value > self.heap[index]:  # O(1)
+            raise ValueError("Новое значение больше текущего")
+        self.heap[index] = value  # O(1)
+        self._sift_up(index)  # O(log n) - всплытие
+            
     def __len__(self) -> int:
         """Размер кучи"""
         return len(self.heap)  # O(1)
         
     def is_empty(self) -> bool:
         """Проверка на пустоту"""
-        return len(self.heap) == 0  # O(1)
\ No newline at end of file
+        return len(self.heap) == 0  # O(1)
+
+
+class DaryMinHeap(MinHeap):
+    """d-арная Min-Heap: у каждого узла до d потомков (дерево ниже, меньше уровней)"""
+    
+    def __init__(self, d: int = 4):
+        if d < 2:
+            raise ValueError("Арность кучи должна быть не меньше 2")
+        super().__init__()  # O(1)
+        self.d = d  # O(1)
+        
+    def _parent_index(self, index: int) -> int:
+        """Индекс родителя для узла с заданным индексом"""
+        return (index - 1) // self.d  # O(1)
+        
+    def _left_child_index(self, index: int) -> int:
+        """Индекс первого (самого левого) потомка"""
+        return self.d * index + 1  # O(1)
+        
+    def _sift_up(self, index: int) -> None:
+        """Всплытие элемента (перенос "дырки" вместо обменов)"""
+        heap = self.heap  # O(1)
+        d = self.d  # O(1)
+        value = heap[index]  # O(1)
+        # O(log_d n) - подъем от листа к корню
+        while index > 0:
+            parent = (index - 1) // d  # O(1)
+            if not value < heap[parent]:  # O(1)
+                break
+            heap[index] = heap[parent]  # O(1) - сдвиг родителя вниз
+            index = parent  # O(1)
+        heap[index] = value  # O(1)
+        
+    def _sift_down(self, index: int) -> None:
+        """Погружение элемента (перенос "дырки" вместо обменов)"""
+        heap = self.heap  # O(1)
+        d = self.d  # O(1)
+        n = len(heap)  # O(1)
+        value = heap[index]  # O(1)
+        # O(d log_d n) - на каждом уровне выбирается наименьший из d потомков
+        while True:
+            first = d * index + 1  # O(1)
+            if first >= n:
+                break
+            smallest = first  # O(1)
+            for child in range(first + 1, min(first + d, n)):  # O(d)
+                if heap[child] < heap[smallest]:
+                    smallest = child
+            if not heap[smallest] < value:  # O(1)
+                break
+            heap[index] = heap[smallest]  # O(1) - сдвиг потомка вверх
+            index = smallest  # O(1)
+        heap[index] = value  # O(1)
+        
+    def build_heap(self, array: list) -> None:
+        """Построение кучи из произвольного массива (алгоритм Флойда)"""
+        self.heap = array[:]  # O(n) - копирование массива
+        # Последний нелистовой узел - родитель последнего элемента
+        for i in range((len(self.heap) - 2) // self.d, -1, -1):  # O(n)
+            self._sift_down(i)
+
+
+class PairingNode:
+    """Узел pairing heap (левый потомок - правый брат)"""
+    __slots__ = ("value", "child", "sibling", "prev", "heap")
+    
+    def __init__(self, value):
+        self.value = value  # O(1)
+        self.child = None  # O(1) - самый левый потомок
+        self.sibling = None  # O(1) - следующий брат
+        self.prev = None  # O(1) - левый брат или родитель (для самого левого потомка)
+        self.heap = None  # O(1) - метка кучи-владельца (None - узел не в куче)
+
+
+class PairingOwner:
+    """Метка владельца узлов pairing heap; после слияния ссылается на метку принявшей кучи"""
+    __slots__ = ("parent",)
+    
+    def __init__(self):
+        self.parent = None  # O(1) - None у метки, принадлежащей куче сейчас
+
+
+class PairingHeap:
+    """Pairing heap: вставка и слияние за O(1), извлечение минимума за O(log n) амортизированно"""
+    
+    def __init__(self):
+        self.root = None  # O(1)
+        self.size = 0  # O(1)
+        self.owner = PairingOwner()  # O(1) - метка, которую получают узлы этой кучи
+        
+    @staticmethod
+    def _find_owner(owner: PairingOwner) -> PairingOwner:
+        """Текущая метка по цепочке слияний (со сжатием пути)"""
+        root = owner
+        while root.parent is not None:  # O(α(n)) амортизированно
+            root = root.parent
+        while owner is not root:
+            owner.parent, owner = root, owner.parent  # O(1) - сжатие пути
+        return root
+        
+    @staticmethod
+    def _link(a: PairingNode, b: PairingNode) -> PairingNode:
+        """Связывание двух корней: больший становится самым левым потомком меньшего"""
+        if b.value < a.value:  # O(1)
+            a, b = b, a
+        b.sibling = a.child  # O(1)
+        if a.child is not None:
+            a.child.prev = b  # O(1)
+        b.prev = a  # O(1)
+        a.child = b  # O(1)
+        return a
+        
+    def _merge_pairs(self, first: PairingNode) -> PairingNode:
+        """Двухпроходное попарное слияние списка братьев (итеративно)"""
+        pairs = []  # O(1)
+        node = first
+        # Первый проход: слияние соседних пар слева направо
+        while node is not None:  # O(k) где k - число потомков
+            a = node
+            b = a.sibling
+            if b is None:
+                a.prev = None
+                pairs.append(a)
+                break
+            node = b.sibling
+            a.prev = a.sibling = b.prev = b.sibling = None  # O(1) - отсоединение
+            pairs.append(self._link(a, b))
+        # Второй проход: слияние результатов справа налево
+        result = pairs.pop()  # O(1)
+        while pairs:  # O(k)
+            result = self._link(pairs.pop(), result)
+        return result
+        
+    def insert(self, value) -> PairingNode:
+        """Вставка элемента, возвращает узел для decrease_key"""
+        node = PairingNode(value)  # O(1)
+        node.heap = self.owner  # O(1)
+        self.root = node if self.root is None else self._link(self.root, node)  # O(1)
+        self.size += 1  # O(1)
+        return node
+        
+    def extract_min(self):
+        """Извлечение минимального элемента (корня)"""
+        if self.root is None:  # O(1)
+            raise IndexError("Куча пуста")
+        root = self.root  # O(1)
+        self.root = None if root.child is None else self._merge_pairs(root.child)  # O(log n) амортизированно
+        root.child = root.prev = root.sibling = root.heap = None  # O(1) - узел больше не принадлежит куче
+        self.size -= 1  # O(1)
+        return root.value
+        
+    def peek(self):
+        """Получение минимального элемента без удаления"""
+        if self.root is None:  # O(1)
+            raise IndexError("Куча пуста")
+        return self.root.value  # O(1)
+        
+    def decrease_key(self, node: PairingNode, value) -> None:
+        """Уменьшение значения узла: поддерево отрезается и связывается с корнем"""
+        if not self.contains_node(node):  # O(α(n)) - извлеченный узел или узел другой кучи
+            raise ValueError("Узел не находится в куче")
+        if value > node.value:  # O(1)
+            raise ValueError("Новое значение больше текущего")
+        node.value = value  # O(1)
+        if node is self.root:  # O(1)
+            return
+        # Вырезаем поддерево узла из списка братьев
+        if node.prev.child is node:  # O(1) - узел является самым левым потомком
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev  # O(1)
+        node.prev = node.sibling = None  # O(1)
+        self.root = self._link(self.root, node)  # O(1)
+        
+    def contains_node(self, node: PairingNode) -> bool:
+        """Проверка, что узел все еще находится в куче"""
+        return node.heap is not None and self._find_owner(node.heap) is self.owner  # O(α(n))
+        
+    def merge(self, other: "PairingHeap") -> None:
+        """Слияние с другой кучей за O(1); другая куча становится пустой"""
+        if other is self:
+            return
+        if other.root is not None:
+            self.root = other.root if self.root is None else self._link(self.root, other.root)  # O(1)
+        self.size += other.size  # O(1)
+        other.owner.parent = self.owner  # O(1) - узлы другой кучи переходят к этой без обхода
+        other.owner = PairingOwner()  # O(1)
+        other.root = None  # O(1)
+        other.size = 0  # O(1)
+        
+    def build_heap(self, array: list) -> None:
+        """Построение кучи из массива (n вставок по O(1))"""
+        self.root = None  # O(1)
+        self.size = 0  # O(1)
+        self.owner = PairingOwner()  # O(1) - старые узлы больше не принадлежат куче
+        for value in array:  # O(n)
+            self.insert(value)
+            
+    def __len__(self) -> int:
+        """Размер кучи"""
+        return self.size  # O(1)
+        
+    def is_empty(self) -> bool:
+        """Проверка на пустоту"""
+        return self.root is None  # O(1)
+
+
+class LeftistNode:
+    """Узел левосторонней кучи"""
+    __slots__ = ("value", "left", "right", "rank")
+    
+    def __init__(self, value):
+        self.value = value  # O(1)
+        self.left = None  # O(1)
+        self.right = None  # O(1)
+        self.rank = 1  # O(1) - длина правого пути до пустого узла
+
+
+class LeftistHeap:
+    """Левосторонняя куча (leftist heap): слияние двух куч за O(log n)"""
+    
+    def __init__(self):
+        self.root = None  # O(1)
+        self.size = 0  # O(1)
+        
+    @staticmethod
+    def _merge_nodes(a: LeftistNode, b: LeftistNode) -> LeftistNode:
+        """Слияние двух деревьев вдоль правых путей (итеративно)"""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        # Спуск по правым путям: на каждом шаге корнем становится меньший узел
+        path = []  # O(log n) - длина правого пути
+        while a is not None and b is not None:
+            if b.value < a.value:  # O(1)
+                a, b = b, a
+            path.append(a)  # O(1)
+            a = a.right  # O(1)
+        tail = a if a is not None else b  # O(1)
+        # Подъем: подвешиваем результат справа и восстанавливаем левосторонность
+        while path:  # O(log n)
+            node = path.pop()
+            node.right = tail
+            left_rank = node.left.rank if node.left is not None else 0
+            if left_rank < tail.rank:  # O(1) - правый путь должен быть не длиннее левого
+                node.left, node.right = node.right, node.left
+            node.rank = node.right.rank + 1 if node.right is not None else 1
+            tail = node
+        return tail
+        
+    def insert(self, value) -> None:
+        """Вставка элемента (слияние с одноэлементной кучей)"""
+        self.root = self._merge_nodes(self.root, LeftistNode(value))  # O(log n)
+        self.size += 1  # O(1)
+        
+    def extract_min(self):
+        """Извлечение минимального элемента (слияние поддеревьев корня)"""
+        if self.root is None:  # O(1)
+            raise IndexError("Куча пуста")
+        root = self.root  # O(1)
+        self.root = self._merge_nodes(root.left, root.right)  # O(log n)
+        self.size -= 1  # O(1)
+        return root.value
+        
+    def peek(self):
+        """Получение минимального элемента без удаления"""
+        if self.root is None:  # O(1)
+            raise IndexError("Куча пуста")
+        return self.root.value  # O(1)
+        
+    def merge(self, other: "LeftistHeap") -> None:
+        """Слияние с другой кучей за O(log n); другая куча становится пустой"""
+        self.root = self._merge_nodes(self.root, other.root)  # O(log n)
+        self.size += other.size  # O(1)
+        other.root = None  # O(1)
+        other.size = 0  # O(1)
+        
+    def build_heap(self, array: list) -> None:
+        """Построение кучи попарными слияниями за O(n)"""
+        queue = [LeftistNode(value) for value in array]  # O(n)
+        # Слияния по уровням: n/2 + n/4 + ... слияний небольших куч дают O(n)
+        while len(queue) > 1:
+            merged = [self._merge_nodes(queue[i], queue[i + 1]) for i in range(0, len(queue) - 1, 2)]
+            if len(queue) % 2:
+                merged.append(queue[-1])
+            queue = merged
+        self.root = queue[0] if queue else None  # O(1)
+        self.size = len(array)  # O(1)
+        
+    def __len__(self) -> int:
+        """Размер кучи"""
+        return self.size  # O(1)
+        
+    def is_empty(self) -> bool:
+        """Проверка на пустоту"""
+        return self.root is None  # O(1)
\ No newline at end of file
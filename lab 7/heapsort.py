@@ -41,4 +41,72 @@ def heapsort_inplace(array: list) -> None:
     # Извлечение элементов из кучи
     for i in range(n - 1, 0, -1):  # O(n) итераций
         array[0], array[i] = array[i], array[0]  # O(1)
-        _sift_down(array, i, 0)  # O(log n) каждая
\ No newline at end of file
+        _sift_down(array, i, 0)  # O(log n) каждая
+
+
+def _sift_down_floyd(array, start: int, end: int) -> None:
+    """Погружение Флойда (bottom-up) в max-heap array[start:end]"""
+    value = array[start]  # O(1) - погружаемый элемент, на его месте "дырка"
+    hole = start  # O(1)
+    child = 2 * hole + 1  # O(1)
+    # Спуск до листа по большим потомкам: одно сравнение на уровень
+    while child < end:  # O(log n)
+        if child + 1 < end and array[child] < array[child + 1]:  # O(1)
+            child += 1
+        array[hole] = array[child]  # O(1) - потомок поднимается в "дырку"
+        hole = child  # O(1)
+        child = 2 * hole + 1  # O(1)
+    # Подъем от листа: элемент обычно оказывается у самого низа, сравнений мало
+    parent = (hole - 1) // 2  # O(1)
+    while hole > start and array[parent] < value:  # O(1) в среднем
+        array[hole] = array[parent]  # O(1)
+        hole = parent  # O(1)
+        parent = (hole - 1) // 2  # O(1)
+    array[hole] = value  # O(1)
+
+
+def _sift_down_floyd_keyed(array, keys: list, start: int, end: int) -> None:
+    """Погружение Флойда по заранее вычисленным ключам (элементы переставляются вместе с ключами)"""
+    value, value_key = array[start], keys[start]  # O(1)
+    hole = start  # O(1)
+    child = 2 * hole + 1  # O(1)
+    while child < end:  # O(log n)
+        if child + 1 < end and keys[child] < keys[child + 1]:  # O(1)
+            child += 1
+        array[hole], keys[hole] = array[child], keys[child]  # O(1)
+        hole = child  # O(1)
+        child = 2 * hole + 1  # O(1)
+    parent = (hole - 1) // 2  # O(1)
+    while hole > start and keys[parent] < value_key:  # O(1) в среднем
+        array[hole], keys[hole] = array[parent], keys[parent]  # O(1)
+        hole = parent  # O(1)
+        parent = (hole - 1) // 2  # O(1)
+    array[hole], keys[hole] = value, value_key  # O(1)
+
+
+def heapsort_bottom_up(array, key=None, reverse: bool = False) -> None:
+    """In-place сортировка кучей с погружением Флойда (list, array, memoryview, NumPy)"""
+    n = len(array)  # O(1)
+    if key is None:
+        # Построение max-heap
+        for i in range(n // 2 - 1, -1, -1):  # O(n)
+            _sift_down_floyd(array, i, n)
+        # Максимум переносится в конец, остаток кучи восстанавливается
+        for end in range(n - 1, 0, -1):  # O(n log n)
+            array[0], array[end] = array[end], array[0]  # O(1)
+            _sift_down_floyd(array, 0, end)
+    else:
+        keys = [key(value) for value in array]  # O(n) - ключ вычисляется один раз на элемент
+        for i in range(n // 2 - 1, -1, -1):  # O(n)
+            _sift_down_floyd_keyed(array, keys, i, n)
+        for end in range(n - 1, 0, -1):  # O(n log n)
+            array[0], array[end] = array[end], array[0]  # O(1)
+            keys[0], keys[end] = keys[end], keys[0]  # O(1)
+            _sift_down_floyd_keyed(array, keys, 0, end)
+    if reverse:
+        # Разворот поэлементными обменами: срезы memoryview/NumPy - это представления того же буфера
+        i, j = 0, n - 1  # O(1)
+        while i < j:  # O(n)
+            array[i], array[j] = array[j], array[i]
+            i += 1
+            j -= 1
\ No newline at end of file
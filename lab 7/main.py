@@ -1,6 +1,6 @@
 from heap import MinHeap
-from heapsort import heapsort, heapsort_inplace
-from priority_queue import PriorityQueue
+from heapsort import heapsort, heapsort_inplace, heapsort_bottom_up
+from priority_queue import PriorityQueue, IndexedPriorityQueue
 
 
 def demonstrate_heap_basics():
@@ -49,6 +49,11 @@ def demonstrate_heapsort():
     array_copy = array[:]
     heapsort_inplace(array_copy)
     print("Отсортированный массив (in-place):", array_copy)
+    
+    # Погружение Флойда, сортировка по ключу и в обратном порядке
+    array_copy = array[:]
+    heapsort_bottom_up(array_copy, key=lambda x: x % 10, reverse=True)
+    print("По последней цифре, по убыванию (Флойд):", array_copy)
 
 
 def demonstrate_priority_queue():
@@ -79,6 +84,18 @@ def demonstrate_priority_queue():
     while not pq.is_empty():
         task = pq.dequeue()
         print(f"  Выполняется: '{task}'")
+    
+    # Индексированная очередь: изменение приоритета и удаление без дубликатов
+    print("\nИндексированная очередь с приоритетом:")
+    ipq = IndexedPriorityQueue()
+    for task, priority in tasks:
+        ipq.enqueue(task, priority)
+    ipq.update_priority("Планирование", 0)
+    print("  Приоритет 'Планирование' изменен на 0")
+    ipq.remove("Проверить почту")
+    print("  Задача 'Проверить почту' удалена из очереди")
+    while not ipq.is_empty():
+        print(f"  Выполняется: '{ipq.dequeue()}'")
 
 
 def demonstrate_build_heap():
@@ -127,6 +144,22 @@ def run_performance_tests():
     print("-" * 40)
     performance_analysis.compare_sorting_algorithms()
     
+    print("\nСравнение d-арных и pairing куч")
+    print("-" * 40)
+    performance_analysis.compare_heap_variants()
+    
+    print("\nСлияние очередей с приоритетом")
+    print("-" * 40)
+    performance_analysis.compare_queue_merging()
+    
+    print("\nКонкурентный доступ к очереди")
+    print("-" * 40)
+    performance_analysis.measure_queue_contention()
+    
+    print("\nКолесо таймеров")
+    print("-" * 40)
+    performance_analysis.compare_timer_wheel()
+    
     print("\nТестирование очереди с приоритетом")
     print("-" * 40)
     performance_analysis.test_priority_queue()
@@ -1,8 +1,12 @@
 import time
 import random
-from heap import MinHeap
-from heapsort import heapsort, heapsort_inplace
-from priority_queue import PriorityQueue
+import asyncio
+import threading
+from heap import MinHeap, DaryMinHeap, PairingHeap, LeftistHeap
+from heapsort import heapsort, heapsort_inplace, heapsort_bottom_up
+from priority_queue import PriorityQueue, IndexedPriorityQueue
+from timer_wheel import TimerWheel
+from concurrent_priority_queue import BlockingPriorityQueue, AsyncPriorityQueue
 
 def measure_heap_operations():
     """Измерение времени основных операций кучи"""
@@ -69,38 +73,59 @@ def compare_heap_construction():
         print(f"{size:<10} {sequential_time:<20.4f} {buildheap_time:<20.4f} {ratio:<15.2f}")
 
 
+class CountingValue:
+    """Обертка над значением, считающая сравнения"""
+    __slots__ = ("value",)
+    comparisons = 0
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __lt__(self, other):
+        CountingValue.comparisons += 1
+        return self.value < other.value
+    
+    def __gt__(self, other):
+        CountingValue.comparisons += 1
+        return self.value > other.value
+
+
+def count_comparisons(sort_function, array: list) -> int:
+    """Число сравнений, выполненных функцией сортировки на копии массива"""
+    wrapped = [CountingValue(value) for value in array]
+    CountingValue.comparisons = 0
+    sort_function(wrapped)
+    return CountingValue.comparisons
+
+
 def compare_sorting_algorithms():
-    """Сравнение алгоритмов сортировки"""
+    """Сравнение алгоритмов сортировки по времени и числу сравнений"""
     print("\n\nСравнение алгоритмов сортировки")
     print("=" * 60)
     
     sizes = [100, 500, 1000, 5000]
-    
-    print(f"{'Размер':<10} {'HeapSort (мс)':<20} {'QuickSort (мс)':<20} {'MergeSort (мс)':<20}")
-    print("-" * 60)
+    algorithms = {
+        "HeapSort (MinHeap)": heapsort,
+        "HeapSort in-place": heapsort_inplace,
+        "HeapSort Флойда": heapsort_bottom_up,
+        "sorted() (Timsort)": sorted,
+        "MergeSort": merge_sort,
+    }
     
     for size in sizes:
         array = [random.randint(1, 10000) for _ in range(size)]
         
-        # HeapSort
-        arr_copy = array[:]
-        start = time.perf_counter()
-        heapsort(arr_copy)
-        heapsort_time = (time.perf_counter() - start) * 1000
-        
-        # QuickSort (встроенная)
-        arr_copy = array[:]
-        start = time.perf_counter()
-        sorted(arr_copy)
-        quicksort_time = (time.perf_counter() - start) * 1000
-        
-        # MergeSort (реализация)
-        arr_copy = array[:]
-        start = time.perf_counter()
-        merge_sort(arr_copy)
-        mergesort_time = (time.perf_counter() - start) * 1000
-        
-        print(f"{size:<10} {heapsort_time:<20.4f} {quicksort_time:<20.4f} {mergesort_time:<20.4f}")
+        print(f"\nРазмер массива: {size}")
+        print(f"{'Алгоритм':<22} {'Время (мс)':<15} {'Сравнений':<15}")
+        print("-" * 52)
+        for name, sort_function in algorithms.items():
+            arr_copy = array[:]
+            start = time.perf_counter()
+            sort_function(arr_copy)
+            elapsed = (time.perf_counter() - start) * 1000
+            
+            comparisons = count_comparisons(sort_function, array)
+            print(f"{name:<22} {elapsed:<15.4f} {comparisons:<15}")
 
 
 def merge_sort(arr):
@@ -127,6 +152,249 @@ def merge_sort(arr):
     return result
 
 
+def generate_workload(mix: dict, operations: int, seed: int = 42) -> list:
+    """Генерация последовательности операций с заданными долями"""
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    return rng.choices(kinds, weights=weights, k=operations)  # O(m)
+
+
+def run_heap_workload(heap_factory, prefill: list, workload: list, seed: int = 7) -> float:
+    """Выполнение смеси операций над кучей, возвращает время в мс"""
+    rng = random.Random(seed)
+    heap = heap_factory()
+    is_pairing = isinstance(heap, PairingHeap)
+    handles = []  # узлы pairing heap для decrease_key
+    if is_pairing:
+        handles = [heap.insert(value) for value in prefill]
+    else:
+        heap.build_heap(prefill)
+    
+    start = time.perf_counter()
+    for op in workload:
+        if op == "insert":
+            node = heap.insert(rng.randint(1, 1_000_000))
+            if is_pairing:
+                handles.append(node)
+        elif op == "extract":
+            if not heap.is_empty():
+                heap.extract_min()
+        elif len(heap) > 0:  # decrease-key
+            if is_pairing:
+                i = rng.randrange(len(handles))
+                node = handles[i]
+                if heap.contains_node(node):
+                    heap.decrease_key(node, node.value - rng.randint(1, 1000))
+                else:
+                    # Узел уже извлечен - удаляем ручку обменом с последней
+                    handles[i] = handles[-1]
+                    handles.pop()
+            else:
+                i = rng.randrange(len(heap))
+                heap.decrease_key(i, heap.heap[i] - rng.randint(1, 1000))
+    return (time.perf_counter() - start) * 1000
+
+
+def compare_heap_variants():
+    """Сравнение бинарной, d-арных и pairing куч на разных смесях операций"""
+    print("\n\nСравнение вариантов кучи на смесях операций")
+    print("=" * 60)
+    
+    prefill_size = 10000
+    operations = 30000
+    workloads = {
+        "Вставки (80/20/0)": {"insert": 80, "extract": 20, "decrease": 0},
+        "Извлечения (20/80/0)": {"insert": 20, "extract": 80, "decrease": 0},
+        "Decrease-key (15/15/70)": {"insert": 15, "extract": 15, "decrease": 70},
+    }
+    variants = {
+        "Binary": MinHeap,
+        "2-ary": lambda: DaryMinHeap(2),
+        "4-ary": lambda: DaryMinHeap(4),
+        "8-ary": lambda: DaryMinHeap(8),
+        "Pairing": PairingHeap,
+    }
+    
+    prefill = [random.randint(1, 1_000_000) for _ in range(prefill_size)]
+    print(f"Начальный размер: {prefill_size}, операций: {operations} (вставка/извлечение/decrease-key, %)")
+    header = f"{'Нагрузка':<26}" + "".join(f"{name + ' (мс)':<15}" for name in variants)
+    print(header)
+    print("-" * len(header))
+    
+    for workload_name, mix in workloads.items():
+        workload = generate_workload(mix, operations)
+        row = f"{workload_name:<26}"
+        times = {}
+        for name, factory in variants.items():
+            times[name] = run_heap_workload(factory, prefill, workload)
+            row += f"{times[name]:<15.2f}"
+        best = min(times, key=times.get)
+        print(row + f"лучше: {best}")
+
+
+def compare_queue_merging():
+    """Сравнение слияния 64 очередей-шардов в одну для разных куч"""
+    print("\n\nСлияние 64 очередей-шардов в одну")
+    print("=" * 60)
+    
+    shards_count = 64
+    shard_sizes = [100, 500, 2000]
+    variants = {"MinHeap": MinHeap, "LeftistHeap": LeftistHeap, "PairingHeap": PairingHeap}
+    
+    print(f"{'Размер шарда':<14} {'Куча':<14} {'Всего (мс)':<14} {'Макс. пауза (мс)':<18}")
+    print("-" * 60)
+    
+    for shard_size in shard_sizes:
+        data = [[(random.randint(1, 1_000_000), f"task-{s}-{i}") for i in range(shard_size)]
+                for s in range(shards_count)]
+        for name, heap_class in variants.items():
+            shards = []
+            for shard_data in data:
+                pq = PriorityQueue(heap_class)
+                pq.heap.build_heap(shard_data)
+                shards.append(pq)
+            
+            dispatcher = PriorityQueue(heap_class)
+            pauses = []
+            for pq in shards:
+                start = time.perf_counter()
+                dispatcher.merge(pq)
+                pauses.append((time.perf_counter() - start) * 1000)
+            
+            assert len(dispatcher) == shards_count * shard_size
+            print(f"{shard_size:<14} {name:<14} {sum(pauses):<14.4f} {max(pauses):<18.4f}")
+        print()
+
+
+def run_threaded_workers(put, get, producers: int, consumers: int, items: int) -> float:
+    """Запуск производителей и потребителей, возвращает пропускную способность (элементов/с)"""
+    stop = object()
+    per_producer = items // producers
+    
+    def producer(seed):
+        rng = random.Random(seed)
+        for _ in range(per_producer):
+            put(f"task-{seed}", rng.randint(1, 1000))
+    
+    def consumer():
+        while get() is not stop:
+            pass
+    
+    consumer_threads = [threading.Thread(target=consumer) for _ in range(consumers)]
+    producer_threads = [threading.Thread(target=producer, args=(i,)) for i in range(producers)]
+    start = time.perf_counter()
+    for t in consumer_threads + producer_threads:
+        t.start()
+    for t in producer_threads:
+        t.join()
+    for _ in range(consumers):
+        put(stop, float("inf"))  # стоп-сигнал извлекается после всех задач
+    for t in consumer_threads:
+        t.join()
+    return per_producer * producers / (time.perf_counter() - start)
+
+
+def measure_queue_contention():
+    """Пропускная способность очередей при многих производителях и потребителях"""
+    print("\n\nКонкурентный доступ к очереди с приоритетом")
+    print("=" * 60)
+    
+    items = 20000
+    configurations = [(1, 1), (4, 4), (16, 16), (16, 2), (2, 16)]
+    
+    print(f"{'Произв./потреб.':<18} {'Блокирующая (эл/с)':<22} {'Опрос с Lock (эл/с)':<22} {'Async (эл/с)':<15}")
+    print("-" * 80)
+    
+    for producers, consumers in configurations:
+        # Блокирующая очередь: потребители спят на условной переменной
+        bpq = BlockingPriorityQueue(maxsize=1000)
+        blocking = run_threaded_workers(bpq.put, bpq.get, producers, consumers, items)
+        
+        # Базовый вариант: PriorityQueue под общим Lock с активным опросом
+        pq = PriorityQueue()
+        lock = threading.Lock()
+        counter = iter(range(10 ** 9))  # уникальный второй ключ, чтобы не сравнивать элементы
+        
+        def polling_put(item, priority):
+            with lock:
+                pq.enqueue(item, (priority, next(counter)))
+        
+        def polling_get():
+            while True:
+                with lock:
+                    if not pq.is_empty():
+                        return pq.dequeue()
+                time.sleep(0)  # уступаем процессор и повторяем попытку
+        
+        polling = run_threaded_workers(polling_put, polling_get, producers, consumers, items)
+        
+        # asyncio: корутины-производители и потребители на одном цикле событий
+        async_rate = asyncio.run(run_async_workers(producers, consumers, items))
+        
+        config = f"{producers}/{consumers}"
+        print(f"{config:<18} {blocking:<22.0f} {polling:<22.0f} {async_rate:<15.0f}")
+
+
+async def run_async_workers(producers: int, consumers: int, items: int) -> float:
+    """Производители и потребители asyncio, возвращает пропускную способность (элементов/с)"""
+    apq = AsyncPriorityQueue(maxsize=1000)
+    stop = object()
+    per_producer = items // producers
+    
+    async def producer(seed):
+        rng = random.Random(seed)
+        for _ in range(per_producer):
+            await apq.put(f"task-{seed}", rng.randint(1, 1000))
+    
+    async def consumer():
+        while await apq.get() is not stop:
+            pass
+    
+    start = time.perf_counter()
+    consumer_tasks = [asyncio.create_task(consumer()) for _ in range(consumers)]
+    await asyncio.gather(*(producer(i) for i in range(producers)))
+    for _ in range(consumers):
+        await apq.put(stop, float("inf"))
+    await asyncio.gather(*consumer_tasks)
+    return per_producer * producers / (time.perf_counter() - start)
+
+
+def run_timer_workload(queue, times: list, cancel_every: int = 0) -> float:
+    """Планирование таймеров, отмена каждого cancel_every-го и извлечение всех; время в мс"""
+    start = time.perf_counter()
+    handles = [queue.enqueue(i, t) for i, t in enumerate(times)]
+    if cancel_every:
+        for i in range(0, len(times), cancel_every):
+            if isinstance(queue, TimerWheel):
+                queue.cancel(handles[i])
+            else:
+                queue.remove(i)  # IndexedPriorityQueue: удаление по элементу
+    while not queue.is_empty():
+        queue.dequeue()
+    return (time.perf_counter() - start) * 1000
+
+
+def compare_timer_wheel():
+    """Сравнение колеса таймеров с очередями на куче"""
+    print("\n\nКолесо таймеров против очереди на куче")
+    print("=" * 60)
+    
+    sizes = [10000, 100000, 300000]
+    horizon = 1_000_000  # моменты срабатывания в диапазоне [0, horizon)
+    
+    print(f"{'Таймеров':<10} {'PQ (мс)':<12} {'Wheel (мс)':<12} {'IndexedPQ+отмена (мс)':<24} {'Wheel+отмена (мс)':<18}")
+    print("-" * 80)
+    
+    for size in sizes:
+        times = [random.randrange(horizon) for _ in range(size)]
+        pq_time = run_timer_workload(PriorityQueue(), times)
+        wheel_time = run_timer_workload(TimerWheel(), times)
+        ipq_cancel = run_timer_workload(IndexedPriorityQueue(), times, cancel_every=4)
+        wheel_cancel = run_timer_workload(TimerWheel(), times, cancel_every=4)
+        print(f"{size:<10} {pq_time:<12.1f} {wheel_time:<12.1f} {ipq_cancel:<24.1f} {wheel_cancel:<18.1f}")
+
+
 def test_priority_queue():
     """Тестирование очереди с приоритетом"""
     print("\n\nТестирование очереди с приоритетом")
@@ -206,5 +474,9 @@ if __name__ == "__main__":
     measure_heap_operations()
     compare_heap_construction()
     compare_sorting_algorithms()
+    compare_heap_variants()
+    compare_queue_merging()
+    measure_queue_contention()
+    compare_timer_wheel()
     test_priority_queue()
     visualize_heap()
\ No newline at end of file
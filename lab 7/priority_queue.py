@@ -3,8 +3,9 @@ from heap import MinHeap
 class PriorityQueue:
     """Очередь с приоритетом на основе min-heap"""
     
-    def __init__(self):
-        self.heap = MinHeap()  # O(1) - создание кучи
+    def __init__(self, heap_class=MinHeap):
+        # heap_class - любая куча с интерфейсом MinHeap (MinHeap, DaryMinHeap, LeftistHeap, ...)
+        self.heap = heap_class()  # O(1) - создание кучи
         
     def enqueue(self, item, priority: int) -> None:
         """Добавление элемента с приоритетом"""
@@ -27,10 +28,147 @@ class PriorityQueue:
         priority, item = self.heap.peek()  # O(1)
         return item  # O(1)
         
+    def merge(self, other: "PriorityQueue") -> None:
+        """Слияние с другой очередью; другая очередь становится пустой"""
+        if type(self.heap) is type(other.heap) and hasattr(self.heap, "merge"):
+            self.heap.merge(other.heap)  # O(log n) для LeftistHeap, O(1) для PairingHeap
+        elif isinstance(self.heap, MinHeap) and isinstance(other.heap, MinHeap):
+            self.heap.build_heap(self.heap.heap + other.heap.heap)  # O(n + m) - перестроение массива
+            other.heap.heap = []  # O(1)
+        else:
+            while not other.heap.is_empty():  # O(m log(n + m))
+                self.heap.insert(other.heap.extract_min())
+        
     def is_empty(self) -> bool:
         """Проверка на пустоту"""
         return self.heap.is_empty()  # O(1)
         
+    def __len__(self) -> int:
+        """Размер очереди"""
+        return len(self.heap)  # O(1)
+
+
+class IndexedPriorityQueue:
+    """Индексированная очередь с приоритетом (decrease-key, удаление по элементу)"""
+    
+    def __init__(self):
+        self.heap = []  # O(1) - массив записей [приоритет, порядковый номер, элемент]
+        self.position = {}  # O(1) - элемент -> индекс записи в массиве
+        self._counter = 0  # O(1) - счетчик для FIFO при равных приоритетах
+        
+    def _less(self, i: int, j: int) -> bool:
+        """Сравнение записей по (приоритет, порядковый номер)"""
+        a, b = self.heap[i], self.heap[j]  # O(1)
+        return a[0] < b[0] or (a[0] == b[0] and a[1] < b[1])  # O(1)
+        
+    def _place(self, index: int, entry: list) -> None:
+        """Запись элемента в позицию с обновлением индекса"""
+        self.heap[index] = entry  # O(1)
+        self.position[entry[2]] = index  # O(1)
+        
+    def _sift_up(self, index: int) -> int:
+        """Всплытие записи, возвращает итоговый индекс"""
+        entry = self.heap[index]  # O(1)
+        key = (entry[0], entry[1])  # O(1)
+        while index > 0:  # O(log n)
+            parent = (index - 1) // 2  # O(1)
+            parent_entry = self.heap[parent]  # O(1)
+            if (parent_entry[0], parent_entry[1]) <= key:  # O(1)
+                break
+            self._place(index, parent_entry)  # O(1) - сдвиг родителя вниз
+            index = parent  # O(1)
+        self._place(index, entry)  # O(1)
+        return index
+        
+    def _sift_down(self, index: int) -> int:
+        """Погружение записи, возвращает итоговый индекс"""
+        n = len(self.heap)  # O(1)
+        entry = self.heap[index]  # O(1)
+        key = (entry[0], entry[1])  # O(1)
+        while True:  # O(log n)
+            child = 2 * index + 1  # O(1)
+            if child >= n:
+                break
+            if child + 1 < n and self._less(child + 1, child):  # O(1)
+                child += 1
+            child_entry = self.heap[child]  # O(1)
+            if key <= (child_entry[0], child_entry[1]):  # O(1)
+                break
+            self._place(index, child_entry)  # O(1) - сдвиг потомка вверх
+            index = child  # O(1)
+        self._place(index, entry)  # O(1)
+        return index
+        
+    def _next_order(self) -> int:
+        """Следующий порядковый номер для FIFO-упорядочивания"""
+        self._counter += 1  # O(1)
+        return self._counter  # O(1)
+        
+    def _remove_at(self, index: int) -> list:
+        """Удаление записи по индексу в массиве"""
+        entry = self.heap[index]  # O(1)
+        del self.position[entry[2]]  # O(1)
+        last = self.heap.pop()  # O(1)
+        if index < len(self.heap):  # O(1) - удалялся не последний элемент
+            self._place(index, last)  # O(1)
+            if self._sift_up(index) == index:  # O(log n)
+                self._sift_down(index)  # O(log n)
+        return entry
+        
+    def enqueue(self, item, priority: int) -> None:
+        """Добавление элемента с приоритетом"""
+        if item in self.position:  # O(1)
+            raise ValueError("Элемент уже находится в очереди")
+        self.heap.append([priority, self._next_order(), item])  # O(1)
+        self._sift_up(len(self.heap) - 1)  # O(log n)
+        
+    def dequeue(self):
+        """Извлечение элемента с наивысшим приоритетом"""
+        if not self.heap:  # O(1)
+            raise IndexError("Очередь пуста")
+        return self._remove_at(0)[2]  # O(log n)
+        
+    def peek(self):
+        """Просмотр элемента с наивысшим приоритетом без удаления"""
+        if not self.heap:  # O(1)
+            raise IndexError("Очередь пуста")
+        return self.heap[0][2]  # O(1)
+        
+    def get_priority(self, item) -> int:
+        """Текущий приоритет элемента"""
+        if item not in self.position:  # O(1)
+            raise KeyError(item)
+        return self.heap[self.position[item]][0]  # O(1)
+        
+    def update_priority(self, item, priority: int) -> None:
+        """Изменение приоритета элемента (decrease-key / increase-key)"""
+        if item not in self.position:  # O(1)
+            raise KeyError(item)
+        index = self.position[item]  # O(1)
+        entry = self.heap[index]  # O(1)
+        # Элемент с новым приоритетом встает в конец среди равных (как при повторной вставке)
+        entry[0] = priority  # O(1)
+        entry[1] = self._next_order()  # O(1)
+        if self._sift_up(index) == index:  # O(log n)
+            self._sift_down(index)  # O(log n)
+            
+    def remove(self, item) -> None:
+        """Удаление произвольного элемента из очереди"""
+        if item not in self.position:  # O(1)
+            raise KeyError(item)
+        self._remove_at(self.position[item])  # O(log n)
+        
+    def contains(self, item) -> bool:
+        """Проверка наличия элемента в очереди"""
+        return item in self.position  # O(1)
+        
+    def __contains__(self, item) -> bool:
+        return self.contains(item)  # O(1)
+        
+    def is_empty(self) -> bool:
+        """Проверка на пустоту"""
+        return len(self.heap) == 0  # O(1)
+        
     def __len__(self) -> int:
         """Размер очереди"""
         return len(self.heap)  # O(1)
\ No newline at end of file
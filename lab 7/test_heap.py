@@ -1,7 +1,9 @@
 import unittest
-from heap import MinHeap
-from heapsort import heapsort, heapsort_inplace
-from priority_queue import PriorityQueue
+from heap import MinHeap, DaryMinHeap, PairingHeap, LeftistHeap
+from heapsort import heapsort, heapsort_inplace, heapsort_bottom_up
+from priority_queue import PriorityQueue, IndexedPriorityQueue
+from concurrent_priority_queue import BlockingPriorityQueue, AsyncPriorityQueue
+from timer_wheel import TimerWheel
 
 
 class TestMinHeap(unittest.TestCase):
@@ -81,6 +83,169 @@ class TestMinHeap(unittest.TestCase):
                 self.assertTrue(heap2.heap[i] <= heap2.heap[right])
 
 
+class TestDaryMinHeap(unittest.TestCase):
+    """Тесты для d-арной кучи"""
+    
+    def test_extract_order(self):
+        """Тест извлечения в порядке возрастания для разных d"""
+        import random
+        for d in (2, 3, 4, 8):
+            with self.subTest(d=d):
+                heap = DaryMinHeap(d)
+                values = [random.randint(1, 1000) for _ in range(200)]
+                for v in values:
+                    heap.insert(v)
+                self.assertEqual([heap.extract_min() for _ in range(len(values))], sorted(values))
+                with self.assertRaises(IndexError):
+                    heap.extract_min()
+    
+    def test_build_heap_property(self):
+        """Тест свойства кучи после build_heap"""
+        import random
+        heap = DaryMinHeap(4)
+        heap.build_heap([random.randint(1, 1000) for _ in range(101)])
+        for i in range(1, len(heap.heap)):
+            self.assertTrue(heap.heap[(i - 1) // 4] <= heap.heap[i])
+    
+    def test_decrease_key(self):
+        """Тест уменьшения ключа по индексу"""
+        heap = DaryMinHeap(4)
+        heap.build_heap([10, 20, 30, 40, 50, 60])
+        index = heap.heap.index(60)
+        heap.decrease_key(index, 5)
+        self.assertEqual(heap.peek(), 5)
+        with self.assertRaises(ValueError):
+            heap.decrease_key(0, 100)
+
+
+class TestPairingHeap(unittest.TestCase):
+    """Тесты для pairing heap"""
+    
+    def test_extract_order(self):
+        """Тест извлечения в порядке возрастания"""
+        import random
+        heap = PairingHeap()
+        values = [random.randint(1, 1000) for _ in range(300)]
+        heap.build_heap(values)
+        self.assertEqual(len(heap), 300)
+        self.assertEqual([heap.extract_min() for _ in range(300)], sorted(values))
+        self.assertTrue(heap.is_empty())
+        with self.assertRaises(IndexError):
+            heap.peek()
+    
+    def test_decrease_key(self):
+        """Тест уменьшения ключа через узел"""
+        import random
+        heap = PairingHeap()
+        nodes = [heap.insert(random.randint(100, 1000)) for _ in range(100)]
+        heap.extract_min()  # формирует многоуровневую структуру
+        
+        live = [node for node in nodes if heap.contains_node(node)]
+        self.assertEqual(len(live), 99)
+        for node in random.sample(live, 30):
+            heap.decrease_key(node, node.value - random.randint(1, 99))
+        
+        expected = sorted(node.value for node in live)
+        self.assertEqual([heap.extract_min() for _ in range(99)], expected)
+    
+    def test_decrease_key_foreign_node(self):
+        """Тест decrease_key для извлеченного узла и узла другой кучи"""
+        heap, other = PairingHeap(), PairingHeap()
+        nodes = [heap.insert(value) for value in [5, 3, 8, 1]]
+        foreign = other.insert(0)
+        extracted = nodes[3]
+        self.assertEqual(heap.extract_min(), 1)
+        with self.assertRaises(ValueError):
+            heap.decrease_key(extracted, -1)
+        with self.assertRaises(ValueError):
+            heap.decrease_key(foreign, -1)
+        self.assertEqual(extracted.value, 1)
+        self.assertEqual(foreign.value, 0)
+        self.assertEqual(len(heap), 3)
+        self.assertEqual([heap.extract_min() for _ in range(3)], [3, 5, 8])
+        self.assertEqual(other.peek(), 0)
+        
+        # Узел другой кучи не в корне
+        other_nodes = [other.insert(value) for value in [10, 20, 30]]
+        with self.assertRaises(ValueError):
+            heap.decrease_key(other_nodes[1], -1)
+        self.assertEqual(other_nodes[1].value, 20)
+        self.assertTrue(other.contains_node(other_nodes[1]))
+        self.assertEqual([other.extract_min() for _ in range(4)], [0, 10, 20, 30])
+    
+    def test_decrease_key_after_merge(self):
+        """Тест принадлежности узлов после слияния и перестроения"""
+        a, b, c = PairingHeap(), PairingHeap(), PairingHeap()
+        a_nodes = [a.insert(value) for value in [10, 20, 30]]
+        b_nodes = [b.insert(value) for value in [15, 25, 35]]
+        c_nodes = [c.insert(value) for value in [40, 50]]
+        b.merge(c)
+        a.merge(b)
+        
+        for node in a_nodes + b_nodes + c_nodes:
+            self.assertTrue(a.contains_node(node))
+            self.assertFalse(b.contains_node(node))
+            self.assertFalse(c.contains_node(node))
+        with self.assertRaises(ValueError):
+            b.decrease_key(b_nodes[2], 1)
+        a.decrease_key(c_nodes[1], 1)
+        a.decrease_key(b_nodes[2], 2)
+        
+        late = b.insert(5)  # слитая куча остается рабочей
+        self.assertFalse(a.contains_node(late))
+        with self.assertRaises(ValueError):
+            a.decrease_key(late, 0)
+        self.assertEqual([a.extract_min() for _ in range(8)], [1, 2, 10, 15, 20, 25, 30, 40])
+        self.assertEqual(b.extract_min(), 5)
+        
+        a.insert(7)
+        old = a.insert(8)
+        a.build_heap([3, 4])
+        self.assertFalse(a.contains_node(old))
+        with self.assertRaises(ValueError):
+            a.decrease_key(old, 0)
+        self.assertEqual([a.extract_min() for _ in range(2)], [3, 4])
+    
+    def test_merge(self):
+        """Тест слияния двух куч"""
+        a, b = PairingHeap(), PairingHeap()
+        a.build_heap([5, 1, 9])
+        b.build_heap([4, 8, 0])
+        a.merge(b)
+        self.assertEqual(len(a), 6)
+        self.assertTrue(b.is_empty())
+        self.assertEqual([a.extract_min() for _ in range(6)], [0, 1, 4, 5, 8, 9])
+
+
+class TestLeftistHeap(unittest.TestCase):
+    """Тесты для левосторонней кучи"""
+    
+    def test_extract_order(self):
+        """Тест извлечения в порядке возрастания"""
+        import random
+        heap = LeftistHeap()
+        values = [random.randint(1, 1000) for _ in range(300)]
+        for v in values:
+            heap.insert(v)
+        self.assertEqual([heap.extract_min() for _ in range(300)], sorted(values))
+        with self.assertRaises(IndexError):
+            heap.extract_min()
+    
+    def test_build_heap_and_merge(self):
+        """Тест построения и слияния куч"""
+        import random
+        a, b = LeftistHeap(), LeftistHeap()
+        values_a = [random.randint(1, 1000) for _ in range(150)]
+        values_b = [random.randint(1, 1000) for _ in range(77)]
+        a.build_heap(values_a)
+        b.build_heap(values_b)
+        a.merge(b)
+        
+        self.assertEqual(len(a), 227)
+        self.assertTrue(b.is_empty())
+        self.assertEqual([a.extract_min() for _ in range(227)], sorted(values_a + values_b))
+
+
 class TestHeapSort(unittest.TestCase):
     """Тесты для HeapSort"""
     
@@ -103,6 +268,45 @@ class TestHeapSort(unittest.TestCase):
             heapsort_inplace(array_copy)
             
             self.assertEqual(array_copy, sorted(array))
+    
+    def test_heapsort_bottom_up(self):
+        """Тест сортировки кучей с погружением Флойда"""
+        import random
+        for size in (0, 1, 2, 17, 100):
+            array = [random.randint(1, 100) for _ in range(size)]
+            with self.subTest(size=size):
+                result = array[:]
+                heapsort_bottom_up(result)
+                self.assertEqual(result, sorted(array))
+                
+                result = array[:]
+                heapsort_bottom_up(result, reverse=True)
+                self.assertEqual(result, sorted(array, reverse=True))
+    
+    def test_heapsort_bottom_up_key(self):
+        """Тест сортировки по ключу"""
+        words = ["banana", "kiwi", "apple", "fig", "cherry"]
+        heapsort_bottom_up(words, key=len)
+        self.assertEqual([len(w) for w in words], [3, 4, 5, 6, 6])
+        
+        pairs = [(3, "c"), (1, "a"), (2, "b")]
+        heapsort_bottom_up(pairs, key=lambda p: p[0], reverse=True)
+        self.assertEqual(pairs, [(3, "c"), (2, "b"), (1, "a")])
+    
+    def test_heapsort_bottom_up_buffers(self):
+        """Тест in-place сортировки array и memoryview"""
+        import array
+        import random
+        values = [random.randint(-1000, 1000) for _ in range(200)]
+        
+        arr = array.array("i", values)
+        heapsort_bottom_up(arr)
+        self.assertEqual(arr.tolist(), sorted(values))
+        
+        buffer = array.array("d", values)
+        view = memoryview(buffer)
+        heapsort_bottom_up(view, key=abs, reverse=True)
+        self.assertEqual([abs(v) for v in buffer], sorted((abs(v) for v in values), reverse=True))
 
 
 class TestPriorityQueue(unittest.TestCase):
@@ -133,6 +337,36 @@ class TestPriorityQueue(unittest.TestCase):
         self.assertEqual(pq.peek(), "Task B")  # Все еще там
         self.assertEqual(pq.dequeue(), "Task B")  # Теперь удаляет
     
+    def test_merge(self):
+        """Тест слияния очередей для разных куч"""
+        for heap_class in (MinHeap, DaryMinHeap, LeftistHeap, PairingHeap):
+            with self.subTest(heap=heap_class.__name__):
+                shards = []
+                for s in range(4):
+                    pq = PriorityQueue(heap_class)
+                    for i in range(5):
+                        pq.enqueue(f"Task {s}-{i}", s + 4 * i)
+                    shards.append(pq)
+                
+                dispatcher = PriorityQueue(heap_class)
+                for pq in shards:
+                    dispatcher.merge(pq)
+                    self.assertTrue(pq.is_empty())
+                
+                self.assertEqual(len(dispatcher), 20)
+                order = [dispatcher.dequeue() for _ in range(20)]
+                self.assertEqual(order, [f"Task {p % 4}-{p // 4}" for p in range(20)])
+    
+    def test_merge_different_heaps(self):
+        """Тест слияния очередей на разных кучах"""
+        a = PriorityQueue(LeftistHeap)
+        b = PriorityQueue(MinHeap)
+        a.enqueue("A", 2)
+        b.enqueue("B", 1)
+        a.merge(b)
+        self.assertTrue(b.is_empty())
+        self.assertEqual([a.dequeue(), a.dequeue()], ["B", "A"])
+    
     def test_empty_queue(self):
         """Тест пустой очереди"""
         pq = PriorityQueue()
@@ -147,5 +381,235 @@ class TestPriorityQueue(unittest.TestCase):
             pq.peek()
 
 
+class TestIndexedPriorityQueue(unittest.TestCase):
+    """Тесты для индексированной очереди с приоритетом"""
+    
+    def test_fifo_for_equal_priorities(self):
+        """Тест FIFO-порядка при равных приоритетах"""
+        pq = IndexedPriorityQueue()
+        for name in ["A", "B", "C", "D"]:
+            pq.enqueue(name, 1)
+        pq.enqueue("Z", 0)
+        
+        self.assertEqual([pq.dequeue() for _ in range(5)], ["Z", "A", "B", "C", "D"])
+    
+    def test_update_priority(self):
+        """Тест изменения приоритета"""
+        pq = IndexedPriorityQueue()
+        pq.enqueue("Task A", 5)
+        pq.enqueue("Task B", 3)
+        pq.enqueue("Task C", 4)
+        
+        pq.update_priority("Task A", 1)  # decrease-key
+        self.assertEqual(pq.peek(), "Task A")
+        self.assertEqual(pq.get_priority("Task A"), 1)
+        
+        pq.update_priority("Task A", 10)  # increase-key
+        self.assertEqual(pq.dequeue(), "Task B")
+        self.assertEqual(pq.dequeue(), "Task C")
+        self.assertEqual(pq.dequeue(), "Task A")
+        
+        with self.assertRaises(KeyError):
+            pq.update_priority("Task A", 1)
+    
+    def test_remove_and_contains(self):
+        """Тест удаления по элементу и проверки наличия"""
+        pq = IndexedPriorityQueue()
+        for i in range(10):
+            pq.enqueue(f"Task {i}", i)
+        
+        self.assertTrue(pq.contains("Task 5"))
+        pq.remove("Task 5")
+        self.assertFalse("Task 5" in pq)
+        self.assertEqual(len(pq), 9)
+        
+        with self.assertRaises(KeyError):
+            pq.remove("Task 5")
+        with self.assertRaises(ValueError):
+            pq.enqueue("Task 1", 0)
+        
+        result = [pq.dequeue() for _ in range(len(pq))]
+        self.assertEqual(result, [f"Task {i}" for i in range(10) if i != 5])
+    
+    def test_random_operations(self):
+        """Сравнение со словарем приоритетов на случайных операциях"""
+        import random
+        pq = IndexedPriorityQueue()
+        expected = {}
+        for step in range(500):
+            item = random.randint(0, 50)
+            priority = random.randint(0, 20)
+            if item in expected:
+                if random.random() < 0.5:
+                    pq.update_priority(item, priority)
+                    expected[item] = priority
+                else:
+                    pq.remove(item)
+                    del expected[item]
+            else:
+                pq.enqueue(item, priority)
+                expected[item] = priority
+        
+        priorities = []
+        while not pq.is_empty():
+            item = pq.dequeue()
+            priorities.append(expected.pop(item))
+        self.assertEqual(priorities, sorted(priorities))
+        self.assertEqual(expected, {})
+
+
+class TestBlockingPriorityQueue(unittest.TestCase):
+    """Тесты для потокобезопасной блокирующей очереди"""
+    
+    def test_order_and_timeouts(self):
+        """Тест порядка извлечения и таймаутов"""
+        import queue
+        pq = BlockingPriorityQueue(maxsize=2)
+        pq.put("B", 2)
+        pq.put("A", 1)
+        self.assertTrue(pq.full())
+        
+        with self.assertRaises(queue.Full):
+            pq.put("C", 3, timeout=0.01)
+        with self.assertRaises(queue.Full):
+            pq.put_nowait("C", 3)
+        
+        self.assertEqual(pq.get(), "A")
+        self.assertEqual(pq.get(), "B")
+        with self.assertRaises(queue.Empty):
+            pq.get(timeout=0.01)
+        with self.assertRaises(queue.Empty):
+            pq.get_nowait()
+    
+    def test_producers_consumers(self):
+        """Тест многопоточной передачи элементов с ограниченной емкостью"""
+        import threading
+        pq = BlockingPriorityQueue(maxsize=5)
+        received = []
+        lock = threading.Lock()
+        
+        def producer(base):
+            for i in range(100):
+                pq.put(base + i, i)
+        
+        def consumer():
+            while True:
+                item = pq.get(timeout=5)
+                if item is None:
+                    break
+                with lock:
+                    received.append(item)
+        
+        consumers = [threading.Thread(target=consumer) for _ in range(3)]
+        producers = [threading.Thread(target=producer, args=(k * 1000,)) for k in range(4)]
+        for t in consumers + producers:
+            t.start()
+        for t in producers:
+            t.join()
+        for _ in consumers:
+            pq.put(None, float("inf"))
+        for t in consumers:
+            t.join()
+        
+        self.assertEqual(sorted(received), sorted(k * 1000 + i for k in range(4) for i in range(100)))
+        self.assertTrue(pq.empty())
+
+
+class TestAsyncPriorityQueue(unittest.TestCase):
+    """Тесты для asyncio-очереди с приоритетом"""
+    
+    def test_get_waits_for_put(self):
+        """Тест ожидания get() до появления элемента и порядка приоритетов"""
+        import asyncio
+        
+        async def scenario():
+            pq = AsyncPriorityQueue()
+            getter = asyncio.create_task(pq.get())
+            await asyncio.sleep(0)
+            self.assertFalse(getter.done())
+            await pq.put("late", 5)
+            self.assertEqual(await getter, "late")
+            
+            for item, priority in [("C", 3), ("A", 1), ("B", 2), ("A2", 1)]:
+                await pq.put(item, priority)
+            return [await pq.get() for _ in range(4)]
+        
+        self.assertEqual(asyncio.run(scenario()), ["A", "A2", "B", "C"])
+    
+    def test_backpressure(self):
+        """Тест ожидания put() при заполненной очереди"""
+        import asyncio
+        
+        async def scenario():
+            pq = AsyncPriorityQueue(maxsize=1)
+            await pq.put("A", 1)
+            putter = asyncio.create_task(pq.put("B", 2))
+            await asyncio.sleep(0)
+            self.assertFalse(putter.done())
+            with self.assertRaises(asyncio.QueueFull):
+                pq.put_nowait("C", 3)
+            
+            first = await pq.get()
+            await putter
+            second = pq.get_nowait()
+            with self.assertRaises(asyncio.QueueEmpty):
+                pq.get_nowait()
+            
+            # Отмененное ожидание не должно терять элементы
+            waiter = asyncio.create_task(pq.get())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0)
+            await pq.put("D", 4)
+            return first, second, await asyncio.wait_for(pq.get(), 1)
+        
+        self.assertEqual(asyncio.run(scenario()), ("A", "B", "D"))
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Тесты для колеса таймеров"""
+    
+    def test_order_matches_priority_queue(self):
+        """Тест совпадения порядка извлечения с очередью на куче"""
+        import random
+        wheel = TimerWheel(bits=4, levels=3)  # маленькие колеса: проверяем каскадирование и overflow
+        pq = PriorityQueue()
+        for i in range(500):
+            t = random.choice([random.randint(0, 20), random.randint(0, 5000), random.randint(0, 10 ** 6)])
+            wheel.enqueue(i, t)
+            pq.enqueue(i, (t, i))
+        
+        self.assertEqual(len(wheel), 500)
+        self.assertEqual([wheel.dequeue() for _ in range(500)], [pq.dequeue() for _ in range(500)])
+        with self.assertRaises(IndexError):
+            wheel.dequeue()
+    
+    def test_cancel(self):
+        """Тест отмены таймеров"""
+        wheel = TimerWheel()
+        timers = [wheel.enqueue(f"t{t}", t) for t in [10, 20, 300, 70000]]
+        
+        self.assertTrue(wheel.cancel(timers[0]))
+        self.assertFalse(wheel.cancel(timers[0]))
+        self.assertTrue(wheel.cancel(timers[2]))
+        self.assertEqual(len(wheel), 2)
+        self.assertEqual(wheel.peek(), "t20")
+        self.assertEqual(wheel.dequeue(), "t20")
+        self.assertFalse(wheel.cancel(timers[1]))  # уже сработал
+        self.assertEqual(wheel.dequeue(), "t70000")
+        self.assertTrue(wheel.is_empty())
+    
+    def test_expire_and_past_times(self):
+        """Тест извлечения просроченных таймеров и планирования в прошлое"""
+        wheel = TimerWheel()
+        for t in [5, 3, 10, 3, 700]:
+            wheel.enqueue(f"t{t}", t)
+        
+        self.assertEqual(wheel.expire(5), ["t3", "t3", "t5"])
+        wheel.enqueue("late", 1)  # момент уже прошел - срабатывает первым
+        self.assertEqual(wheel.expire(9), ["late"])
+        self.assertEqual(wheel.expire(10 ** 6), ["t10", "t700"])
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,179 @@
+from collections import deque
+from heap import MinHeap
+
+
+class Timer:
+    """Запись таймера (дескриптор для отмены)"""
+    __slots__ = ("time", "item", "cancelled")
+    
+    def __init__(self, time: int, item):
+        self.time = time  # O(1) - момент срабатывания
+        self.item = item  # O(1)
+        self.cancelled = False  # O(1) - ленивое удаление при отмене
+
+
+class TimerWheel:
+    """Иерархическое колесо таймеров для целочисленных приоритетов (моментов времени)
+    
+    Уровень k хранит таймеры, у которых старшие разряды (по основанию 2^bits)
+    совпадают с текущим временем выше k-го разряда. Извлечение переносит
+    содержимое ячейки верхнего уровня на нижние (каскадирование), поэтому
+    каждый таймер перекладывается не более levels раз: O(1) амортизированно.
+    """
+    
+    def __init__(self, bits: int = 8, levels: int = 4, start_time: int = 0):
+        self.bits = bits  # O(1) - разрядность одного уровня
+        self.levels = levels  # O(1)
+        self.slots_count = 1 << bits  # O(1) - число ячеек на уровне
+        self.mask = self.slots_count - 1  # O(1)
+        self.current = start_time  # O(1) - все ожидающие таймеры не раньше current
+        self.wheels = [[deque() for _ in range(self.slots_count)] for _ in range(levels)]  # O(levels * 2^bits)
+        self.occupied = [0] * levels  # O(levels) - битовые маски непустых ячеек
+        self.overflow = MinHeap()  # O(1) - таймеры за пределами диапазона колес
+        self.early = MinHeap()  # O(1) - таймеры раньше курсора (после peek/expire или в прошлом)
+        self._counter = 0  # O(1) - FIFO для одинаковых моментов в кучах
+        self.size = 0  # O(1) - число активных (не отмененных) таймеров
+    
+    def _place(self, timer: Timer) -> None:
+        """Размещение таймера в ячейке нужного уровня"""
+        time = timer.time
+        if time < self.current:
+            # Курсор уже ушел вперед: такие таймеры идут раньше всех таймеров в колесах
+            self._counter += 1
+            self.early.insert((time, self._counter, timer))  # O(log m) - редкий случай
+            return
+        bits = self.bits
+        for level in range(self.levels):  # O(levels)
+            shift = bits * (level + 1)
+            if time >> shift == self.current >> shift:  # O(1) - старшие разряды совпадают
+                slot = (time >> (bits * level)) & self.mask  # O(1)
+                self.wheels[level][slot].append(timer)  # O(1)
+                self.occupied[level] |= 1 << slot  # O(1)
+                return
+        self._counter += 1
+        self.overflow.insert((time, self._counter, timer))  # O(log m) - редкий случай
+    
+    def enqueue(self, item, priority: int) -> Timer:
+        """Планирование элемента на момент priority, возвращает дескриптор для cancel()"""
+        timer = Timer(priority, item)  # O(1)
+        self._place(timer)  # O(1)
+        self.size += 1  # O(1)
+        return timer
+    
+    def cancel(self, timer: Timer) -> bool:
+        """Отмена таймера за O(1) (запись удаляется лениво)"""
+        if timer.cancelled:
+            return False
+        timer.cancelled = True  # O(1)
+        self.size -= 1  # O(1)
+        return True
+    
+    def _next_slot(self, level: int, start: int) -> int:
+        """Первая непустая ячейка уровня с номером >= start или -1"""
+        mask = self.occupied[level] >> start  # O(1)
+        if not mask:
+            return -1
+        return start + (mask & -mask).bit_length() - 1  # O(1) - младший установленный бит
+    
+    def _advance(self) -> bool:
+        """Сдвиг курсора к ближайшему таймеру в колесах; False, если там таймеров нет"""
+        bits = self.bits
+        while True:
+            # Уровень 0: ячейка содержит таймеры ровно одного момента времени
+            slot = self._next_slot(0, self.current & self.mask)
+            if slot >= 0:
+                bucket = self.wheels[0][slot]
+                while bucket and bucket[0].cancelled:  # O(1) амортизированно - удаление отмененных
+                    bucket.popleft()
+                if bucket:
+                    self.current = (self.current & ~self.mask) | slot
+                    return True
+                self.occupied[0] &= ~(1 << slot)
+                continue
+            # Верхние уровни: ближайшая непустая ячейка переносится вниз (каскадирование)
+            for level in range(1, self.levels):
+                shift = bits * level
+                slot = self._next_slot(level, ((self.current >> shift) & self.mask) + 1)
+                if slot >= 0:
+                    high = self.current >> (shift + bits) << (shift + bits)
+                    self.current = high | (slot << shift)  # O(1) - начало диапазона ячейки
+                    bucket = self.wheels[level][slot]
+                    self.wheels[level][slot] = deque()
+                    self.occupied[level] &= ~(1 << slot)
+                    for timer in bucket:  # каждый таймер опускается не более levels раз
+                        if not timer.cancelled:
+                            self._place(timer)
+                    break
+            else:
+                # Колеса пусты: переходим к ближайшему таймеру из overflow
+                if not self._refill_from_overflow():
+                    return False
+    
+    @staticmethod
+    def _purge(heap: MinHeap) -> None:
+        """Удаление отмененных таймеров с вершины кучи"""
+        while not heap.is_empty() and heap.peek()[2].cancelled:
+            heap.extract_min()  # O(log m)
+    
+    def _refill_from_overflow(self) -> bool:
+        """Перенос ближайших таймеров из overflow в колеса; False, если overflow пуст"""
+        self._purge(self.overflow)
+        if self.overflow.is_empty():
+            return False
+        self.current = self.overflow.peek()[0]  # O(1)
+        top_shift = self.bits * self.levels
+        while not self.overflow.is_empty() and self.overflow.peek()[0] >> top_shift == self.current >> top_shift:
+            time, order, timer = self.overflow.extract_min()  # O(log m)
+            if not timer.cancelled:
+                self._place(timer)
+        return True
+    
+    def _next_timer(self) -> Timer:
+        """Ближайший активный таймер (без удаления) или None"""
+        self._purge(self.early)
+        if not self.early.is_empty():
+            return self.early.peek()[2]  # O(1)
+        if self._advance():  # O(1) амортизированно
+            return self.wheels[0][self.current & self.mask][0]
+        return None
+    
+    def dequeue(self):
+        """Извлечение элемента с наименьшим моментом времени (FIFO при равных)"""
+        timer = self._next_timer()
+        if timer is None:
+            raise IndexError("Очередь пуста")
+        if not self.early.is_empty():
+            self.early.extract_min()  # O(log m)
+        else:
+            slot = self.current & self.mask  # O(1)
+            bucket = self.wheels[0][slot]
+            bucket.popleft()  # O(1)
+            if not bucket:
+                self.occupied[0] &= ~(1 << slot)  # O(1)
+        timer.cancelled = True  # O(1) - повторная отмена сработавшего таймера вернет False
+        self.size -= 1  # O(1)
+        return timer.item
+    
+    def peek(self):
+        """Просмотр ближайшего элемента без удаления"""
+        timer = self._next_timer()
+        if timer is None:
+            raise IndexError("Очередь пуста")
+        return timer.item  # O(1)
+    
+    def expire(self, now: int) -> list:
+        """Извлечение всех элементов с моментом времени <= now"""
+        expired = []  # O(1)
+        timer = self._next_timer()
+        while timer is not None and timer.time <= now:  # O(k) амортизированно для k таймеров
+            expired.append(self.dequeue())
+            timer = self._next_timer()
+        return expired
+    
+    def is_empty(self) -> bool:
+        """Проверка на пустоту"""
+        return self.size == 0  # O(1)
+    
+    def __len__(self) -> int:
+        """Число активных таймеров"""
+        return self.size  # O(1)
\ No newline at end of file